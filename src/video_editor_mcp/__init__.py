@@ -1,8 +1,7 @@
 import asyncio
+import importlib
 import sys
 
-from . import server
-
 
 def main():
     """Main entry point for the package."""
@@ -23,6 +22,82 @@ Options:
 Environment Variables:
   VJ_API_KEY        Video Jungle API key (alternative to command line argument)
   LOAD_PHOTOS_DB    Set to 1 to enable Photos database integration
+  VJ_API_URL        Video Jungle API base URL (default: https://api.video-jungle.com)
+  VJ_MODEL_PRELOAD  Set to 0 to load the embedding model on first search
+                    instead of shortly after startup
+  VJ_EMBEDDING_BACKEND
+                    'torch' (default) or 'onnx' to run the text encoder as an
+                    int8-quantized ONNX Runtime model (needs the onnx extra)
+  VJ_EMBEDDING_LOAD_MODE
+                    'text' (default) keeps only the text tower in memory and
+                    loads vision weights on first image embedding; 'full'
+                    loads both up front
+  VJ_EMBEDDING_READY_TIMEOUT
+                    Seconds a search waits for the embedding model to be
+                    ready before returning keyword-only results (default: 5)
+  VJ_EMBEDDING_WIRE_FORMAT
+                    'json' (default), or 'float32' / 'float16' / 'int8' to
+                    send query embeddings as compact base64 arrays
+  VJ_EMBEDDING_TRUNCATE_DIM
+                    Truncate query embeddings to this many dimensions
+  VJ_EMBEDDING_SEARCH_DEADLINE
+                    Seconds the semantic leg of a search may take once the
+                    model is ready before it is dropped (default: 10)
+  VJ_KEYWORD_SEARCH_DEADLINE
+                    Seconds the keyword leg of a search may take before it
+                    is dropped (default: 15)
+  VJ_SEGMENT_SYNC_URL
+                    Endpoint to sync segment embeddings from into a local
+                    index, which then serves semantic search results
+  VJ_SEGMENT_SYNC_INTERVAL
+                    Seconds between local segment index syncs (default: 300)
+  VJ_FUSION_METHOD  'rrf' (default, reciprocal rank fusion) or 'weighted' to
+                    rank keyword and semantic search results together
+  VJ_FUSION_RRF_K   Rank constant for reciprocal rank fusion (default: 60)
+  VJ_FUSION_KEYWORD_WEIGHT / VJ_FUSION_EMBEDDING_WEIGHT
+                    Per-leg weights in the fused ranking (default: 1)
+  VJ_SIMILAR_SEGMENT_MAX_OFFSET
+                    Seconds a find-similar-segments timestamp may be from an
+                    indexed segment to reuse its stored vector (default: 5)
+  VJ_HTTP_POOL_SIZE Connections kept alive per host for Video Jungle API
+                    calls and downloads (default: 16)
+  VJ_HTTP_KEEPALIVE Seconds idle HTTP/2 connections are kept open (default: 60)
+  VJ_HTTP2          Set to 1 to use HTTP/2 for https calls (needs the http2
+                    extra)
+  VJ_BLOCKING_WORKERS
+                    Threads running blocking SDK, HTTP and subprocess calls
+                    for tool handlers (default: 16)
+  VJ_TOOL_CONCURRENCY
+                    Calls of one tool allowed in flight at once (default: 4)
+  VJ_TOOL_DEADLINE  Seconds all outbound calls of one tool call may take,
+                    for tools without their own budget (default: 120)
+  VJ_REQUEST_TIMEOUT
+                    Cap on a single HTTP attempt in seconds (default: 60)
+  VJ_RETRY_ATTEMPTS / VJ_RETRY_BASE_DELAY
+                    Attempts for idempotent requests (default: 3) and the
+                    base of their jittered backoff in seconds (default: 0.25)
+  VJ_BREAKER_THRESHOLD / VJ_BREAKER_RESET
+                    Consecutive failures before calls to a host fail fast
+                    (default: 5), and for how many seconds (default: 30)
+  VJ_QUERY_CACHE_TTL
+                    Seconds complete search results are reused for repeated
+                    searches (default: 120)
+  VJ_QUERY_CACHE_SIZE
+                    Maximum number of cached search results (default: 256)
+  VJ_PAGINATION_CACHE_MB
+                    Memory budget of each pagination cache (search results,
+                    project assets) in MB (default: 64)
+  VJ_RESPONSE_MODE  Default response_mode for search and asset listings:
+                    'full' (default) or 'compact' one-line rows
+  VJ_MAX_RESPONSE_BYTES
+                    Default byte budget for those listings; results past it
+                    are omitted with a note (default: unbounded)
+  VJ_PROJECT_LIST_TTL
+                    Seconds before the cached project list is revalidated
+                    in the background (default: 60)
+  VJ_PROJECT_CACHE_TTL
+                    Seconds a fetched project or edit is reused; concurrent
+                    fetches of the same one share a request (default: 5)
 
 Examples:
   # Run with API key as argument
@@ -38,8 +113,21 @@ Examples:
 For more information, visit: https://github.com/burningion/video-editing-mcp""")
         sys.exit(0)
 
+    from . import server
+
     asyncio.run(server.main())
 
 
+def __getattr__(name: str):
+    # The server is imported on first use: importing it needs an API key,
+    # which tools using other parts of the package (e.g. the keyframes CLI)
+    # don't have
+    if name == "server":
+        # import_module rather than "from . import", which would look the
+        # attribute up on this module again
+        return importlib.import_module(f"{__name__}.server")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Optionally expose other important items at package level
 __all__ = ["main", "server"]
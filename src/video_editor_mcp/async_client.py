@@ -0,0 +1,237 @@
+import asyncio
+import logging
+from typing import Any, List, Optional
+
+import httpx
+from videojungle import ApiClient
+from videojungle.model import Asset, Project, VideoFile, VideoSearch
+
+from .http_client import HTTP2, HTTP_KEEPALIVE, HTTP_POOL_SIZE
+from .resilience import resilience
+
+
+class AsyncVideoJungleClient:
+    """
+    asyncio-native counterpart of videojungle.ApiClient for the endpoints this
+    server uses, on one pooled httpx.AsyncClient.
+
+    Methods mirror the SDK's names, arguments and return types, so a handler
+    can switch from `await blocking.run(key, vj.projects.get, id)` to
+    `await avj.projects.get(id)` without other changes, and many requests can
+    be in flight at once without a thread each.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        base_url: str = ApiClient.BASE_URL,
+        max_connections: int = HTTP_POOL_SIZE,
+        keepalive: float = HTTP_KEEPALIVE,
+        http2: bool = HTTP2,
+        timeout: float = 60.0,
+        sync_client: Optional[ApiClient] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.token = token
+        self.base_url = base_url.rstrip("/")
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive,
+        )
+        self.http2 = http2
+        self.timeout = httpx.Timeout(timeout, connect=10.0)
+        # Attached to returned Projects, whose helper methods are synchronous
+        self.sync_client = sync_client
+        # Replaces the network, e.g. with an httpx.MockTransport in tests
+        self.transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.projects = AsyncProjectsAPI(self)
+        self.video_files = AsyncVideoFileAPI(self)
+        self.assets = AsyncAssetsAPI(self)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is None or loop is not self._loop:
+            # Connections belong to the loop that opened them
+            if self._client is not None:
+                self._discard(self._client, self._loop)
+            self._loop = loop
+            try:
+                self._client = httpx.AsyncClient(
+                    http2=self.http2,
+                    limits=self.limits,
+                    timeout=self.timeout,
+                    transport=self.transport,
+                )
+            except ImportError:
+                logging.warning("HTTP/2 needs the h2 package, using HTTP/1.1")
+                self._client = httpx.AsyncClient(
+                    limits=self.limits, timeout=self.timeout, transport=self.transport
+                )
+        return self._client
+
+    @staticmethod
+    def _discard(client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop):
+        """Close a client left behind by another event loop"""
+        if loop.is_closed():
+            # Its connections can't be closed gracefully any more; they are
+            # released along with the client
+            logging.debug("Dropping an HTTP client whose event loop has closed")
+            return
+        # Closed on the loop its connections belong to, once that loop runs
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
+    async def _make_request(self, method: str, endpoint: str, **kwargs) -> Any:
+        headers = {"X-API-Key": self.token, **kwargs.pop("headers", {})}
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        response = await resilience.acall(
+            method,
+            url,
+            lambda timeout: self.client.request(
+                method, url, headers=headers, timeout=timeout, **kwargs
+            ),
+        )
+        if response.status_code == 422:
+            logging.error(f"422 Unprocessable Entity from {endpoint}: {response.text}")
+        response.raise_for_status()
+        return response.json()
+
+    async def aclose(self):
+        if self._client is None:
+            return
+        if self._loop is asyncio.get_running_loop():
+            await self._client.aclose()
+        else:
+            self._discard(self._client, self._loop)
+        self._client = None
+
+    async def __aenter__(self) -> "AsyncVideoJungleClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+
+class AsyncProjectsAPI:
+    def __init__(self, client: AsyncVideoJungleClient):
+        self.client = client
+
+    def _project(self, obj: dict) -> Project:
+        project = Project(**obj)
+        project._client = self.client.sync_client
+        return project
+
+    async def get(self, project_id: str) -> Project:
+        return self._project(
+            await self.client._make_request("GET", f"/projects/{project_id}")
+        )
+
+    async def list(self) -> List[Project]:
+        obj = await self.client._make_request("GET", "/projects")
+        return [self._project(project) for project in obj]
+
+    async def create(
+        self,
+        name: str,
+        description: str,
+        prompt_id=None,
+        generation_method: str = "prompt-to-video",
+    ) -> Project:
+        project_params = {
+            "name": name,
+            "description": description,
+            "data": generation_method,
+            "template_key": generation_method,
+        }
+        if prompt_id:
+            project_params["prompt_id"] = prompt_id
+        project_data = await self.client._make_request(
+            "POST", "/projects", json=project_params
+        )
+        return await self.get(project_data["id"])
+
+    async def get_edit(self, project_id: str, edit_id: str) -> dict:
+        return await self.client._make_request(
+            "GET", f"/projects/{project_id}/edits/{edit_id}"
+        )
+
+    async def render_edit(self, project_id: str, create_edit: dict) -> dict:
+        return await self.client._make_request(
+            "POST", f"/projects/{project_id}/create-edit", json=create_edit
+        )
+
+    async def update_edit(self, project_id: str, edit_id: str, edit: dict) -> dict:
+        return await self.client._make_request(
+            "PUT", f"/projects/{project_id}/edits/{edit_id}", json=edit
+        )
+
+
+class AsyncVideoFileAPI:
+    def __init__(self, client: AsyncVideoJungleClient):
+        self.client = client
+
+    async def get(self, video_file_id: str) -> VideoFile:
+        obj = await self.client._make_request("GET", f"/video-file/{video_file_id}")
+        return VideoFile(**obj)
+
+    async def create(
+        self, name: str, filename: str, upload_method: str = "url"
+    ) -> dict:
+        """Create a video file from a URL; file uploads stay on the sync client"""
+        if upload_method != "url":
+            raise ValueError(
+                f"upload_method '{upload_method}' is not supported by the async client"
+            )
+        return await self.client._make_request(
+            "POST",
+            "/video-file",
+            json={"name": name, "filename": filename, "upload_method": upload_method},
+        )
+
+    async def search(self, **search_params) -> list:
+        """Same arguments as videojungle's VideoFileAPI.search"""
+        vs = VideoSearch.create(**search_params)
+        return await self.client._make_request(
+            "POST", "/video-file/search", json=vs.model_dump(mode="json")
+        )
+
+    async def download(
+        self, video_id: str, filename: str, chunk_size: int = 1024 * 1024
+    ) -> bool:
+        url = (await self.get(video_id)).download_url
+        if not url:
+            raise Exception("Video file has no download URL")
+        http = self.client.client
+        opened: List[httpx.Response] = []
+
+        async def send(timeout: float) -> httpx.Response:
+            # A retried attempt's unread stream would otherwise hold a connection
+            for response in opened:
+                await response.aclose()
+            request = http.build_request("GET", url, timeout=timeout)
+            opened[:] = [await http.send(request, stream=True)]
+            return opened[0]
+
+        # The timeout applies per read, so it doesn't bound the whole transfer
+        response = await resilience.acall("GET", url, send)
+        try:
+            response.raise_for_status()
+            with open(filename, "wb") as f:
+                async for chunk in response.aiter_bytes(chunk_size):
+                    f.write(chunk)
+        finally:
+            await response.aclose()
+        return True
+
+
+class AsyncAssetsAPI:
+    def __init__(self, client: AsyncVideoJungleClient):
+        self.client = client
+
+    async def get(self, asset_id: str) -> Asset:
+        obj = await self.client._make_request("GET", f"/assets/{asset_id}")
+        return Asset(**obj)
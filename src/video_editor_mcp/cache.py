@@ -0,0 +1,185 @@
+import heapq
+import itertools
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterator, Optional
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Approximate memory held by a value: numpy buffers, containers and plain
+    objects are walked recursively, shared objects are counted once
+    """
+    seen = set()
+    total = 0
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        # Includes an array's data buffer when it owns it
+        total += sys.getsizeof(item)
+        if isinstance(item, (str, bytes, int, float, bool, type(None))):
+            continue
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif hasattr(item, "__dict__"):
+            stack.append(vars(item))
+    return total
+
+
+class TTLCache:
+    """
+    Thread-safe cache bounded by a byte budget and an entry count, with
+    per-entry TTL.
+
+    Entries are kept in LRU order and evicted from the cold end when either
+    bound is exceeded. Expiry times sit in a min-heap, so dropping expired
+    entries is O(log n) each instead of a scan of the whole cache; reads
+    extend an entry's TTL unless `touch_on_read` is off.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_bytes: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        touch_on_read: bool = True,
+        sizeof: Callable[[Any], int] = estimate_size,
+    ):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.touch_on_read = touch_on_read
+        self._sizeof = sizeof
+        # key -> (value, size, expires_at)
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._expiry_heap: list = []
+        self._counter = itertools.count()
+        self._bytes = 0
+        self._lock = threading.RLock()
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _push_expiry(self, key: Hashable, expires_at: float):
+        # The counter keeps the heap from ever comparing keys
+        heapq.heappush(self._expiry_heap, (expires_at, next(self._counter), key))
+
+    def _remove(self, key: Hashable):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def expire(self):
+        """Drop entries whose TTL has passed"""
+        now = time.monotonic()
+        with self._lock:
+            while self._expiry_heap and self._expiry_heap[0][0] <= now:
+                expires_at, _, key = heapq.heappop(self._expiry_heap)
+                entry = self._entries.get(key)
+                # Heap items left behind by a touch or overwrite are stale
+                if entry is not None and entry[2] == expires_at:
+                    self._remove(key)
+                    self.expirations += 1
+            # Stale heap items would otherwise pile up under frequent touches
+            if len(self._expiry_heap) > 2 * len(self._entries) + 64:
+                self._expiry_heap = [
+                    (entry[2], next(self._counter), key)
+                    for key, entry in self._entries.items()
+                ]
+                heapq.heapify(self._expiry_heap)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            self.expire()
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._entries.move_to_end(key)
+            if self.touch_on_read:
+                expires_at = time.monotonic() + self.ttl
+                self._entries[key] = (entry[0], entry[1], expires_at)
+                self._push_expiry(key, expires_at)
+            return entry[0]
+
+    def set(self, key: Hashable, value: Any):
+        size = self._sizeof(value)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                # Would evict everything else and still not fit
+                self.evictions += 1
+                return
+            expires_at = time.monotonic() + self.ttl
+            self._entries[key] = (value, size, expires_at)
+            self._bytes += size
+            self._push_expiry(key, expires_at)
+            self.expire()
+            while (self.max_bytes is not None and self._bytes > self.max_bytes) or (
+                self.max_entries is not None and len(self._entries) > self.max_entries
+            ):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._entries:
+                return default
+            value = self._entries[key][0]
+            self._remove(key)
+            return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._expiry_heap.clear()
+            self._bytes = 0
+
+    def items(self) -> Iterator[tuple]:
+        """Snapshot of (key, value) pairs, without touching them"""
+        with self._lock:
+            self.expire()
+            return iter([(key, entry[0]) for key, entry in self._entries.items()])
+
+    def __getitem__(self, key: Hashable) -> Any:
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any):
+        self.set(key, value)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            self.expire()
+            return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
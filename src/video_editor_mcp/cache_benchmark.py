@@ -0,0 +1,185 @@
+"""
+Memory per pagination cache entry and first-page latency for search results
+and asset listings.
+
+Parses synthetic API responses (keyword videos with analysis dumps, embedding
+matches with their vectors, assets with large create_parameters) and compares
+holding them raw against the compact forms the server caches: FusedResults
+for searches and compact_asset for listings. Runs fully offline:
+
+    VJ_API_KEY=offline python -m video_editor_mcp.cache_benchmark --entries 20
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from typing import Callable, List
+
+import numpy as np
+
+from . import server as mcp_server
+from .ranking import FusedResults, fuse_results
+from .search_benchmark import synthetic_fixtures
+
+
+def search_responses(n: int, limit: int, analysis_scenes: int) -> List[str]:
+    """JSON keyword + embedding responses, shaped like the API's"""
+    responses = []
+    for fixture in synthetic_fixtures(n, limit=limit):
+        for video in fixture["keyword_results"]:
+            video["analysis"] = {
+                "scenes": [
+                    {"timestamp": t, "description": f"Scene {t} of {video['video_id']}"}
+                    for t in range(analysis_scenes)
+                ]
+            }
+        for match in fixture["embedding_results"]:
+            match["embedding"] = [0.01] * 768
+        responses.append(
+            json.dumps([fixture["keyword_results"], fixture["embedding_results"]])
+        )
+    return responses
+
+
+def asset_responses(n: int, per_listing: int, analysis_scenes: int) -> List[str]:
+    listings = []
+    for i in range(n):
+        listings.append(
+            json.dumps(
+                [
+                    {
+                        "id": f"asset-{i}-{a}",
+                        "type": "video",
+                        "name": f"Asset {a}",
+                        "url": f"https://example.invalid/{i}/{a}",
+                        "created_at": "2024-01-01T00:00:00",
+                        "status": "ready",
+                        "create_parameters": {
+                            "analysis": {
+                                "scenes": [
+                                    {"timestamp": t, "description": f"Scene {t}"}
+                                    for t in range(analysis_scenes)
+                                ]
+                            }
+                        },
+                    }
+                    for a in range(per_listing)
+                ]
+            )
+        )
+    return listings
+
+
+def _retained_bytes(build: Callable[[str], object], responses: List[str]) -> float:
+    """Mean bytes still allocated per entry once each response is cached"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    cache = [build(response) for response in responses]
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del cache
+    return retained / len(responses)
+
+
+def _first_page_ms(
+    build: Callable[[str], object],
+    first_page: Callable[[object], str],
+    responses: List[str],
+) -> float:
+    samples = []
+    for response in responses:
+        started = time.perf_counter()
+        first_page(build(response))
+        samples.append(time.perf_counter() - started)
+    return float(1000 * np.median(samples))
+
+
+def _fuse(response: str, limit: int) -> list:
+    videos, matches = json.loads(response)
+    return fuse_results(videos, matches, top_k=limit)
+
+
+def run_benchmark(
+    entries: int = 20,
+    limit: int = 50,
+    per_page: int = 10,
+    analysis_scenes: int = 200,
+) -> dict:
+    searches = search_responses(entries, limit, analysis_scenes)
+    listings = asset_responses(entries, limit, analysis_scenes)
+
+    def search_page(results) -> str:
+        page = (
+            results.page(0, per_page)
+            if isinstance(results, FusedResults)
+            else results[:per_page]
+        )
+        return "\n".join(mcp_server.format_fused_result(r) for r in page)
+
+    def asset_page(assets) -> str:
+        return "\n".join(mcp_server.format_asset_info(a) for a in assets[:per_page])
+
+    cases = {
+        "search raw": (lambda r: _fuse(r, limit), search_page, searches),
+        "search FusedResults": (
+            lambda r: FusedResults(_fuse(r, limit)),
+            search_page,
+            searches,
+        ),
+        "assets raw": (json.loads, asset_page, listings),
+        "assets compact": (
+            lambda r: [mcp_server.compact_asset(a) for a in json.loads(r)],
+            asset_page,
+            listings,
+        ),
+    }
+    return {
+        "entries": entries,
+        "limit": limit,
+        "per_page": per_page,
+        "cases": {
+            name: {
+                "kb_per_entry": _retained_bytes(build, responses) / 1024,
+                "first_page_ms": _first_page_ms(build, page, responses),
+            }
+            for name, (build, page, responses) in cases.items()
+        },
+    }
+
+
+def print_report(report: dict):
+    print(
+        f"{report['entries']} entries of {report['limit']} results, "
+        f"first page of {report['per_page']}"
+    )
+    print(f"{'cache form':<24}{'KB/entry':>12}{'first page ms':>16}")
+    for name, stats in report["cases"].items():
+        print(
+            f"{name:<24}{stats['kb_per_entry']:>12.1f}{stats['first_page_ms']:>16.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--entries", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--per-page", type=int, default=10)
+    parser.add_argument(
+        "--analysis-scenes",
+        type=int,
+        default=200,
+        help="Scenes in each synthetic analysis dump",
+    )
+    args = parser.parse_args()
+    print_report(
+        run_benchmark(
+            entries=args.entries,
+            limit=args.limit,
+            per_page=args.per_page,
+            analysis_scenes=args.analysis_scenes,
+        )
+    )
@@ -0,0 +1,127 @@
+import asyncio
+import logging
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+# (kind, truncate_dim, task) - only requests with the same key share a batch
+BatchKey = Tuple[str, Optional[int], Optional[str]]
+
+
+class EmbeddingBatcher:
+    """
+    Micro-batches concurrent embedding requests into single forward passes.
+
+    Requests are held for up to `window_ms` (or until `max_batch_size` are
+    queued), then encoded together on a single worker thread so concurrent
+    searches don't contend for torch's intra-op threads.
+    """
+
+    def __init__(
+        self,
+        encode: Callable[[str, List[str], Optional[int], Optional[str]], Any],
+        window_ms: float = 5.0,
+        max_batch_size: int = 16,
+    ):
+        self._encode = encode
+        self.window = window_ms / 1000.0
+        self.max_batch_size = max_batch_size
+        self._pending: Dict[BatchKey, list] = {}
+        self._timers: Dict[BatchKey, asyncio.TimerHandle] = {}
+        # The loop only keeps weak references to tasks, so hold running batches
+        self._running: Set[asyncio.Task] = set()
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="embedding-batcher"
+        )
+
+        # Metrics
+        self.batch_sizes: Counter = Counter()
+        self.items = 0
+        self.total_queue_wait = 0.0
+        self.max_queue_wait = 0.0
+
+    async def submit(
+        self,
+        kind: str,
+        item: str,
+        truncate_dim: Optional[int] = None,
+        task: Optional[str] = None,
+    ):
+        """Queue a single text / image for embedding and wait for its vector"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        key = (kind, truncate_dim, task)
+
+        bucket = self._pending.setdefault(key, [])
+        bucket.append((item, future, time.perf_counter()))
+        if len(bucket) >= self.max_batch_size:
+            self._flush(key)
+        elif len(bucket) == 1:
+            self._timers[key] = loop.call_later(self.window, self._flush, key)
+
+        return await future
+
+    async def submit_many(
+        self,
+        kind: str,
+        items: List[str],
+        truncate_dim: Optional[int] = None,
+        task: Optional[str] = None,
+    ) -> list:
+        return await asyncio.gather(
+            *(self.submit(kind, item, truncate_dim, task) for item in items)
+        )
+
+    def _flush(self, key: BatchKey):
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        bucket = self._pending.pop(key, None)
+        if bucket:
+            task = asyncio.ensure_future(self._run(key, bucket))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run(self, key: BatchKey, bucket: list):
+        kind, truncate_dim, task = key
+        items = [item for item, _, _ in bucket]
+
+        started = time.perf_counter()
+        for _, _, enqueued in bucket:
+            wait = started - enqueued
+            self.total_queue_wait += wait
+            self.max_queue_wait = max(self.max_queue_wait, wait)
+        self.batch_sizes[len(bucket)] += 1
+        self.items += len(bucket)
+
+        loop = asyncio.get_running_loop()
+        try:
+            vectors = await loop.run_in_executor(
+                self._executor, self._encode, kind, items, truncate_dim, task
+            )
+        except Exception as e:
+            for _, future, _ in bucket:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        logging.info(
+            f"Embedded batch of {len(bucket)} {kind} inputs in {time.perf_counter() - started:.3f}s"
+        )
+        for (_, future, _), vector in zip(bucket, vectors):
+            if not future.done():
+                future.set_result(vector)
+
+    def stats(self) -> dict:
+        batches = sum(self.batch_sizes.values())
+        return {
+            "batches": batches,
+            "items": self.items,
+            "mean_batch_size": self.items / batches if batches else 0.0,
+            "batch_size_histogram": dict(sorted(self.batch_sizes.items())),
+            "mean_queue_wait_ms": 1000 * self.total_queue_wait / self.items
+            if self.items
+            else 0.0,
+            "max_queue_wait_ms": 1000 * self.max_queue_wait,
+        }
@@ -0,0 +1,177 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional
+from urllib.parse import urlsplit
+
+import requests
+
+from .lazy_imports import LazyModule
+
+np = LazyModule("numpy")
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "video-editor-mcp", "embeddings"
+)
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace so trivially different queries share a cache entry"""
+    return " ".join(text.split())
+
+
+def _remote_validator(url: str) -> Optional[str]:
+    """ETag or Last-Modified of a remote image, None if the server sends neither"""
+    from .http_client import get_session
+
+    try:
+        response = get_session().head(url, allow_redirects=True, timeout=10)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        logging.debug(f"Could not revalidate {url}, not caching it: {e}")
+        return None
+    etag = response.headers.get("ETag")
+    if etag:
+        return f"etag:{etag}"
+    last_modified = response.headers.get("Last-Modified")
+    if last_modified:
+        return f"last-modified:{last_modified}"
+    return None
+
+
+def image_fingerprint(image: str) -> Optional[str]:
+    """
+    Hash local image files by content. Remote images are identified by their
+    URL plus the server's ETag / Last-Modified (one HEAD request per lookup),
+    so new content at the same URL isn't served a stale vector; None means
+    the image can't be told apart from a changed one and must not be cached.
+    """
+    if os.path.isfile(image):
+        digest = hashlib.sha256()
+        with open(image, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        return f"sha256:{digest.hexdigest()}"
+    if urlsplit(image).scheme in ("http", "https"):
+        validator = _remote_validator(image)
+        return None if validator is None else f"{image}#{validator}"
+    # data: URIs carry their content, anything else is taken as given
+    return image
+
+
+class EmbeddingCache:
+    """
+    Content-addressed embedding cache with two tiers:
+
+    - an in-memory LRU of the most recently used vectors
+    - a directory of .npy files, memory-mapped on read, that survives restarts
+
+    Keys cover the model name, input kind, truncate_dim, task and the
+    normalized input, so a cached vector is only reused for an identical request.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+        max_memory_items: int = 2048,
+    ):
+        self.cache_dir = cache_dir
+        self.max_memory_items = max_memory_items
+        self._memory: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if self.cache_dir:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+            except OSError as e:
+                logging.warning(
+                    f"Embedding cache dir {self.cache_dir} unavailable, using memory only: {e}"
+                )
+                self.cache_dir = None
+
+    @staticmethod
+    def make_key(
+        model_name: str,
+        kind: str,
+        item: str,
+        truncate_dim: Optional[int] = None,
+        task: Optional[str] = None,
+    ) -> Optional[str]:
+        """Cache key for an input, None if it must not be cached"""
+        if kind == "text":
+            normalized = normalize_text(item)
+        else:
+            normalized = image_fingerprint(item)
+            if normalized is None:
+                return None
+        payload = json.dumps([model_name, kind, truncate_dim, task, normalized])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.npy")
+
+    def _remember(self, key: str, vector: "np.ndarray"):
+        with self._lock:
+            self._memory[key] = vector
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_items:
+                self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional["np.ndarray"]:
+        with self._lock:
+            vector = self._memory.get(key)
+            if vector is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return vector
+
+        if self.cache_dir:
+            path = self._path(key)
+            if os.path.exists(path):
+                try:
+                    vector = np.load(path, mmap_mode="r")
+                except Exception as e:
+                    logging.warning(
+                        f"Dropping unreadable embedding cache file {path}: {e}"
+                    )
+                else:
+                    self.disk_hits += 1
+                    self._remember(key, vector)
+                    return vector
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, vector: "np.ndarray"):
+        vector = np.ascontiguousarray(vector)
+        self._remember(key, vector)
+
+        if self.cache_dir:
+            path = self._path(key)
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                # Write then rename, so concurrent servers never read a partial file
+                tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    np.save(f, vector)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logging.warning(f"Could not persist embedding to {path}: {e}")
+
+    def stats(self) -> dict:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.memory_hits + self.disk_hits) / lookups
+            if lookups
+            else 0.0,
+            "memory_items": len(self._memory),
+        }
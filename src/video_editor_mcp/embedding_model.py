@@ -0,0 +1,486 @@
+import asyncio
+import gc
+import json
+import logging
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
+
+import requests
+
+from .http_client import get_session
+from .lazy_imports import LazyModule
+from .resilience import resilience
+from .timings import max_rss_mb
+
+# Imported on first use, so loading the server doesn't pay for torch
+np = LazyModule("numpy")
+transformers = LazyModule("transformers")
+
+if TYPE_CHECKING:
+    from .embedding_cache import EmbeddingCache
+    from .onnx_text_encoder import OnnxTextEncoder
+
+# How query embeddings are sent to the embedding search endpoint: "json" float
+# lists, or base64 "float32" / "float16" / "int8" (see embedding_wire.py)
+EMBEDDING_WIRE_FORMAT = os.environ.get("VJ_EMBEDDING_WIRE_FORMAT", "json")
+# Optional Matryoshka truncation of query embeddings, e.g. 256
+EMBEDDING_TRUNCATE_DIM = (
+    int(os.environ["VJ_EMBEDDING_TRUNCATE_DIM"])
+    if os.environ.get("VJ_EMBEDDING_TRUNCATE_DIM")
+    else None
+)
+
+
+class ModelLoadingError(RuntimeError):
+    """The embedding model is requested before it has finished loading"""
+
+
+class ModelLoadFailedError(RuntimeError):
+    """The embedding model is requested after its load failed"""
+
+
+def _resolve_future(future: asyncio.Future):
+    if not future.done():
+        future.set_result(None)
+
+
+# Submodules of jina-clip that only image inputs need
+VISION_MODULES = ("vision_model", "visual_projection")
+
+
+def _offload_modules(model, names: Tuple[str, ...]) -> dict:
+    """
+    Free the weights of `model`'s named submodules by moving them to the meta
+    device, keeping the modules so they can be filled in again later. Returns
+    their non-persistent buffers, which aren't in the checkpoint.
+    """
+    persistent = set(model.state_dict())
+    buffers = {
+        name: buffer.detach().clone()
+        for name, buffer in model.named_buffers()
+        if name.split(".", 1)[0] in names and name not in persistent
+    }
+    for name in names:
+        module = getattr(model, name, None)
+        if module is not None:
+            module.to("meta")
+    return buffers
+
+
+def _checkpoint_tensors(model_name: str, prefixes: Tuple[str, ...]) -> dict:
+    """Read only the weights under `prefixes` from a model's safetensors checkpoint"""
+    from safetensors import safe_open
+    from transformers.utils import cached_file
+
+    index = cached_file(
+        model_name,
+        "model.safetensors.index.json",
+        _raise_exceptions_for_missing_entries=False,
+    )
+    if index:
+        with open(index) as f:
+            weight_map = json.load(f)["weight_map"]
+        shards = {
+            shard for key, shard in weight_map.items() if key.startswith(prefixes)
+        }
+        paths = [cached_file(model_name, shard) for shard in sorted(shards)]
+    else:
+        path = cached_file(
+            model_name,
+            "model.safetensors",
+            _raise_exceptions_for_missing_entries=False,
+        )
+        if path is None:
+            raise FileNotFoundError(f"{model_name} has no safetensors checkpoint")
+        paths = [path]
+
+    tensors = {}
+    for path in paths:
+        with safe_open(path, framework="pt") as f:
+            for key in f.keys():
+                if key.startswith(prefixes):
+                    tensors[key] = f.get_tensor(key)
+    return tensors
+
+
+class EmbeddingModelLoader:
+    """
+    Loads the embedding model in the background.
+
+    Moves through the states idle -> loading -> warming -> ready (or failed);
+    `wait_ready` lets async callers wait on readiness with a deadline.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "jinaai/jina-clip-v1",
+        backend: str = "torch",
+        load_mode: str = "text",
+    ):
+        self._model: Optional["transformers.AutoModel"] = None
+        self._has_vision = False
+        self._vision_buffers: dict = {}
+        self._vision_lock = threading.Lock()
+        self._text_encoder: Optional["OnnxTextEncoder"] = None
+        self._cache: Optional["EmbeddingCache"] = None
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._waiters: List[tuple] = []
+        self.model_name = model_name
+        # "torch" runs the full fp32 model, "onnx" an int8 ONNX Runtime text tower
+        self.backend = backend
+        # "text" keeps only the text tower resident, "full" loads vision up front
+        self.load_mode = load_mode
+
+        # Readiness and load metrics, see status()
+        self.state = "idle"
+        self.error: Optional[str] = None
+        self.load_started_at: Optional[float] = None
+        self.load_seconds: Optional[float] = None
+        self.warmup_seconds: Optional[float] = None
+        self.time_to_ready: Optional[float] = None
+
+    def _load_torch_model(self, text_only: bool = False) -> "transformers.AutoModel":
+        model = transformers.AutoModel.from_pretrained(
+            self.model_name, trust_remote_code=True, low_cpu_mem_usage=True
+        )
+        if text_only:
+            # Only text is embedded on the hot path, so free the vision tower's
+            # weights; _load_vision_tower reads just those back in on demand
+            self._vision_buffers = _offload_modules(model, VISION_MODULES)
+            gc.collect()
+        return model
+
+    def _load_vision_tower(self):
+        """Fill the offloaded vision tower of the resident text-only model back in"""
+        model = self._model
+        prefixes = tuple(f"{name}." for name in VISION_MODULES)
+        try:
+            tensors = _checkpoint_tensors(self.model_name, prefixes)
+            for name in VISION_MODULES:
+                module = getattr(model, name, None)
+                if module is not None:
+                    module.to_empty(device="cpu")
+            result = model.load_state_dict(tensors, strict=False)
+            missing = [key for key in result.missing_keys if key.startswith(prefixes)]
+            if missing:
+                raise ValueError(f"checkpoint lacks {len(missing)} vision weights")
+            for name, buffer in self._vision_buffers.items():
+                model.get_buffer(name).copy_(buffer)
+        except Exception as e:
+            # Costs a second text tower until the spare one is collected
+            logging.warning(
+                f"Could not load the vision tower on its own, taking it from a full load: {e}"
+            )
+            full = self._load_torch_model(text_only=False)
+            for name in VISION_MODULES:
+                setattr(model, name, getattr(full, name, None))
+            del full
+            gc.collect()
+
+    def _set_state(self, state: str):
+        waiters = []
+        with self._lock:
+            # Readiness is signalled before the state is published, so anyone
+            # seeing "ready" also sees is_ready
+            if state == "ready":
+                self._ready.set()
+            if state in ("ready", "failed"):
+                waiters, self._waiters = self._waiters, []
+            self.state = state
+        logging.info(f"Embedding model {self.model_name} is {state}")
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(_resolve_future, future)
+
+    def start_loading(self):
+        """Start loading the model in the background, if not already started."""
+        with self._lock:
+            # A failed load can be retried, anything else is already underway
+            if self.state not in ("idle", "failed"):
+                return
+            self.state = "loading"
+            self.error = None
+            self.load_started_at = time.time()
+
+        def load():
+            try:
+                self._load()
+                self.load_seconds = time.time() - self.load_started_at
+                self._set_state("warming")
+                self._warmup()
+                self.time_to_ready = time.time() - self.load_started_at
+                logging.info(
+                    f"Model {self.model_name} ready in {self.time_to_ready:.1f}s "
+                    f"(load {self.load_seconds:.1f}s, warmup {self.warmup_seconds:.2f}s)"
+                )
+                self._set_state("ready")
+            except Exception as e:
+                logging.error(f"Error loading model {self.model_name}: {e}")
+                self.error = str(e)
+                self._set_state("failed")
+
+        thread = threading.Thread(target=load)
+        thread.daemon = True
+        thread.start()
+
+    def _load(self):
+        if self.backend == "onnx":
+            try:
+                from .onnx_text_encoder import OnnxTextEncoder
+
+                encoder = OnnxTextEncoder(self.model_name)
+                encoder.load(
+                    torch_model_factory=lambda: self._load_torch_model(text_only=True)
+                )
+                self._text_encoder = encoder
+                logging.info(f"Model {self.model_name} loaded (ONNX int8 text)")
+                return
+            except Exception as e:
+                logging.warning(
+                    f"ONNX backend unavailable, falling back to PyTorch: {e}"
+                )
+                self.backend = "torch"
+
+        text_only = self.load_mode == "text"
+        self._model = self._load_torch_model(text_only=text_only)
+        self._has_vision = not text_only
+        logging.info(
+            f"Model {self.model_name} loaded ({'text tower only' if text_only else 'full'})"
+        )
+
+    def _warmup(self):
+        """Run a throwaway query so the first real one doesn't pay one-off setup costs"""
+        started = time.time()
+        self.text_encoder.encode_text(["warmup query"])
+        self.warmup_seconds = time.time() - started
+
+    @property
+    def is_ready(self) -> bool:
+        return self._ready.is_set()
+
+    async def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait up to `timeout` seconds for the model to be ready, starting the load
+        if needed. Returns whether the model is ready.
+        """
+        if self._ready.is_set():
+            return True
+        self.start_loading()
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            if self.state in ("ready", "failed"):
+                return self._ready.is_set()
+            self._waiters.append((loop, future))
+        try:
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                if (loop, future) in self._waiters:
+                    self._waiters.remove((loop, future))
+        return self._ready.is_set()
+
+    def status(self) -> dict:
+        elapsed = None
+        if self.load_started_at is not None:
+            elapsed = time.time() - self.load_started_at
+        return {
+            "state": self.state,
+            "backend": self.backend,
+            "seconds_since_load_started": elapsed,
+            "load_seconds": self.load_seconds,
+            "warmup_seconds": self.warmup_seconds,
+            "time_to_ready": self.time_to_ready,
+            "vision_loaded": self._has_vision,
+            "max_rss_mb": max_rss_mb(),
+            "error": self.error,
+        }
+
+    def not_ready_error(self) -> RuntimeError:
+        """The error for a request that needs the model before it is ready"""
+        if self.state == "failed":
+            return ModelLoadFailedError(
+                f"Model {self.model_name} failed to load: {self.error}"
+            )
+        return ModelLoadingError(f"Model {self.model_name} still loading")
+
+    def _not_ready_error(self) -> RuntimeError:
+        # First use kicks off loading if the startup preload hasn't yet
+        if self.state != "failed":
+            self.start_loading()
+        return self.not_ready_error()
+
+    @property
+    def model(self) -> "transformers.AutoModel":
+        if self._model is None:
+            raise self._not_ready_error()
+        return self._model
+
+    @property
+    def image_model(self) -> "transformers.AutoModel":
+        """
+        The PyTorch model with its vision tower, loaded on first use if needed.
+
+        Only the vision weights are read in; the resident text tower is reused
+        and text requests keep running while they load.
+        """
+        if self._model is not None and self._has_vision:
+            return self._model
+        if not self.is_ready:
+            raise self._not_ready_error()
+        with self._vision_lock:
+            if self._model is None:
+                # ONNX backend: there's no PyTorch model to add the tower to
+                logging.info(f"Loading {self.model_name} for image inputs")
+                self._model = self._load_torch_model(text_only=False)
+            elif not self._has_vision:
+                logging.info(f"Loading {self.model_name} vision tower for image inputs")
+                started = time.time()
+                self._load_vision_tower()
+                logging.info(f"Vision tower loaded in {time.time() - started:.1f}s")
+            self._has_vision = True
+        return self._model
+
+    @property
+    def text_encoder(self):
+        """The model used for text: the ONNX encoder when loaded, else PyTorch"""
+        if self._text_encoder is not None:
+            return self._text_encoder
+        return self.model
+
+    @property
+    def text_model_id(self) -> str:
+        """Identifies the text embedding space, which differs per backend"""
+        if self._text_encoder is not None:
+            # Quantized vectors differ slightly, never mix them with fp32 ones
+            return f"{self.model_name}@onnx-int8"
+        return self.model_name
+
+    @property
+    def cache(self) -> "EmbeddingCache":
+        if self._cache is None:
+            from .embedding_cache import DEFAULT_CACHE_DIR, EmbeddingCache
+
+            cache_dir = os.environ.get("VJ_EMBEDDING_CACHE_DIR", DEFAULT_CACHE_DIR)
+            # An empty VJ_EMBEDDING_CACHE_DIR keeps the cache in memory only
+            self._cache = EmbeddingCache(cache_dir=cache_dir or None)
+        return self._cache
+
+    def embed(
+        self,
+        kind: str,
+        items: Union[str, List[str]],
+        truncate_dim: Optional[int] = None,
+        task: Optional[str] = None,
+        use_cache: bool = True,
+    ) -> "np.ndarray":
+        """
+        Embed items through the cache, running the model only on cache misses.
+
+        Bulk one-off inputs (e.g. extracted keyframes) can pass use_cache=False
+        to encode straight through without filling the cache.
+        """
+        single = isinstance(items, str)
+        batch = [items] if single else list(items)
+        if not use_cache:
+            stacked = np.asarray(self._encode(kind, batch, truncate_dim, task))
+            return stacked[0] if single else stacked
+        model_id = self.text_model_id if kind == "text" else self.model_name
+        # Inputs without a cache key (e.g. remote images without validators)
+        # are always encoded, but still only once per distinct input
+        keys = [
+            self.cache.make_key(model_id, kind, item, truncate_dim, task)
+            or ("uncached", item)
+            for item in batch
+        ]
+        # Look up, and if needed encode, each distinct input only once
+        found = {
+            key: self.cache.get(key) if isinstance(key, str) else None
+            for key in dict.fromkeys(keys)
+        }
+        missing = [key for key, vector in found.items() if vector is None]
+        if missing:
+            items_by_key = dict(zip(keys, batch))
+            to_encode = [items_by_key[key] for key in missing]
+            encoded = np.asarray(self._encode(kind, to_encode, truncate_dim, task))
+            for key, vector in zip(missing, encoded):
+                if isinstance(key, str):
+                    self.cache.put(key, vector)
+                found[key] = vector
+
+        logging.debug(f"Embedding cache stats: {self.cache.stats()}")
+        stacked = np.stack([found[key] for key in keys])
+        return stacked[0] if single else stacked
+
+    def _encode(
+        self,
+        kind: str,
+        items: List[str],
+        truncate_dim: Optional[int],
+        task: Optional[str],
+    ):
+        if kind == "text":
+            return self.text_encoder.encode_text(
+                items, truncate_dim=truncate_dim, task=task
+            )
+        return self.image_model.encode_image(items, truncate_dim=truncate_dim)
+
+    def encode_text(
+        self,
+        texts: Union[str, List[str]],
+        truncate_dim: Optional[int] = None,
+        task: Optional[str] = None,
+    ) -> dict:
+        """
+        Encode text and format the embeddings in the expected JSON structure
+        """
+        embeddings = self.embed("text", texts, truncate_dim=truncate_dim, task=task)
+
+        # Format the response in the expected structure
+        return self.payload(embeddings, "text_embeddings")
+
+    def encode_image(
+        self, images: Union[str, List[str]], truncate_dim: Optional[int] = None
+    ) -> dict:
+        """
+        Encode images and format the embeddings in the expected JSON structure
+        """
+        embeddings = self.embed("image", images, truncate_dim=truncate_dim)
+
+        return self.payload(embeddings, "image_embeddings")
+
+    @staticmethod
+    def payload(embeddings: "np.ndarray", embedding_type: str) -> dict:
+        """
+        Format embeddings in the JSON structure the embedding search endpoint expects
+        """
+        from .embedding_wire import embedding_payload
+
+        return embedding_payload(
+            embeddings,
+            embedding_type,
+            wire_format=EMBEDDING_WIRE_FORMAT,
+            truncate_dim=EMBEDDING_TRUNCATE_DIM,
+        )
+
+    def post_embeddings(
+        self, embeddings: dict, endpoint_url: str, headers: Optional[dict] = None
+    ) -> requests.Response:
+        """
+        Post embeddings to the specified endpoint
+        """
+        if headers is None:
+            headers = {"Content-Type": "application/json"}
+
+        response = resilience.call(
+            "POST",
+            endpoint_url,
+            lambda timeout: get_session().post(
+                endpoint_url, json=embeddings, headers=headers, timeout=timeout
+            ),
+        )
+        response.raise_for_status()
+        return response
@@ -0,0 +1,94 @@
+import base64
+from typing import Optional
+
+import numpy as np
+
+# Wire dtypes for compact embedding payloads, little-endian on the wire
+WIRE_DTYPES = {
+    "float32": np.dtype("<f4"),
+    "float16": np.dtype("<f2"),
+    "int8": np.dtype("i1"),
+}
+
+
+def truncate_embeddings(embeddings: np.ndarray, truncate_dim: int) -> np.ndarray:
+    """Matryoshka truncation: keep the leading dims and re-normalize"""
+    if embeddings.shape[-1] <= truncate_dim:
+        return embeddings
+    truncated = embeddings[..., :truncate_dim]
+    norms = np.linalg.norm(truncated, axis=-1, keepdims=True)
+    return truncated / np.maximum(norms, 1e-12)
+
+
+def encode_embeddings(
+    embeddings: np.ndarray,
+    dtype: str = "float16",
+    truncate_dim: Optional[int] = None,
+) -> dict:
+    """
+    Pack embeddings as base64 of the raw array buffer instead of JSON floats.
+
+    float32 is sent straight from the numpy buffer; float16 and int8 are one
+    vectorized cast. int8 uses a symmetric per-vector scale, sent alongside.
+    """
+    if dtype not in WIRE_DTYPES:
+        raise ValueError(f"Unsupported embedding wire dtype: {dtype}")
+
+    embeddings = np.asarray(embeddings)
+    if truncate_dim:
+        embeddings = truncate_embeddings(embeddings, truncate_dim)
+
+    payload = {"encoding": "base64", "dtype": dtype, "shape": list(embeddings.shape)}
+    if dtype == "int8":
+        scale = np.max(np.abs(embeddings), axis=-1, keepdims=True) / 127.0
+        scale = np.maximum(scale, 1e-12)
+        packed = np.round(embeddings / scale).astype(WIRE_DTYPES[dtype])
+        payload["scale"] = scale.reshape(-1).astype(np.float32).tolist()
+    else:
+        packed = embeddings.astype(WIRE_DTYPES[dtype], copy=False)
+
+    packed = np.ascontiguousarray(packed)
+    payload["data"] = base64.b64encode(memoryview(packed)).decode("ascii")
+    return payload
+
+
+def decode_embeddings(payload: dict) -> np.ndarray:
+    """Inverse of encode_embeddings, returns float32 embeddings"""
+    dtype = WIRE_DTYPES[payload["dtype"]]
+    raw = np.frombuffer(base64.b64decode(payload["data"]), dtype=dtype)
+    embeddings = raw.reshape(payload["shape"]).astype(np.float32)
+    if payload["dtype"] == "int8":
+        scale = np.asarray(payload["scale"], dtype=np.float32)
+        embeddings *= scale.reshape(embeddings.shape[:-1] + (1,))
+    return embeddings
+
+
+def embedding_payload(
+    embeddings: np.ndarray,
+    embedding_type: str,
+    wire_format: str = "json",
+    truncate_dim: Optional[int] = None,
+) -> dict:
+    """
+    Request body for the embedding search endpoint: JSON float lists, or a
+    base64 packed array when `wire_format` is one of WIRE_DTYPES
+    """
+    if wire_format == "json":
+        return {
+            "embeddings": np.asarray(embeddings).tolist(),
+            "embedding_type": embedding_type,
+        }
+    return {
+        "embeddings": encode_embeddings(
+            embeddings, dtype=wire_format, truncate_dim=truncate_dim
+        ),
+        "embedding_type": embedding_type,
+    }
+
+
+def payload_embeddings(payload: dict) -> np.ndarray:
+    """Float32 embeddings from a request body in either wire format"""
+    embeddings = payload["embeddings"]
+    if isinstance(embeddings, dict):
+        return decode_embeddings(embeddings)
+    return np.asarray(embeddings, dtype=np.float32)
@@ -0,0 +1,90 @@
+import asyncio
+import contextvars
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Threads shared by all blocking calls, and how many calls one tool may have
+# in flight at once before further calls of that tool queue
+BLOCKING_WORKERS = int(os.environ.get("VJ_BLOCKING_WORKERS", "16"))
+TOOL_CONCURRENCY = int(os.environ.get("VJ_TOOL_CONCURRENCY", "4"))
+
+# Tighter limits where concurrent calls don't help or aren't safe
+TOOL_LIMITS = {
+    "generate-edit-from-videos": 2,
+    "generate-edit-from-single-video": 2,
+    "update-video-edit": 2,
+    # osxphotos' PhotosDB isn't thread-safe
+    "search-local-videos": 1,
+    # Shared by the search tools; a batch search fans out to one call per query
+    "embedding-search": 16,
+}
+
+
+class BlockingExecutor:
+    """
+    Runs synchronous SDK, HTTP and subprocess calls off the event loop.
+
+    Calls share one bounded thread pool, and each key (the tool name, or a
+    backend several tools call into) has its own semaphore so one busy tool
+    can't take every thread while other tools' calls wait behind it.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = BLOCKING_WORKERS,
+        default_limit: int = TOOL_CONCURRENCY,
+        limits: Optional[Dict[str, int]] = None,
+    ):
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="vj-blocking"
+        )
+        self.default_limit = default_limit
+        self.limits = dict(TOOL_LIMITS if limits is None else limits)
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._waiting: Dict[str, int] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _semaphore(self, key: str) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Semaphores bind to the loop they are first awaited on
+            self._loop = loop
+            self._semaphores = {}
+        if key not in self._semaphores:
+            self._semaphores[key] = asyncio.Semaphore(
+                self.limits.get(key, self.default_limit)
+            )
+        return self._semaphores[key]
+
+    async def run(self, key: str, fn: Callable[..., T], *args, **kwargs) -> T:
+        """Await fn(*args, **kwargs) on the pool, within `key`'s concurrency limit"""
+        semaphore = self._semaphore(key)
+        self._waiting[key] = self._waiting.get(key, 0) + 1
+        try:
+            await semaphore.acquire()
+        finally:
+            self._waiting[key] -= 1
+        # Carry context (e.g. the call's deadline) over into the worker thread
+        context = contextvars.copy_context()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._pool, functools.partial(context.run, fn, *args, **kwargs)
+            )
+        finally:
+            semaphore.release()
+
+    def stats(self) -> Dict[str, dict]:
+        return {
+            key: {
+                "limit": self.limits.get(key, self.default_limit),
+                "waiting": self._waiting.get(key, 0),
+            }
+            for key in self._semaphores
+        }
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
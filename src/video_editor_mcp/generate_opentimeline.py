@@ -1,11 +1,11 @@
 import opentimelineio as otio
-from videojungle import ApiClient
 import os
 import sys
 import json
 import argparse
 import logging
-import requests
+
+from .http_client import PooledApiClient, download_file
 
 logging.basicConfig(
     filename="app.log",  # Name of the log file
@@ -13,7 +13,7 @@ logging.basicConfig(
     format="%(asctime)s - %(levelname)s - %(message)s",  # Log format
 )
 
-vj = ApiClient(os.environ.get("VJ_API_KEY"))
+vj = PooledApiClient(os.environ.get("VJ_API_KEY"))
 
 
 def timecode_to_frames(timecode, fps=24.0):
@@ -87,16 +87,11 @@ def download_asset(asset_id, asset_type, download_dir="downloads"):
 
         # Download the file
         if asset_type in ["user", "audio", "mp3", "wav", "aac", "m4a"]:
-            # Use requests for assets API downloads
-            response = requests.get(download_url, stream=True)
-            response.raise_for_status()
-
-            with open(local_file, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            # Assets API downloads, over the shared keep-alive session
+            download_file(download_url, local_file)
         else:
             # Use video files download method
-            lf = vj.video_files.download(asset_id, local_file)
+            lf = vj.download_video_file(asset_id, local_file)
             logging.info(f"Downloaded video to {lf}")
             return lf
 
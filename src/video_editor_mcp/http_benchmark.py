@@ -0,0 +1,106 @@
+"""
+Per-request latency of outbound calls with and without connection pooling.
+
+Serves a small JSON response from a local TLS stand-in (self-signed, made
+with the openssl CLI) and times bare requests.post calls, which pay a TCP and
+TLS handshake each time, against the shared keep-alive session:
+
+    VJ_API_KEY=offline python -m video_editor_mcp.http_benchmark --requests 200
+"""
+
+import argparse
+import json
+import os
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import requests
+
+from .http_client import HTTP_KEEPALIVE, HTTP_POOL_SIZE, _new_session
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without TCP_NODELAY a kept
+    # alive connection waits on delayed ACKs and hides the handshake savings
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        data = json.dumps([{"video_id": "video-1", "score": 1.0}]).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def tls_server(cert_dir: str) -> ThreadingHTTPServer:
+    """Start an HTTPS stand-in on an ephemeral localhost port"""
+    cert = os.path.join(cert_dir, "cert.pem")
+    key = os.path.join(cert_dir, "key.pem")
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1"]
+        + ["-keyout", key, "-out", cert, "-subj", "/CN=localhost"]
+        + ["-addext", "subjectAltName=DNS:localhost,IP:127.0.0.1"],
+        check=True,
+        capture_output=True,
+    )
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    server.cert = cert
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_benchmark(n_requests: int = 200, http2: bool = False) -> dict:
+    payload = {"embeddings": [0.0] * 256, "embedding_type": "text_embeddings"}
+    with tempfile.TemporaryDirectory() as cert_dir:
+        server = tls_server(cert_dir)
+        url = (
+            f"https://127.0.0.1:{server.server_address[1]}/video-file/embedding-search"
+        )
+        session = _new_session(HTTP_POOL_SIZE, HTTP_KEEPALIVE, http2)
+        modes = {
+            "bare": lambda: requests.post(url, json=payload, verify=server.cert),
+            "pooled": lambda: session.post(url, json=payload, verify=server.cert),
+        }
+        report = {}
+        try:
+            for mode, send in modes.items():
+                samples = []
+                for _ in range(n_requests):
+                    started = time.perf_counter()
+                    send().raise_for_status()
+                    samples.append(time.perf_counter() - started)
+                p50, p95, p99 = np.percentile(1000 * np.asarray(samples), [50, 95, 99])
+                report[mode] = {"p50_ms": p50, "p95_ms": p95, "p99_ms": p99}
+        finally:
+            session.close()
+            server.shutdown()
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument(
+        "--http2", action="store_true", help="Mount the HTTP/2 adapter (needs h2)"
+    )
+    args = parser.parse_args()
+    report = run_benchmark(args.requests, http2=args.http2)
+    print(f"{'mode':<10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for mode, stats in report.items():
+        print(
+            f"{mode:<10}{stats['p50_ms']:>10.2f}{stats['p95_ms']:>10.2f}{stats['p99_ms']:>10.2f}"
+        )
@@ -0,0 +1,175 @@
+import io
+import logging
+import os
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from videojungle import ApiClient
+
+from .resilience import resilience
+
+# Connections kept open per host, and whether to speak HTTP/2 (needs the
+# optional h2 package, see the http2 extra) instead of pooled HTTP/1.1
+HTTP_POOL_SIZE = int(os.environ.get("VJ_HTTP_POOL_SIZE", "16"))
+HTTP_KEEPALIVE = float(os.environ.get("VJ_HTTP_KEEPALIVE", "60"))
+HTTP2 = os.environ.get("VJ_HTTP2", "0") == "1"
+
+
+class _HttpxRaw(io.RawIOBase):
+    """File-like view of a streamed httpx response, for requests' iter_content"""
+
+    def __init__(self, response):
+        self._response = response
+        self._chunks = response.iter_bytes()
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._buffer:
+            try:
+                self._buffer = next(self._chunks)
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+    def close(self):
+        self._response.close()
+        super().close()
+
+
+class Http2Adapter(BaseAdapter):
+    """
+    Transport adapter that sends requests through a shared httpx client, so a
+    requests.Session can multiplex over HTTP/2 connections.
+    """
+
+    def __init__(
+        self, pool_size: int = HTTP_POOL_SIZE, keepalive: float = HTTP_KEEPALIVE
+    ):
+        import httpx
+
+        super().__init__()
+        self._httpx = httpx
+        self._client = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size,
+                keepalive_expiry=keepalive,
+            ),
+        )
+
+    def send(
+        self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None
+    ):
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            timeout = self._httpx.Timeout(read, connect=connect)
+        elif timeout is None:
+            timeout = self._httpx.Timeout(None)
+        response = self._client.send(
+            self._client.build_request(
+                request.method,
+                request.url,
+                headers=dict(request.headers),
+                content=request.body,
+                timeout=timeout,
+            ),
+            stream=True,
+        )
+
+        result = requests.Response()
+        result.status_code = response.status_code
+        result.reason = response.reason_phrase
+        result.headers = CaseInsensitiveDict(response.headers)
+        result.url = str(response.url)
+        result.request = request
+        result.connection = self
+        # httpx has already decoded gzip/deflate bodies
+        result.headers.pop("Content-Encoding", None)
+        result.raw = _HttpxRaw(response)
+        if not stream:
+            result.content
+            response.close()
+        return result
+
+    def close(self):
+        self._client.close()
+
+
+def _new_session(pool_size: int, keepalive: float, http2: bool) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if http2:
+        try:
+            session.mount("https://", Http2Adapter(pool_size, keepalive))
+        except ImportError:
+            logging.warning(
+                "VJ_HTTP2=1 needs the h2 package (pip install 'httpx[http2]'), using HTTP/1.1"
+            )
+    return session
+
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    The process-wide keep-alive session every outbound call goes through, so
+    repeated searches and downloads reuse TCP/TLS connections.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _new_session(HTTP_POOL_SIZE, HTTP_KEEPALIVE, HTTP2)
+    return _session
+
+
+def download_file(url: str, path: str, chunk_size: int = 1024 * 1024) -> str:
+    """Stream `url` to `path` over the shared session"""
+    response = resilience.call(
+        "GET", url, lambda timeout: get_session().get(url, stream=True, timeout=timeout)
+    )
+    with response:
+        response.raise_for_status()
+        with open(path, "wb") as f:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                f.write(chunk)
+    return path
+
+
+class PooledApiClient(ApiClient):
+    """Video Jungle client whose API calls and downloads use the shared session"""
+
+    def _make_request(self, method, endpoint, **kwargs):
+        headers = {"X-API-Key": self.token, **kwargs.pop("headers", {})}
+        url = f"{self.BASE_URL}/{endpoint.lstrip('/')}"
+        response = resilience.call(
+            method,
+            url,
+            lambda timeout: get_session().request(
+                method, url, headers=headers, timeout=timeout, **kwargs
+            ),
+        )
+        if response.status_code == 422:
+            logging.error(f"422 Unprocessable Entity from {endpoint}: {response.text}")
+        response.raise_for_status()
+        return response.json()
+
+    def download_video_file(self, video_id: str, filename: str) -> str:
+        url = self.video_files.get(video_id).download_url
+        if not url:
+            raise Exception("Video file has no download URL")
+        return download_file(url, filename)
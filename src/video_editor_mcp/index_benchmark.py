@@ -0,0 +1,116 @@
+"""
+Recall and latency of the local segment index's IVF search against brute force.
+
+Fills a throwaway SegmentVectorIndex with clustered synthetic embeddings (the
+way real segment embeddings bunch up by video and topic), then times the
+same queries through the IVF lists and through search(exact=True), and
+reports recall@k of the IVF results against the exact ones. Also times
+incremental adds once the IVF layer is trained:
+
+    python -m video_editor_mcp.index_benchmark --segments 50000 --nprobe 4 8 16
+"""
+
+import argparse
+import tempfile
+import time
+from typing import List
+
+import numpy as np
+
+from .vector_index import SegmentVectorIndex
+
+
+def synthetic_embeddings(
+    n: int, dim: int, n_topics: int = 200, spread: float = 0.5, seed: int = 0
+) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    topics = rng.standard_normal((n_topics, dim))
+    vectors = topics[rng.integers(n_topics, size=n)]
+    vectors += spread * rng.standard_normal((n, dim))
+    return vectors.astype(np.float32)
+
+
+def _percentiles(samples: List[float]) -> dict:
+    p50, p95 = np.percentile(1000 * np.asarray(samples), [50, 95])
+    return {"p50_ms": p50, "p95_ms": p95}
+
+
+def run_benchmark(
+    n_segments: int = 50000,
+    dim: int = 256,
+    n_queries: int = 200,
+    k: int = 10,
+    nprobes: List[int] = (4, 8, 16),
+    add_batch: int = 100,
+) -> dict:
+    vectors = synthetic_embeddings(n_segments + 10 * add_batch, dim)
+    queries = synthetic_embeddings(n_queries, dim, seed=1)
+    records = [
+        {"video_id": f"video-{i // 50}", "timepoint": str(i % 50), "embedding": v}
+        for i, v in enumerate(vectors)
+    ]
+    report = {}
+    with tempfile.TemporaryDirectory() as index_dir:
+        index = SegmentVectorIndex(index_dir, min_train_size=min(4096, n_segments))
+        started = time.perf_counter()
+        for start in range(0, n_segments, 5000):
+            index.add(records[start : min(start + 5000, n_segments)])
+        report["build_s"] = time.perf_counter() - started
+
+        add_samples = []
+        for start in range(n_segments, len(records), add_batch):
+            started = time.perf_counter()
+            index.add(records[start : start + add_batch])
+            add_samples.append(time.perf_counter() - started)
+        report["add"] = _percentiles(add_samples)
+
+        exact_samples, exact_results = [], []
+        for query in queries:
+            started = time.perf_counter()
+            results = index.search(query, k=k, exact=True)
+            exact_samples.append(time.perf_counter() - started)
+            exact_results.append({(r["video_id"], r["timepoint"]) for r in results})
+        report["exact"] = _percentiles(exact_samples)
+
+        for nprobe in nprobes:
+            index.nprobe = nprobe
+            samples, hits = [], 0
+            for query, exact in zip(queries, exact_results):
+                started = time.perf_counter()
+                results = index.search(query, k=k)
+                samples.append(time.perf_counter() - started)
+                hits += len(exact & {(r["video_id"], r["timepoint"]) for r in results})
+            report[f"ivf nprobe={nprobe}"] = {
+                **_percentiles(samples),
+                "recall": hits / sum(len(exact) for exact in exact_results),
+            }
+        report["lists"] = 0 if index._centroids is None else len(index._centroids)
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--segments", type=int, default=50000)
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("-k", type=int, default=10)
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[4, 8, 16])
+    parser.add_argument(
+        "--add-batch", type=int, default=100, help="Segments per incremental add"
+    )
+    args = parser.parse_args()
+    report = run_benchmark(
+        args.segments, args.dim, args.queries, args.k, args.nprobe, args.add_batch
+    )
+    print(
+        f"{args.segments} segments, {report['lists']} IVF lists, "
+        f"built in {report['build_s']:.1f}s; "
+        f"add of {args.add_batch}: p50 {report['add']['p50_ms']:.2f}ms "
+        f"p95 {report['add']['p95_ms']:.2f}ms"
+    )
+    print(f"{'search':<16}{'p50 ms':>10}{'p95 ms':>10}{f'recall@{args.k}':>12}")
+    for name, stats in report.items():
+        if not isinstance(stats, dict) or name == "add":
+            continue
+        recall = f"{stats['recall']:.3f}" if "recall" in stats else "1.000"
+        print(f"{name:<16}{stats['p50_ms']:>10.2f}{stats['p95_ms']:>10.2f}{recall:>12}")
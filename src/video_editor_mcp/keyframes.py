@@ -0,0 +1,191 @@
+import argparse
+import asyncio
+import logging
+import os
+import re
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .vector_index import SegmentVectorIndex
+
+DEFAULT_FRAME_INDEX_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "video-editor-mcp", "frame-index"
+)
+VIDEO_EXTENSIONS = (".mp4", ".mov", ".m4v", ".mkv", ".webm")
+
+_PTS_TIME = re.compile(r"pts_time:([0-9.]+)")
+
+
+def extract_keyframes(
+    video_path: str, out_dir: str, min_interval: float = 1.0, width: int = 336
+) -> List[Tuple[float, str]]:
+    """
+    Decode only the keyframes of a video with ffmpeg, returning
+    (timestamp_seconds, jpeg_path) pairs at least `min_interval` apart.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    result = subprocess.run(
+        [
+            "ffmpeg",
+            "-hide_banner",
+            "-nostdin",
+            "-y",
+            "-skip_frame",
+            "nokey",
+            "-i",
+            video_path,
+            "-vf",
+            f"scale={width}:-2,showinfo",
+            "-vsync",
+            "vfr",
+            "-q:v",
+            "3",
+            os.path.join(out_dir, "%06d.jpg"),
+        ],
+        capture_output=True,
+        text=True,
+        timeout=600,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed for {video_path}: {result.stderr[-500:]}")
+
+    # showinfo logs one pts_time per written frame, in output order
+    timestamps = [float(t) for t in _PTS_TIME.findall(result.stderr)]
+    frames = sorted(f for f in os.listdir(out_dir) if f.endswith(".jpg"))
+
+    keyframes = []
+    last = None
+    for timestamp, frame in zip(timestamps, frames):
+        path = os.path.join(out_dir, frame)
+        if last is not None and timestamp - last < min_interval:
+            os.remove(path)
+            continue
+        keyframes.append((timestamp, path))
+        last = timestamp
+    return keyframes
+
+
+def _extract_job(job: Tuple[str, str, str, float]):
+    video_id, video_path, out_dir, min_interval = job
+    try:
+        return video_id, extract_keyframes(video_path, out_dir, min_interval)
+    except Exception as e:
+        logging.error(f"Error extracting keyframes from {video_path}: {e}")
+        return video_id, []
+
+
+def embed_keyframes(
+    videos: Dict[str, str],
+    encode_images: Callable[[List[str]], np.ndarray],
+    store: SegmentVectorIndex,
+    batch_size: int = 64,
+    workers: Optional[int] = None,
+    min_interval: float = 1.0,
+) -> int:
+    """
+    Extract keyframes from {video_id: local_path} in a process pool and embed
+    them in batches of `batch_size`, storing vectors keyed by (video_id, timestamp).
+    Returns the number of frames stored.
+    """
+    added = 0
+    pending: List[Tuple[str, float, str]] = []
+
+    def flush(batch):
+        vectors = encode_images([path for _, _, path in batch])
+        return store.add(
+            {
+                "video_id": video_id,
+                "timepoint": timestamp,
+                "embedding": vector,
+                "description": f"Keyframe at {timestamp:.2f}s",
+                "detected_items": [],
+            }
+            for (video_id, timestamp, _), vector in zip(batch, vectors)
+        )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        jobs = [
+            (video_id, path, os.path.join(tmp_dir, str(i)), min_interval)
+            for i, (video_id, path) in enumerate(videos.items())
+        ]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Embed full batches while later videos are still being decoded
+            for video_id, frames in pool.map(_extract_job, jobs):
+                pending.extend(
+                    (video_id, timestamp, path) for timestamp, path in frames
+                )
+                while len(pending) >= batch_size:
+                    added += flush(pending[:batch_size])
+                    pending = pending[batch_size:]
+        if pending:
+            added += flush(pending)
+
+    logging.info(f"Stored {added} keyframe embeddings from {len(videos)} videos")
+    return added
+
+
+def find_videos(paths: List[str]) -> Dict[str, str]:
+    """
+    Map video ids to files, walking directories. Ids are paths relative to
+    the directory given (or the file name, for files given directly), so
+    same-named files in different subdirectories stay apart.
+    """
+    videos = {}
+
+    def add(video_id: str, video_path: str):
+        video_id = video_id.replace(os.sep, "/")
+        if videos.get(video_id, video_path) != video_path:
+            # Same relative path under two of the given paths
+            video_id = os.path.abspath(video_path)
+        videos[video_id] = video_path
+
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for name in files:
+                    if name.lower().endswith(VIDEO_EXTENSIONS):
+                        video_path = os.path.join(root, name)
+                        add(os.path.relpath(video_path, path), video_path)
+        else:
+            add(os.path.basename(path), path)
+    return videos
+
+
+if __name__ == "__main__":
+    """
+    Usage: python -m video_editor_mcp.keyframes downloads/
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("paths", nargs="+", help="Video files or directories")
+    parser.add_argument("--index-dir", default=DEFAULT_FRAME_INDEX_DIR)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--min-interval", type=float, default=1.0)
+    args = parser.parse_args()
+
+    from .embedding_model import EmbeddingModelLoader
+
+    # Only images are embedded here, so load both towers in one go; loading
+    # overlaps with decoding the first videos
+    model_loader = EmbeddingModelLoader(load_mode="full")
+    model_loader.start_loading()
+
+    def encode_images(paths: List[str]) -> np.ndarray:
+        if not model_loader.is_ready and not asyncio.run(model_loader.wait_ready()):
+            raise model_loader.not_ready_error()
+        return model_loader.embed("image", paths, use_cache=False)
+
+    store = SegmentVectorIndex(args.index_dir)
+    count = embed_keyframes(
+        find_videos(args.paths),
+        encode_images,
+        store,
+        batch_size=args.batch_size,
+        workers=args.workers,
+        min_interval=args.min_interval,
+    )
+    print(f"Stored {count} keyframe embeddings in {args.index_dir}")
@@ -0,0 +1,47 @@
+import importlib
+import logging
+import threading
+import time
+from types import ModuleType
+from typing import Optional
+
+
+class LazyModule(ModuleType):
+    """
+    Stand-in for a heavy module that is only imported on first attribute access.
+
+    Lets modules reference torch/transformers/osxphotos/numpy at module level
+    without paying their import cost before the MCP handshake completes.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self._lazy_name = name
+        self._lazy_module: Optional[ModuleType] = None
+        self._lazy_lock = threading.Lock()
+
+    def _load(self) -> ModuleType:
+        if self._lazy_module is None:
+            with self._lazy_lock:
+                if self._lazy_module is None:
+                    start = time.perf_counter()
+                    module = importlib.import_module(self._lazy_name)
+                    logging.info(
+                        f"Deferred import of {self._lazy_name} took {time.perf_counter() - start:.2f}s"
+                    )
+                    self._lazy_module = module
+        return self._lazy_module
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._lazy_module is not None
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<lazy module '{self._lazy_name}' ({state})>"
@@ -0,0 +1,112 @@
+"""
+Latency, memory and parity of the int8 ONNX text encoder against PyTorch.
+
+Each backend is loaded by the server's EmbeddingModelLoader in its own
+spawned process, so load time and peak RSS (through loading, and through
+the queries) are measured in isolation. Both then embed the same prompts,
+one query at a time as searches do, and the PyTorch vectors are the
+reference for per-prompt cosine parity:
+
+    python -m video_editor_mcp.onnx_benchmark --queries 100
+
+Needs torch, transformers and the `onnx` extra; the first ONNX run exports
+and quantizes the text tower, which is reported as part of its load time.
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .onnx_text_encoder import PARITY_PROBES, cosine_parity
+
+BENCHMARK_PROMPTS = PARITY_PROBES + [
+    "sunset",
+    "person explaining a chart on a whiteboard in a meeting room",
+    "slow motion water splash",
+    "a red car driving through a forest road in autumn with leaves falling",
+    "interview",
+    "kids playing football in the rain",
+]
+
+BACKENDS = ("torch", "onnx")
+
+
+def _measure(backend: str, n_queries: int, load_timeout: float) -> dict:
+    """Runs in a fresh process: load one backend, time queries, report RSS"""
+    from .embedding_model import EmbeddingModelLoader
+    from .timings import max_rss_mb
+
+    loader = EmbeddingModelLoader(backend=backend, load_mode="text")
+    started = time.perf_counter()
+    if not asyncio.run(loader.wait_ready(timeout=load_timeout)):
+        raise RuntimeError(f"{backend} backend not ready: {loader.status()}")
+    load_seconds = time.perf_counter() - started
+    if loader.backend != backend:
+        raise RuntimeError(f"{backend} backend fell back to {loader.backend}")
+    load_peak_rss = max_rss_mb()
+
+    encoder = loader.text_encoder
+    embeddings = np.asarray(encoder.encode_text(BENCHMARK_PROMPTS))
+    samples = []
+    for i in range(n_queries):
+        query = BENCHMARK_PROMPTS[i % len(BENCHMARK_PROMPTS)]
+        query_started = time.perf_counter()
+        encoder.encode_text([query])
+        samples.append(time.perf_counter() - query_started)
+    p50, p95, p99 = np.percentile(1000 * np.asarray(samples), [50, 95, 99])
+    return {
+        "load_s": load_seconds,
+        "p50_ms": p50,
+        "p95_ms": p95,
+        "p99_ms": p99,
+        "load_peak_rss_mb": load_peak_rss,
+        "peak_rss_mb": max_rss_mb(),
+        "embeddings": embeddings,
+    }
+
+
+def run_benchmark(n_queries: int = 100, load_timeout: float = 1800) -> dict:
+    report = {}
+    for backend in BACKENDS:
+        # spawn, not fork: a forked child would inherit the parent's RSS
+        with ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            report[backend] = pool.submit(
+                _measure, backend, n_queries, load_timeout
+            ).result()
+    parity = cosine_parity(report["torch"]["embeddings"], report["onnx"]["embeddings"])
+    report["parity"] = dict(zip(BENCHMARK_PROMPTS, parity.tolist()))
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument(
+        "--load-timeout",
+        type=float,
+        default=1800,
+        help="Seconds to wait for each backend, including downloads and export",
+    )
+    args = parser.parse_args()
+    report = run_benchmark(args.queries, args.load_timeout)
+    print(
+        f"{'backend':<10}{'load s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+        f"{'load MB':>10}{'peak MB':>10}"
+    )
+    for backend in BACKENDS:
+        stats = report[backend]
+        print(
+            f"{backend:<10}{stats['load_s']:>10.1f}{stats['p50_ms']:>10.2f}"
+            f"{stats['p95_ms']:>10.2f}{stats['p99_ms']:>10.2f}"
+            f"{stats['load_peak_rss_mb'] or 0:>10.0f}{stats['peak_rss_mb'] or 0:>10.0f}"
+        )
+    print("\ncosine parity (onnx int8 vs torch)")
+    for prompt, cosine in report["parity"].items():
+        print(f"  {cosine:.4f}  {prompt}")
+    print(f"  {min(report['parity'].values()):.4f}  min")
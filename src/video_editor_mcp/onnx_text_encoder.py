@@ -0,0 +1,186 @@
+import gc
+import logging
+import os
+import threading
+from typing import List, Optional, Union
+
+import numpy as np
+
+DEFAULT_ONNX_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "video-editor-mcp", "onnx"
+)
+
+# Sentences used to check the quantized export against the PyTorch model
+PARITY_PROBES = [
+    "a dog running on the beach",
+    "crowd cheering at a concert",
+    "close up of hands typing on a laptop keyboard",
+    "aerial drone shot of a city skyline at night",
+]
+
+
+class OnnxTextEncoder:
+    """
+    int8-quantized ONNX Runtime export of the jina-clip text tower.
+
+    The export is built once from the PyTorch model and cached on disk, after
+    which only the (much smaller) quantized text graph and the tokenizer are
+    loaded - the PyTorch weights never need to be resident again.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        cache_dir: str = DEFAULT_ONNX_DIR,
+        max_length: int = 512,
+        min_parity: float = 0.98,
+    ):
+        self.model_name = model_name
+        self.model_dir = os.path.join(cache_dir, model_name.replace("/", "--"))
+        self.max_length = max_length
+        self.min_parity = min_parity
+        self._session = None
+        self._tokenizer = None
+        self._lock = threading.Lock()
+
+    @property
+    def fp32_path(self) -> str:
+        return os.path.join(self.model_dir, "text_model.onnx")
+
+    @property
+    def int8_path(self) -> str:
+        return os.path.join(self.model_dir, "text_model.int8.onnx")
+
+    @property
+    def is_exported(self) -> bool:
+        return os.path.exists(self.int8_path)
+
+    def export(self, torch_model):
+        """Export the text tower to ONNX, quantize it and verify parity"""
+        import torch
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        class TextTower(torch.nn.Module):
+            def __init__(self, model):
+                super().__init__()
+                self.model = model
+
+            def forward(self, input_ids):
+                return self.model.get_text_features(input_ids)
+
+        os.makedirs(self.model_dir, exist_ok=True)
+        tokenizer = self._load_tokenizer()
+        sample = tokenizer(PARITY_PROBES[:2], padding=True, return_tensors="pt")
+
+        torch_model.eval()
+        with torch.no_grad():
+            torch.onnx.export(
+                TextTower(torch_model),
+                (sample["input_ids"],),
+                self.fp32_path,
+                input_names=["input_ids"],
+                output_names=["text_embeds"],
+                dynamic_axes={
+                    "input_ids": {0: "batch", 1: "sequence"},
+                    "text_embeds": {0: "batch"},
+                },
+                opset_version=17,
+            )
+
+        tmp_path = f"{self.int8_path}.tmp"
+        quantize_dynamic(self.fp32_path, tmp_path, weight_type=QuantType.QInt8)
+
+        # Refuse the export if quantization moved embeddings too far
+        reference = np.asarray(torch_model.encode_text(PARITY_PROBES))
+        self._session = None
+        quantized = self._run(tmp_path, PARITY_PROBES)
+        parity = float(np.min(cosine_parity(reference, quantized)))
+        logging.info(
+            f"ONNX int8 text encoder parity with PyTorch: min cosine {parity:.4f}"
+        )
+        if parity < self.min_parity:
+            os.remove(tmp_path)
+            raise RuntimeError(
+                f"Quantized text encoder cosine similarity {parity:.4f} is below {self.min_parity}"
+            )
+        os.replace(tmp_path, self.int8_path)
+        os.remove(self.fp32_path)
+
+    def load(self, torch_model_factory=None):
+        """
+        Load the quantized session, exporting it first if needed.
+
+        `torch_model_factory` is only called when there is no export on disk yet.
+        """
+        with self._lock:
+            if self._session is not None:
+                return
+            if not self.is_exported:
+                if torch_model_factory is None:
+                    raise RuntimeError(f"No ONNX export found at {self.int8_path}")
+                torch_model = torch_model_factory()
+                self.export(torch_model)
+                del torch_model
+                gc.collect()
+            self._session = self._create_session(self.int8_path)
+            self._load_tokenizer()
+            logging.info(f"Loaded ONNX int8 text encoder from {self.int8_path}")
+
+    def _load_tokenizer(self):
+        if self._tokenizer is None:
+            from transformers import AutoTokenizer
+
+            self._tokenizer = AutoTokenizer.from_pretrained(
+                self.model_name, trust_remote_code=True
+            )
+        return self._tokenizer
+
+    @staticmethod
+    def _create_session(path: str):
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        return ort.InferenceSession(
+            path, sess_options=options, providers=["CPUExecutionProvider"]
+        )
+
+    def _run(self, path: str, texts: List[str]) -> np.ndarray:
+        session = self._session or self._create_session(path)
+        tokens = self._load_tokenizer()(
+            texts,
+            padding=True,
+            truncation=True,
+            max_length=self.max_length,
+            return_tensors="np",
+        )
+        (embeddings,) = session.run(
+            None, {"input_ids": tokens["input_ids"].astype(np.int64)}
+        )
+        return _normalize(embeddings)
+
+    def encode_text(
+        self,
+        texts: Union[str, List[str]],
+        truncate_dim: Optional[int] = None,
+        task: Optional[str] = None,
+    ) -> np.ndarray:
+        """Mirrors the PyTorch model's encode_text: normalized numpy embeddings"""
+        if self._session is None:
+            raise RuntimeError("ONNX text encoder has not been loaded")
+        single = isinstance(texts, str)
+        embeddings = self._run(self.int8_path, [texts] if single else list(texts))
+        if truncate_dim:
+            # Matryoshka truncation: keep the leading dims and re-normalize
+            embeddings = _normalize(embeddings[:, :truncate_dim])
+        return embeddings[0] if single else embeddings
+
+
+def cosine_parity(reference: np.ndarray, candidate: np.ndarray) -> np.ndarray:
+    """Row-wise cosine similarity between two backends' embeddings of the same inputs"""
+    return np.sum(_normalize(reference) * _normalize(candidate), axis=1)
+
+
+def _normalize(embeddings: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(embeddings, axis=-1, keepdims=True)
+    return embeddings / np.maximum(norms, 1e-12)
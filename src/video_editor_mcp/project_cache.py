@@ -0,0 +1,96 @@
+import asyncio
+import os
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+from .cache import TTLCache
+
+# Seconds a fetched project or edit is reused; kept short because other
+# clients can change projects too
+PROJECT_CACHE_TTL = float(os.environ.get("VJ_PROJECT_CACHE_TTL", "5"))
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key into one: the first caller
+    starts the call and everyone arriving before it finishes awaits its
+    result (or exception). A caller being cancelled doesn't cancel the call
+    for the others.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._calls.get(key)
+        if task is None:
+            self.calls += 1
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+
+class ProjectCache:
+    """
+    Short-TTL cache of projects and edits in front of single-flight fetches.
+
+    Each project has a local version, bumped by `invalidate` whenever this
+    server changes the project (rendering or updating an edit). Fetches are
+    coalesced per (key, version) and only cached if the version is unchanged
+    when they return, so a fetch that raced a change is never served after it.
+    """
+
+    def __init__(
+        self,
+        fetch_project: Callable[[str], Awaitable[Any]],
+        fetch_edit: Callable[[str, str], Awaitable[dict]],
+        ttl: float = PROJECT_CACHE_TTL,
+        max_entries: int = 256,
+    ):
+        self._fetch_project = fetch_project
+        self._fetch_edit = fetch_edit
+        self._cache = TTLCache(ttl, max_entries=max_entries, touch_on_read=False)
+        self._flight = SingleFlight()
+        self._versions: Dict[str, int] = {}
+
+    async def _get(self, key: Tuple[str, ...], fetch: Callable[[], Awaitable[Any]]):
+        version = self._versions.get(key[1], 0)
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        value = await self._flight.do((key, version), fetch)
+        if self._versions.get(key[1], 0) == version:
+            self._cache.set(key, (version, value))
+        return value
+
+    async def get(self, project_id: str):
+        project_id = str(project_id)
+        return await self._get(
+            ("project", project_id), lambda: self._fetch_project(project_id)
+        )
+
+    async def get_edit(self, project_id: str, edit_id: str) -> dict:
+        project_id, edit_id = str(project_id), str(edit_id)
+        return await self._get(
+            ("edit", project_id, edit_id),
+            lambda: self._fetch_edit(project_id, edit_id),
+        )
+
+    def invalidate(self, project_id: str):
+        """Drop a project and its edits, e.g. after changing one of them"""
+        project_id = str(project_id)
+        self._versions[project_id] = self._versions.get(project_id, 0) + 1
+        for key, _ in self._cache.items():
+            if key[1] == project_id:
+                self._cache.pop(key)
+
+    def stats(self) -> dict:
+        return {
+            **self._cache.stats(),
+            "upstream_calls": self._flight.calls,
+            "coalesced": self._flight.coalesced,
+        }
@@ -0,0 +1,286 @@
+import logging
+from typing import Callable, Dict, List, Optional
+
+from .lazy_imports import LazyModule
+from .segments import SegmentIndex, to_seconds
+
+np = LazyModule("numpy")
+
+FUSION_METHODS = ("rrf", "weighted")
+
+# Fields of keyword videos and embedding matches the search result formatters
+# read; FusedResults drops everything else
+VIDEO_FIELDS = ("video_id", "script", "matching_segments", "video")
+VIDEO_DETAIL_FIELDS = ("name", "url", "generated_description")
+SEGMENT_FIELDS = ("start_seconds", "end_seconds")
+MATCH_FIELDS = ("video_id", "timepoint", "description", "detected_items")
+# format_video_info shows the first 200 characters of a script, then "..."
+SCRIPT_CHARS = 201
+
+
+def _pick(item: dict, fields) -> dict:
+    return {field: item[field] for field in fields if field in item}
+
+
+def slim_video(video: dict) -> dict:
+    """Copy of a keyword video with only the fields its result is shown with"""
+    slim = _pick(video, VIDEO_FIELDS)
+    if isinstance(slim.get("script"), str):
+        slim["script"] = slim["script"][:SCRIPT_CHARS]
+    if isinstance(slim.get("video"), dict):
+        slim["video"] = _pick(slim["video"], VIDEO_DETAIL_FIELDS)
+    if slim.get("matching_segments"):
+        slim["matching_segments"] = [
+            _pick(segment, SEGMENT_FIELDS) for segment in slim["matching_segments"]
+        ]
+    return slim
+
+
+def slim_match(match: dict) -> dict:
+    """Copy of an embedding match with only the fields its result is shown with"""
+    return _pick(match, MATCH_FIELDS)
+
+
+def _keyword_candidates(videos: List[dict]) -> List[dict]:
+    """
+    One candidate per matching video, spanning all of its matching segments,
+    so a video with many matching scenes counts as a single keyword hit
+    """
+    candidates = []
+    for rank, video in enumerate(videos):
+        segments = video.get("matching_segments") or []
+        starts = [to_seconds(s.get("start_seconds")) for s in segments]
+        ends = [to_seconds(s.get("end_seconds")) for s in segments]
+        bounded = segments and None not in starts and None not in ends
+        candidates.append(
+            {
+                "video_id": str(video.get("video_id")),
+                "start": min(starts) if bounded else None,
+                "end": max(ends) if bounded else None,
+                "keyword_rank": rank,
+                "video": video,
+                "segments": segments,
+            }
+        )
+    return candidates
+
+
+def _embedding_candidates(results: List[dict]) -> List[dict]:
+    candidates = []
+    for rank, result in enumerate(results):
+        timepoint = to_seconds(result.get("timepoint"))
+        candidates.append(
+            {
+                "video_id": str(result.get("video_id")),
+                "start": timepoint,
+                "end": timepoint,
+                "embedding_rank": rank,
+                "embedding_score": result.get("score"),
+                "match": result,
+            }
+        )
+    return candidates
+
+
+def _overlaps(group: dict, candidate: dict, merge_gap: float) -> bool:
+    # Segments without bounds cover the whole video
+    if group["start"] is None or candidate["start"] is None:
+        return True
+    return (
+        candidate["start"] <= group["end"] + merge_gap
+        and group["start"] <= candidate["end"] + merge_gap
+    )
+
+
+def _merge(candidates: List[dict], merge_gap: float) -> List[dict]:
+    """
+    Merge candidates for the same video whose segments overlap (or are within
+    `merge_gap` seconds), keeping the best rank each leg gave the group.
+    """
+    groups: List[dict] = []
+    by_video: dict = {}
+    for candidate in candidates:
+        video_groups = by_video.setdefault(candidate["video_id"], [])
+        group = next(
+            (g for g in video_groups if _overlaps(g, candidate, merge_gap)), None
+        )
+        if group is None:
+            group = {
+                "video_id": candidate["video_id"],
+                "start": candidate["start"],
+                "end": candidate["end"],
+                "keyword_rank": None,
+                "embedding_rank": None,
+                "embedding_score": None,
+                "video": None,
+                "segments": [],
+                "matches": [],
+            }
+            video_groups.append(group)
+            groups.append(group)
+        elif group["start"] is not None and candidate["start"] is not None:
+            group["start"] = min(group["start"], candidate["start"])
+            group["end"] = max(group["end"], candidate["end"])
+        elif candidate["start"] is None:
+            group["start"] = group["end"] = None
+
+        if "keyword_rank" in candidate:
+            if (
+                group["keyword_rank"] is None
+                or candidate["keyword_rank"] < group["keyword_rank"]
+            ):
+                group["keyword_rank"] = candidate["keyword_rank"]
+            group["video"] = group["video"] or candidate["video"]
+            group["segments"].extend(candidate["segments"])
+        else:
+            if (
+                group["embedding_rank"] is None
+                or candidate["embedding_rank"] < group["embedding_rank"]
+            ):
+                group["embedding_rank"] = candidate["embedding_rank"]
+                group["embedding_score"] = candidate["embedding_score"]
+            group["matches"].append(candidate["match"])
+    return groups
+
+
+def _leg_scores(
+    ranks: "np.ndarray", scores: "np.ndarray", method: str, rrf_k: float
+) -> "np.ndarray":
+    """Per-leg contribution; NaN ranks (not retrieved by this leg) score 0"""
+    present = ~np.isnan(ranks)
+    contribution = np.zeros(len(ranks))
+    if not present.any():
+        return contribution
+    if method == "rrf":
+        contribution[present] = 1.0 / (rrf_k + ranks[present] + 1)
+        return contribution
+    # weighted: min-max normalized similarity, falling back to rank position
+    values = np.where(np.isnan(scores), -ranks, scores)[present]
+    spread = values.max() - values.min()
+    contribution[present] = (values - values.min()) / spread if spread else 1.0
+    return contribution
+
+
+def fuse_results(
+    videos: List[dict],
+    embedding_results: List[dict],
+    method: str = "rrf",
+    rrf_k: float = 60.0,
+    keyword_weight: float = 1.0,
+    embedding_weight: float = 1.0,
+    merge_gap: float = 2.0,
+    top_k: Optional[int] = None,
+) -> List[dict]:
+    """
+    Hybrid ranking of keyword (vj.video_files.search) and embedding search
+    results.
+
+    Candidates from both legs are merged by video_id and overlapping segment,
+    then scored with reciprocal rank fusion, sum(weight / (rrf_k + rank)), or a
+    weighted sum of per-leg normalized scores. Returns the top_k groups, best
+    first, each with the keyword `video` and its `segments` in the group (if
+    any), the embedding `matches` that fell inside it and the fused `score`.
+    """
+    if method not in FUSION_METHODS:
+        logging.warning(f"Unknown fusion method {method}, using rrf")
+        method = "rrf"
+
+    groups = _merge(
+        _keyword_candidates(videos) + _embedding_candidates(embedding_results),
+        merge_gap,
+    )
+    if not groups:
+        return []
+
+    def column(field):
+        return np.array(
+            [np.nan if g[field] is None else g[field] for g in groups], dtype=float
+        )
+
+    fused = keyword_weight * _leg_scores(
+        column("keyword_rank"), np.full(len(groups), np.nan), method, rrf_k
+    ) + embedding_weight * _leg_scores(
+        column("embedding_rank"), column("embedding_score"), method, rrf_k
+    )
+
+    # Stable sort keeps the original leg order among ties
+    order = np.argsort(-fused, kind="stable")
+    if top_k is not None:
+        order = order[:top_k]
+    return [{**groups[i], "score": float(fused[i])} for i in order]
+
+
+class FusedResults:
+    """
+    Compact, array-backed form of fuse_results output for pagination caches.
+
+    Scores and segment bounds live in numpy arrays; keyword videos and
+    embedding matches are stored once in a shared `meta` list and referenced
+    by offset, so a video that matched several segments isn't held (or
+    formatted) more than once. Only the fields the formatters show are kept
+    (see slim_video / slim_match). Result dicts are rebuilt only for the page
+    being shown.
+    """
+
+    def __init__(self, fused: List[dict]):
+        self.meta: List[dict] = []
+        offsets: Dict[int, int] = {}
+
+        def offset(item: dict, slim: Callable[[dict], dict]) -> int:
+            if id(item) not in offsets:
+                offsets[id(item)] = len(self.meta)
+                self.meta.append(slim(item))
+            return offsets[id(item)]
+
+        def bound(value) -> float:
+            return np.nan if value is None else value
+
+        self.video_ids = [result["video_id"] for result in fused]
+        self.scores = np.array([r["score"] for r in fused], dtype=np.float32)
+        self.starts = np.array([bound(r["start"]) for r in fused], dtype=np.float32)
+        self.ends = np.array([bound(r["end"]) for r in fused], dtype=np.float32)
+        self.video_offsets = np.array(
+            [
+                -1 if r["video"] is None else offset(r["video"], slim_video)
+                for r in fused
+            ],
+            dtype=np.int32,
+        )
+        match_offsets: List[int] = []
+        match_bounds = [0]
+        for result in fused:
+            match_offsets.extend(
+                offset(match, slim_match) for match in result["matches"]
+            )
+            match_bounds.append(len(match_offsets))
+        self.match_offsets = np.array(match_offsets, dtype=np.int32)
+        self.match_bounds = np.array(match_bounds, dtype=np.int32)
+        # Scenes of the keyword videos, to find each group's scenes by overlap
+        self.segments = SegmentIndex.from_videos(
+            self.meta[i] for i in sorted(set(self.video_offsets.tolist())) if i >= 0
+        )
+
+    def __len__(self) -> int:
+        return len(self.video_ids)
+
+    def __getitem__(self, i: int) -> dict:
+        start = None if np.isnan(self.starts[i]) else float(self.starts[i])
+        end = None if np.isnan(self.ends[i]) else float(self.ends[i])
+        video = self.meta[self.video_offsets[i]] if self.video_offsets[i] >= 0 else None
+        segments = []
+        if video is not None and start is not None:
+            # A keyword group's segments are the video's scenes inside its bounds
+            segments = self.segments.overlapping(self.video_ids[i], start, end)
+        lo, hi = self.match_bounds[i], self.match_bounds[i + 1]
+        return {
+            "video_id": self.video_ids[i],
+            "start": start,
+            "end": end,
+            "score": float(self.scores[i]),
+            "video": video,
+            "segments": segments,
+            "matches": [self.meta[j] for j in self.match_offsets[lo:hi]],
+        }
+
+    def page(self, start: int, end: int) -> List[dict]:
+        return [self[i] for i in range(start, min(end, len(self)))]
@@ -0,0 +1,303 @@
+import asyncio
+import contextvars
+import logging
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Awaitable, Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+import requests
+
+# Cap on a single attempt, and the retry schedule for idempotent requests
+REQUEST_TIMEOUT = float(os.environ.get("VJ_REQUEST_TIMEOUT", "60"))
+RETRY_ATTEMPTS = int(os.environ.get("VJ_RETRY_ATTEMPTS", "3"))
+RETRY_BASE_DELAY = float(os.environ.get("VJ_RETRY_BASE_DELAY", "0.25"))
+RETRY_MAX_DELAY = 4.0
+
+# Consecutive failures before a host's breaker opens, and seconds it stays open
+BREAKER_THRESHOLD = int(os.environ.get("VJ_BREAKER_THRESHOLD", "5"))
+BREAKER_RESET = float(os.environ.get("VJ_BREAKER_RESET", "30"))
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+TRANSIENT_ERRORS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+    httpx.TransportError,
+)
+
+# POSTs that only read, and so are safe to retry
+IDEMPOTENT_POSTS = ("/video-file/search", "/video-file/embedding-search")
+
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "vj_deadline", default=None
+)
+
+
+class DeadlineExceeded(TimeoutError):
+    pass
+
+
+class CircuitOpenError(RuntimeError):
+    pass
+
+
+@contextmanager
+def call_deadline(seconds: Optional[float]):
+    """
+    Bound every outbound call made inside the block (including in executor
+    threads it hands work to) to finish within `seconds`. Nested deadlines
+    only ever shorten the outer one.
+    """
+    if seconds is None:
+        yield
+        return
+    deadline = time.monotonic() + seconds
+    outer = _deadline.get()
+    token = _deadline.set(deadline if outer is None else min(outer, deadline))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left before the current deadline, None if there is none"""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+class CircuitBreaker:
+    """
+    closed -> open after `threshold` consecutive failures; open rejects calls
+    for `reset_timeout` seconds, then half-open lets one trial call through
+    whose outcome closes or re-opens the breaker.
+    """
+
+    def __init__(self, name: str, threshold: int, reset_timeout: float, metrics):
+        self.name = name
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_running = False
+        self._metrics = metrics
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        with self._lock:
+            if self.state == "open":
+                wait = self._opened_at + self.reset_timeout - time.monotonic()
+                if wait > 0:
+                    self._metrics.count("breaker_rejections")
+                    raise CircuitOpenError(
+                        f"{self.name} is failing, not calling it for another {wait:.1f}s"
+                    )
+                self.state = "half-open"
+            if self.state == "half-open":
+                if self._trial_running:
+                    self._metrics.count("breaker_rejections")
+                    raise CircuitOpenError(
+                        f"{self.name} is recovering, try again shortly"
+                    )
+                self._trial_running = True
+
+    def release(self):
+        """End a call that neither succeeded nor failed (e.g. was cancelled)"""
+        with self._lock:
+            self._trial_running = False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._trial_running = False
+            if self.state != "closed":
+                logging.info(f"Circuit breaker for {self.name} closed")
+            self.state = "closed"
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._trial_running = False
+            if self.state == "half-open" or (
+                self.state == "closed" and self._failures >= self.threshold
+            ):
+                self.state = "open"
+                self._opened_at = time.monotonic()
+                self._metrics.count("breaker_trips")
+                logging.warning(
+                    f"Circuit breaker for {self.name} opened after {self._failures} failures"
+                )
+
+
+class ResilienceMetrics:
+    def __init__(self):
+        self._counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def count(self, name: str):
+        with self._lock:
+            self._counts[name] = self._counts.get(name, 0) + 1
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+
+class Resilience:
+    """
+    Deadlines, jittered exponential retries and per-host circuit breakers
+    around outbound HTTP calls.
+
+    `send(timeout)` makes one attempt and returns the response. Connection
+    errors, timeouts, 429 and 5xx responses are retried for idempotent
+    requests while the deadline allows; the last response or error is handed
+    back to the caller unchanged, so existing raise_for_status handling
+    keeps working.
+    """
+
+    def __init__(
+        self,
+        attempts: int = RETRY_ATTEMPTS,
+        base_delay: float = RETRY_BASE_DELAY,
+        max_delay: float = RETRY_MAX_DELAY,
+        request_timeout: float = REQUEST_TIMEOUT,
+        breaker_threshold: int = BREAKER_THRESHOLD,
+        breaker_reset: float = BREAKER_RESET,
+    ):
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.request_timeout = request_timeout
+        self.breaker_threshold = breaker_threshold
+        self.breaker_reset = breaker_reset
+        self.metrics = ResilienceMetrics()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, url: str) -> CircuitBreaker:
+        host = urlsplit(url).netloc
+        with self._lock:
+            if host not in self._breakers:
+                self._breakers[host] = CircuitBreaker(
+                    host, self.breaker_threshold, self.breaker_reset, self.metrics
+                )
+            return self._breakers[host]
+
+    @staticmethod
+    def idempotent(method: str, url: str) -> bool:
+        method = method.upper()
+        if method == "POST":
+            return urlsplit(url).path.rstrip("/").endswith(IDEMPOTENT_POSTS)
+        return method in ("GET", "HEAD", "PUT", "DELETE", "OPTIONS")
+
+    def _timeout(self) -> float:
+        left = remaining()
+        if left is None:
+            return self.request_timeout
+        if left <= 0:
+            self.metrics.count("deadline_exceeded")
+            raise DeadlineExceeded("Deadline for this call has passed")
+        return min(self.request_timeout, left)
+
+    def _backoff(self, attempt: int) -> Optional[float]:
+        """Full-jitter delay before the next attempt, None if past the deadline"""
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+        left = remaining()
+        if left is not None and delay >= left:
+            return None
+        self.metrics.count("retries")
+        return delay
+
+    def _outcome(self, breaker: CircuitBreaker, response, error) -> bool:
+        """Record an attempt on the breaker; True if it is worth retrying"""
+        if error is None and response.status_code not in RETRY_STATUSES:
+            # 4xx are the caller's problem, not a sign the API is degraded
+            breaker.record_success()
+            return False
+        breaker.record_failure()
+        self.metrics.count("failures")
+        return True
+
+    def call(
+        self,
+        method: str,
+        url: str,
+        send: Callable[[float], requests.Response],
+        idempotent: Optional[bool] = None,
+    ) -> requests.Response:
+        breaker = self.breaker(url)
+        retryable = self.idempotent(method, url) if idempotent is None else idempotent
+        attempts = self.attempts if retryable else 1
+        for attempt in range(attempts):
+            timeout = self._timeout()
+            breaker.before_call()
+            response, error = None, None
+            try:
+                response = send(timeout)
+            except TRANSIENT_ERRORS as e:
+                error = e
+            except BaseException:
+                breaker.release()
+                raise
+            if not self._outcome(breaker, response, error):
+                return response
+            delay = self._backoff(attempt) if attempt + 1 < attempts else None
+            if delay is None:
+                break
+            logging.info(
+                f"Retrying {method} {url} in {delay:.2f}s after {error or response.status_code}"
+            )
+            time.sleep(delay)
+        if error is not None:
+            raise error
+        return response
+
+    async def acall(
+        self,
+        method: str,
+        url: str,
+        send: Callable[[float], Awaitable[httpx.Response]],
+        idempotent: Optional[bool] = None,
+    ) -> httpx.Response:
+        breaker = self.breaker(url)
+        retryable = self.idempotent(method, url) if idempotent is None else idempotent
+        attempts = self.attempts if retryable else 1
+        for attempt in range(attempts):
+            timeout = self._timeout()
+            breaker.before_call()
+            response, error = None, None
+            try:
+                response = await send(timeout)
+            except TRANSIENT_ERRORS as e:
+                error = e
+            except BaseException:
+                # Includes cancellation by an outer asyncio deadline
+                breaker.release()
+                raise
+            if not self._outcome(breaker, response, error):
+                return response
+            delay = self._backoff(attempt) if attempt + 1 < attempts else None
+            if delay is None:
+                break
+            logging.info(
+                f"Retrying {method} {url} in {delay:.2f}s after {error or response.status_code}"
+            )
+            await asyncio.sleep(delay)
+        if error is not None:
+            raise error
+        return response
+
+    def stats(self) -> dict:
+        with self._lock:
+            breakers = {host: b.state for host, b in self._breakers.items()}
+        return {**self.metrics.snapshot(), "breakers": breakers}
+
+
+# Shared by the sync session, the async client and the embedding search
+resilience = Resilience()
@@ -0,0 +1,142 @@
+"""
+Response size and formatting time of search and asset pages per response_mode
+and max_response_bytes.
+
+Formats pages of synthetic fused search results and asset listings the way
+search-remote-videos and get-project-assets do, and reports the bytes and
+estimated tokens sent back plus the time spent formatting. Runs fully offline:
+
+    VJ_API_KEY=offline python -m video_editor_mcp.response_benchmark \\
+        --items-per-page 10 --budgets 0 4096 16384
+"""
+
+import argparse
+import json
+import time
+from typing import List, Optional
+
+import numpy as np
+
+from . import server as mcp_server
+from .cache_benchmark import asset_responses, search_responses
+from .ranking import FusedResults, fuse_results
+from .response_budget import ASSET_COLUMNS, FUSED_COLUMNS, RESPONSE_MODES
+
+# Rough bytes per token of English text, for the token estimate
+BYTES_PER_TOKEN = 4
+
+
+def _pages(responses: List[str], kind: str, items_per_page: int) -> List[list]:
+    pages = []
+    for response in responses:
+        if kind == "search":
+            videos, matches = json.loads(response)
+            results = FusedResults(fuse_results(videos, matches))
+            pages.append(results.page(0, items_per_page))
+        else:
+            assets = [mcp_server.compact_asset(a) for a in json.loads(response)]
+            pages.append(assets[:items_per_page])
+    return pages
+
+
+def _measure(pages: List[list], kind: str, mode: str, budget: Optional[int]) -> dict:
+    if kind == "search":
+        formatters = (
+            mcp_server.format_fused_result,
+            mcp_server.compact_fused_row,
+            FUSED_COLUMNS,
+        )
+    else:
+        formatters = (
+            mcp_server.format_asset_info,
+            mcp_server.compact_asset_row,
+            ASSET_COLUMNS,
+        )
+    arguments = {"response_mode": mode, "max_response_bytes": budget}
+    sizes, samples, omitted = [], [], 0
+    for items in pages:
+        response_text = [f"Results (Page 1, showing {len(items)} items)"]
+        started = time.perf_counter()
+        mcp_server._extend_page(response_text, items, *formatters, arguments, 1)
+        text = "\n".join(response_text)
+        samples.append(time.perf_counter() - started)
+        sizes.append(len(text.encode("utf-8")))
+        omitted += "omitted to fit" in response_text[-1]
+    return {
+        "mean_bytes": float(np.mean(sizes)),
+        "max_bytes": int(np.max(sizes)),
+        "mean_tokens": float(np.mean(sizes)) / BYTES_PER_TOKEN,
+        "p50_ms": float(1000 * np.median(samples)),
+        "truncated_pages": omitted,
+    }
+
+
+def run_benchmark(
+    pages: int = 50,
+    items_per_page: int = 10,
+    budgets: List[Optional[int]] = (None, 4096, 16384),
+    analysis_scenes: int = 200,
+) -> dict:
+    kinds = {
+        "search": _pages(
+            search_responses(pages, 2 * items_per_page, analysis_scenes),
+            "search",
+            items_per_page,
+        ),
+        "assets": _pages(
+            asset_responses(pages, items_per_page, analysis_scenes),
+            "assets",
+            items_per_page,
+        ),
+    }
+    rows = []
+    for kind, kind_pages in kinds.items():
+        for mode in RESPONSE_MODES:
+            for budget in budgets:
+                rows.append(
+                    {
+                        "kind": kind,
+                        "mode": mode,
+                        "budget": budget,
+                        **_measure(kind_pages, kind, mode, budget),
+                    }
+                )
+    return {"pages": pages, "items_per_page": items_per_page, "rows": rows}
+
+
+def print_report(report: dict):
+    print(f"{report['pages']} pages of {report['items_per_page']} items")
+    print(
+        f"{'kind':<8}{'mode':<9}{'budget':>8}{'mean B':>10}{'max B':>10}"
+        f"{'~tokens':>9}{'p50 ms':>9}{'truncated':>11}"
+    )
+    for row in report["rows"]:
+        print(
+            f"{row['kind']:<8}{row['mode']:<9}{row['budget'] or '-':>8}"
+            f"{row['mean_bytes']:>10.0f}{row['max_bytes']:>10}"
+            f"{row['mean_tokens']:>9.0f}{row['p50_ms']:>9.2f}"
+            f"{row['truncated_pages']:>11}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--pages", type=int, default=50)
+    parser.add_argument("--items-per-page", type=int, default=10)
+    parser.add_argument(
+        "--budgets",
+        type=int,
+        nargs="+",
+        default=[0, 4096, 16384],
+        help="max_response_bytes values to try; 0 means no budget",
+    )
+    parser.add_argument("--analysis-scenes", type=int, default=200)
+    args = parser.parse_args()
+    print_report(
+        run_benchmark(
+            pages=args.pages,
+            items_per_page=args.items_per_page,
+            budgets=[budget or None for budget in args.budgets],
+            analysis_scenes=args.analysis_scenes,
+        )
+    )
@@ -0,0 +1,100 @@
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from .segments import SegmentIndex
+
+RESPONSE_MODES = ("full", "compact")
+
+# Room left for headers, notes and navigation when budgeting a page's items
+RESERVED_BYTES = 512
+
+FUSED_COLUMNS = "video_id | score | name | scenes | description"
+ASSET_COLUMNS = "id | type | name | status | duration | created"
+
+
+def _clip(value, limit: int) -> str:
+    text = " ".join(str(value).split()) if value is not None else "-"
+    return text if len(text) <= limit else text[: limit - 1] + "…"
+
+
+def compact_fused_row(result: dict) -> str:
+    """One line per fused search result, scenes coalesced and text clipped"""
+    video = result.get("video") or {}
+    details = video.get("video") or {}
+    matches = result.get("matches") or []
+
+    index = SegmentIndex()
+    for segment in result.get("segments") or video.get("matching_segments") or []:
+        index.add(
+            result["video_id"], segment.get("start_seconds"), segment.get("end_seconds")
+        )
+    for match in matches:
+        index.add(result["video_id"], match.get("timepoint"), match.get("timepoint"))
+    scenes = index.coalesce(result["video_id"], gap=1.0)
+    scene_text = ",".join(f"{start:g}-{end:g}" for start, end in scenes[:3])
+    if len(scenes) > 3:
+        scene_text += f",+{len(scenes) - 3}"
+
+    description = details.get("generated_description") or (
+        matches[0].get("description") if matches else None
+    )
+    return " | ".join(
+        [
+            str(result["video_id"]),
+            f"{result.get('score', 0.0):.3f}",
+            _clip(details.get("name"), 40),
+            scene_text or "-",
+            _clip(description, 80),
+        ]
+    )
+
+
+def compact_asset_row(asset: dict) -> str:
+    """One line per asset; analysis dumps, URLs and clip lists are left out"""
+    return " | ".join(
+        [
+            str(asset.get("id", "-")),
+            str(asset.get("type", asset.get("asset_type", "-"))),
+            _clip(asset.get("name", asset.get("keyname")), 40),
+            str(asset.get("status", "-")),
+            str(asset.get("duration", "-")),
+            _clip(asset.get("created_at"), 19),
+        ]
+    )
+
+
+def budget_items(
+    items: Sequence,
+    format_item: Callable[..., str],
+    max_bytes: Optional[int],
+    used_bytes: int = 0,
+) -> Tuple[List[str], int]:
+    """
+    Format items in order while they fit in `max_bytes` (UTF-8, including
+    what the caller has `used_bytes` for). Items past the budget are never
+    formatted. Returns the formatted items and how many were omitted.
+    """
+    if max_bytes is None:
+        return [format_item(item) for item in items], 0
+
+    remaining = max_bytes - used_bytes - RESERVED_BYTES
+    formatted: List[str] = []
+    for item in items:
+        text = format_item(item)
+        size = len(text.encode("utf-8")) + 1
+        if size > remaining:
+            if not formatted and remaining > 0:
+                # Show a truncated first item rather than nothing at all
+                clipped = text.encode("utf-8")[: max(remaining - 4, 0)]
+                formatted.append(clipped.decode("utf-8", errors="ignore") + "…")
+            break
+        formatted.append(text)
+        remaining -= size
+    return formatted, len(items) - len(formatted)
+
+
+def omission_note(omitted: int, total: int, max_bytes: int, page: int) -> str:
+    return (
+        f"[{omitted} of {total} items on this page omitted to fit max_response_bytes={max_bytes}. "
+        f"Fetch them with page={page} and a larger max_response_bytes, "
+        f"response_mode='compact', or a smaller items_per_page.]"
+    )
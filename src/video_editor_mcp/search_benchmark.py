@@ -0,0 +1,413 @@
+"""
+Latency and relevance benchmark for search-remote-videos.
+
+Replays recorded Video Jungle responses from a local fixture server and drives
+handle_call_tool directly, reporting p50/p95/p99 per stage and recall@k for
+fixtures labeled with their relevant video ids. Runs fully offline:
+
+    VJ_API_KEY=offline python -m video_editor_mcp.search_benchmark \\
+        --synthetic 50 --stub-encoder
+
+With --concurrency N it instead times N tool calls issued one after another
+against the same N issued at once, to show how far blocking calls overlap.
+
+Fixtures are a JSON list of
+    {"query": ..., "keyword_results": [...], "embedding_results": [...],
+     "relevant": ["video_id", ...]}
+and can be recorded from the live API (with VJ_API_KEY set) using --record.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import random
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+
+import numpy as np
+
+from . import server as mcp_server
+from .embedding_cache import normalize_text
+
+_RESULT_ID = re.compile(r"Video I[dD]: (\S+)")
+
+
+class FixtureServer(ThreadingHTTPServer):
+    """
+    Stand-in for the Video Jungle API serving recorded search responses.
+
+    Keyword searches are matched by query; embedding searches carry only the
+    vector, so they are answered from `current`, the fixture being replayed.
+    """
+
+    # Concurrent benchmarks open many connections at once
+    request_queue_size = 128
+
+    def __init__(
+        self, fixtures: List[dict], latency_ms: float = 0.0, error_rate: float = 0.0
+    ):
+        super().__init__(("127.0.0.1", 0), _FixtureHandler)
+        self.fixtures = {normalize_text(f["query"]): f for f in fixtures}
+        self.latency = latency_ms / 1000.0
+        # Fraction of requests answered with a 503, to simulate a partial outage
+        self.error_rate = error_rate
+        self.current: Optional[dict] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    server: FixtureServer
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        if self.server.error_rate and random.random() < self.server.error_rate:
+            self.send_error(503)
+            return
+
+        if self.path.startswith("/video-file/search"):
+            query = json.loads(body or b"{}").get("query") or ""
+            fixture = self.server.fixtures.get(normalize_text(query), {})
+            payload = fixture.get("keyword_results", [])
+        elif self.path.startswith("/video-file/embedding-search"):
+            payload = (self.server.current or {}).get("embedding_results", [])
+        else:
+            self.send_error(404)
+            return
+
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class HashingTextModel:
+    """Deterministic stand-in for the text encoder, so no weights are needed"""
+
+    def __init__(self, dim: int = 768):
+        self.dim = dim
+
+    def encode_text(self, texts, truncate_dim=None, task=None):
+        vectors = []
+        for text in texts:
+            seed = int.from_bytes(hashlib.sha256(text.encode()).digest()[:8], "little")
+            vectors.append(np.random.default_rng(seed).standard_normal(self.dim))
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if truncate_dim:
+            vectors = vectors[:, :truncate_dim]
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def synthetic_fixtures(
+    n_queries: int = 50, n_videos: int = 500, limit: int = 10, seed: int = 0
+) -> List[dict]:
+    """Random but realistically shaped responses, labeled for recall@k"""
+    rng = np.random.default_rng(seed)
+    subjects = ["dog", "beach", "city", "crowd", "car", "kitchen", "forest", "drone"]
+    actions = ["running", "at night", "close up", "slow motion", "aerial", "timelapse"]
+    fixtures = []
+    for i in range(n_queries):
+        query = f"{rng.choice(subjects)} {rng.choice(actions)} {i}"
+        ids = [f"video-{v}" for v in rng.choice(n_videos, 2 * limit, replace=False)]
+        keyword_results = [
+            {
+                "video_id": video_id,
+                "script": "narration " * int(rng.integers(10, 80)),
+                "matching_segments": [
+                    {"start_seconds": float(s), "end_seconds": float(s + 4)}
+                    for s in sorted(rng.integers(0, 300, int(rng.integers(1, 4))))
+                ],
+                "video": {
+                    "name": f"{query} take {n}",
+                    "url": f"https://example.invalid/{video_id}",
+                    "generated_description": f"Footage of {query}",
+                },
+            }
+            for n, video_id in enumerate(ids[:limit])
+        ]
+        embedding_results = [
+            {
+                "video_id": video_id,
+                "timepoint": float(rng.integers(0, 300)),
+                "description": f"Scene matching {query}",
+                "detected_items": list(rng.choice(subjects, 2, replace=False)),
+                "score": float(1.0 - n / (2 * limit)),
+            }
+            for n, video_id in enumerate(ids[limit // 2 : limit // 2 + limit])
+        ]
+        fixtures.append(
+            {
+                "query": query,
+                "keyword_results": keyword_results,
+                "embedding_results": embedding_results,
+                "relevant": ids[limit // 2 : limit],
+            }
+        )
+    return fixtures
+
+
+async def record_fixtures(queries: List[str], limit: int = 10) -> List[dict]:
+    """Capture live keyword and embedding responses for each query"""
+    mcp_server.model_loader.start_loading()
+    fixtures = []
+    for query in queries:
+        search_params = {
+            "query": query,
+            "limit": limit,
+            "include_segments": True,
+            "include_related": False,
+        }
+        keyword_results = await mcp_server._keyword_search(search_params)
+        embedding_results = await mcp_server._embedding_search(query, limit, 600)
+        fixtures.append(
+            {
+                "query": query,
+                "keyword_results": keyword_results,
+                "embedding_results": embedding_results,
+                "relevant": [],
+            }
+        )
+    return fixtures
+
+
+def _percentiles(samples: List[float]) -> dict:
+    ms = 1000 * np.asarray(samples)
+    p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+    return {"count": len(samples), "p50_ms": p50, "p95_ms": p95, "p99_ms": p99}
+
+
+async def _start_fixture_server(
+    fixtures: List[dict], latency_ms: float, error_rate: float = 0.0
+) -> FixtureServer:
+    fixture_server = FixtureServer(
+        fixtures, latency_ms=latency_ms, error_rate=error_rate
+    )
+    threading.Thread(target=fixture_server.serve_forever, daemon=True).start()
+    mcp_server.vj.BASE_URL = fixture_server.url
+    mcp_server.avj.base_url = fixture_server.url
+    mcp_server.VJ_API_URL = fixture_server.url
+
+    model_loader = mcp_server.model_loader
+    model_loader.start_loading()
+    if not await model_loader.wait_ready(timeout=600):
+        raise RuntimeError(f"Embedding model did not load: {model_loader.error}")
+    return fixture_server
+
+
+async def run_benchmark(
+    fixtures: List[dict],
+    iterations: int = 3,
+    limit: int = 10,
+    k: int = 10,
+    latency_ms: float = 0.0,
+    error_rate: float = 0.0,
+) -> dict:
+    """Replay every fixture `iterations` times through handle_call_tool"""
+    fixture_server = await _start_fixture_server(fixtures, latency_ms, error_rate)
+
+    mcp_server.search_timings.reset()
+    totals = []
+    recalls = []
+    try:
+        for iteration in range(iterations):
+            for fixture in fixtures:
+                # Measure the full pipeline, not the query result cache
+                mcp_server.query_result_cache.invalidate()
+                fixture_server.current = fixture
+                started = time.perf_counter()
+                response = await mcp_server.handle_call_tool(
+                    "search-remote-videos",
+                    {
+                        "query": fixture["query"],
+                        "limit": limit,
+                        "items_per_page": k,
+                        "embedding_wait_seconds": 600,
+                    },
+                )
+                totals.append(time.perf_counter() - started)
+
+                relevant = set(fixture.get("relevant") or [])
+                if relevant and iteration == 0:
+                    text = "\n".join(item.text for item in response)
+                    ranked = list(dict.fromkeys(_RESULT_ID.findall(text)))[:k]
+                    recalls.append(len(relevant.intersection(ranked)) / len(relevant))
+    finally:
+        fixture_server.shutdown()
+
+    stages = {
+        stage: {key: value for key, value in stats.items() if key != "mean_ms"}
+        for stage, stats in mcp_server.search_timings.summary().items()
+    }
+    stages["total"] = _percentiles(totals)
+    return {
+        "queries": len(fixtures),
+        "iterations": iterations,
+        "stages": stages,
+        "k": k,
+        "recall": float(np.mean(recalls)) if recalls else None,
+        "resilience": mcp_server.resilience.stats(),
+    }
+
+
+async def run_concurrency_benchmark(
+    fixtures: List[dict], calls: int = 16, limit: int = 10, latency_ms: float = 200.0
+) -> dict:
+    """
+    Wall-clock seconds for `calls` keyword-only searches run sequentially and
+    concurrently. Embedding results are left out since the fixture server
+    answers those from a single `current` fixture.
+    """
+    fixture_server = await _start_fixture_server(fixtures, latency_ms)
+    queries = [fixtures[i % len(fixtures)]["query"] for i in range(calls)]
+
+    async def call(query: str):
+        return await mcp_server.handle_call_tool(
+            "search-remote-videos",
+            {"query": query, "limit": limit, "embedding_wait_seconds": 0},
+        )
+
+    # Keep the semantic leg out of the measurement
+    semantic_lookup = mcp_server._semantic_lookup
+    mcp_server._semantic_lookup = lambda embedding, limit: asyncio.sleep(0, [])
+    try:
+        mcp_server.query_result_cache.invalidate()
+        started = time.perf_counter()
+        for query in queries:
+            await call(query)
+        sequential = time.perf_counter() - started
+
+        mcp_server.query_result_cache.invalidate()
+        started = time.perf_counter()
+        await asyncio.gather(*(call(query) for query in queries))
+        concurrent = time.perf_counter() - started
+    finally:
+        mcp_server._semantic_lookup = semantic_lookup
+        fixture_server.shutdown()
+    return {
+        "calls": calls,
+        "latency_ms": latency_ms,
+        "sequential_s": sequential,
+        "concurrent_s": concurrent,
+        "speedup": sequential / concurrent,
+    }
+
+
+def print_report(report: dict):
+    print(
+        f"{report['queries']} queries x {report['iterations']} iterations, "
+        f"recall@{report['k']}: {report['recall']}"
+    )
+    print(f"{'stage':<20}{'count':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for stage, stats in report["stages"].items():
+        print(
+            f"{stage:<20}{stats['count']:>8}{stats['p50_ms']:>10.2f}"
+            f"{stats['p95_ms']:>10.2f}{stats['p99_ms']:>10.2f}"
+        )
+    if report.get("resilience"):
+        print(f"resilience: {report['resilience']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--fixtures", help="JSON file of recorded fixtures")
+    source.add_argument(
+        "--synthetic", type=int, metavar="N", help="Generate N synthetic queries"
+    )
+    source.add_argument(
+        "--record", metavar="QUERIES", help="Text file of queries to record live"
+    )
+    parser.add_argument("--out", help="Where to write recorded fixtures / the report")
+    parser.add_argument("--iterations", type=int, default=3)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("-k", type=int, default=10, help="Cutoff for recall@k")
+    parser.add_argument(
+        "--latency-ms", type=float, default=0.0, help="Simulated API latency"
+    )
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of API requests failed with a 503",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        metavar="N",
+        help="Time N sequential vs concurrent tool calls instead",
+    )
+    parser.add_argument(
+        "--stub-encoder",
+        action="store_true",
+        help="Use a hashing text encoder instead of loading model weights",
+    )
+    args = parser.parse_args()
+
+    if args.record:
+        with open(args.record) as f:
+            queries = [line.strip() for line in f if line.strip()]
+        recorded = asyncio.run(record_fixtures(queries, limit=args.limit))
+        with open(args.out or "search_fixtures.json", "w") as f:
+            json.dump(recorded, f, indent=2, default=str)
+        print(
+            f"Recorded {len(recorded)} fixtures to {args.out or 'search_fixtures.json'}"
+        )
+    else:
+        if args.stub_encoder:
+            mcp_server.model_loader._load_torch_model = lambda text_only=False: (
+                HashingTextModel()
+            )
+        if args.fixtures:
+            with open(args.fixtures) as f:
+                fixtures = json.load(f)
+        else:
+            fixtures = synthetic_fixtures(args.synthetic, limit=args.limit)
+        if args.concurrency:
+            report = asyncio.run(
+                run_concurrency_benchmark(
+                    fixtures,
+                    calls=args.concurrency,
+                    limit=args.limit,
+                    latency_ms=args.latency_ms,
+                )
+            )
+            print(
+                f"{report['calls']} calls at {report['latency_ms']:g}ms latency: "
+                f"{report['sequential_s']:.2f}s sequential, "
+                f"{report['concurrent_s']:.2f}s concurrent "
+                f"({report['speedup']:.1f}x)"
+            )
+            sys.exit(0)
+        logging.info(f"Running search benchmark over {len(fixtures)} fixtures")
+        report = asyncio.run(
+            run_benchmark(
+                fixtures,
+                iterations=args.iterations,
+                limit=args.limit,
+                k=args.k,
+                latency_ms=args.latency_ms,
+                error_rate=args.error_rate,
+            )
+        )
+        print_report(report)
+        if args.out:
+            with open(args.out, "w") as f:
+                json.dump(report, f, indent=2)
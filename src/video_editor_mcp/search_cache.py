@@ -0,0 +1,57 @@
+import hashlib
+import json
+from typing import Any, Optional
+
+from .cache import TTLCache
+from .embedding_cache import normalize_text
+
+
+def search_cache_key(search_params: dict, model_id: str) -> str:
+    """
+    Canonical hash of a search: parameter order, unset filters, query
+    whitespace and tag order don't change the key. The embedding model id is
+    part of the key because the semantic results depend on it.
+    """
+    canonical = {}
+    for name, value in search_params.items():
+        if value is None:
+            continue
+        if name == "query":
+            value = normalize_text(value)
+        elif name == "tags" and isinstance(value, list):
+            value = sorted(value, key=lambda tag: json.dumps(tag, sort_keys=True))
+        canonical[name] = value
+    blob = json.dumps([model_id, canonical], sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class QueryResultCache:
+    """
+    TTL + LRU cache of complete search results, keyed by search_cache_key.
+
+    Entries remember the project they were scoped to so that changes to one
+    project's content only drop that project's (and unscoped) searches. Reads
+    don't extend the TTL, so a popular query is still refreshed regularly.
+    """
+
+    def __init__(self, ttl: float = 120.0, max_entries: int = 256):
+        self._cache = TTLCache(ttl, max_entries=max_entries, touch_on_read=False)
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._cache.get(key)
+        return None if entry is None else entry[1]
+
+    def put(self, key: str, value: Any, project_id: Optional[str] = None):
+        self._cache.set(key, (project_id, value))
+
+    def invalidate(self, project_id: Optional[str] = None):
+        """Drop everything, or only searches scoped to `project_id` plus unscoped ones"""
+        if project_id is None:
+            self._cache.clear()
+            return
+        for key, (scope, _) in self._cache.items():
+            if scope is None or scope == str(project_id):
+                self._cache.pop(key)
+
+    def stats(self) -> dict:
+        return self._cache.stats()
@@ -0,0 +1,129 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .lazy_imports import LazyModule
+
+np = LazyModule("numpy")
+
+
+def to_seconds(value) -> Optional[float]:
+    """Parse a time given as seconds or "[HH:]MM:SS[.fff]", None if unparseable"""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        seconds = 0.0
+        for part in str(value).split(":"):
+            seconds = seconds * 60 + float(part)
+        return seconds
+    except ValueError:
+        return None
+
+
+class _VideoSegments:
+    """Segments of one video as start-sorted arrays with a running max of ends"""
+
+    def __init__(self):
+        self._pending: List[Tuple[float, float, Any]] = []
+        self.starts = np.zeros(0)
+        self.ends = np.zeros(0)
+        self.max_ends = np.zeros(0)
+        self.payloads: List[Any] = []
+
+    def add(self, start: float, end: float, payload: Any):
+        self._pending.append((start, end, payload))
+
+    def build(self):
+        if not self._pending:
+            return
+        entries = sorted(
+            list(zip(self.starts, self.ends, self.payloads)) + self._pending,
+            key=lambda entry: (entry[0], entry[1]),
+        )
+        self._pending = []
+        self.starts = np.array([entry[0] for entry in entries])
+        self.ends = np.array([entry[1] for entry in entries])
+        self.payloads = [entry[2] for entry in entries]
+        # Non-decreasing, so the first segment that can reach a time is a bisect
+        self.max_ends = np.maximum.accumulate(self.ends)
+
+    def overlapping(self, start: float, end: float) -> "np.ndarray":
+        self.build()
+        hi = np.searchsorted(self.starts, end, side="right")
+        lo = np.searchsorted(self.max_ends, start, side="left")
+        if lo >= hi:
+            return np.zeros(0, dtype=np.int64)
+        return lo + np.flatnonzero(self.ends[lo:hi] >= start)
+
+
+class SegmentIndex:
+    """
+    Interval index over video segments, e.g. the matching_segments of search
+    results or the cuts of an edit.
+
+    Each video's segments are kept as start-sorted arrays with a running
+    maximum of end times, so overlap and stabbing queries are two bisections
+    plus a scan of the candidates rather than a pass over every segment.
+    Segments can be added at any time; arrays are rebuilt on the next query.
+    """
+
+    def __init__(self):
+        self._videos: Dict[str, _VideoSegments] = {}
+
+    @classmethod
+    def from_videos(cls, videos: Iterable[dict]) -> "SegmentIndex":
+        """Index the matching_segments of search results, with the segment as payload"""
+        index = cls()
+        for video in videos:
+            for segment in video.get("matching_segments") or []:
+                index.add(
+                    video.get("video_id"),
+                    segment.get("start_seconds"),
+                    segment.get("end_seconds"),
+                    segment,
+                )
+        return index
+
+    def add(self, video_id, start, end, payload: Any = None) -> bool:
+        """Add a segment; times may be seconds or timestamps. False if unparseable"""
+        start, end = to_seconds(start), to_seconds(end)
+        if start is None or end is None:
+            return False
+        if end < start:
+            start, end = end, start
+        self._videos.setdefault(str(video_id), _VideoSegments()).add(
+            start, end, payload
+        )
+        return True
+
+    def __contains__(self, video_id) -> bool:
+        return str(video_id) in self._videos
+
+    def __len__(self) -> int:
+        return sum(len(v.starts) + len(v._pending) for v in self._videos.values())
+
+    def overlapping(self, video_id, start, end) -> List[Any]:
+        """Payloads of the segments of `video_id` that overlap [start, end]"""
+        segments = self._videos.get(str(video_id))
+        start, end = to_seconds(start), to_seconds(end)
+        if segments is None or start is None or end is None:
+            return []
+        return [segments.payloads[i] for i in segments.overlapping(start, end)]
+
+    def stabbing(self, video_id, time) -> List[Any]:
+        """Payloads of the segments of `video_id` that contain `time`"""
+        return self.overlapping(video_id, time, time)
+
+    def coalesce(self, video_id, gap: float = 0.0) -> List[Tuple[float, float]]:
+        """Merge a video's overlapping segments, and those at most `gap` apart"""
+        segments = self._videos.get(str(video_id))
+        if segments is None:
+            return []
+        segments.build()
+        merged: List[List[float]] = []
+        for start, end in zip(segments.starts, segments.ends):
+            if merged and start <= merged[-1][1] + gap:
+                merged[-1][1] = max(merged[-1][1], float(end))
+            else:
+                merged.append([float(start), float(end)])
+        return [(start, end) for start, end in merged]
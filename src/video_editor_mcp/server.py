@@ -1,28 +1,58 @@
+import asyncio
 import logging
 import os
 import subprocess
 import sys
 import threading
 import time
-from typing import List, Optional, Union, Any, Dict
+from typing import TYPE_CHECKING, List, Optional, Tuple, Any
 import json
 import webbrowser
 import uuid
 
 import mcp.server.stdio
 import mcp.types as types
-import osxphotos
 import requests
 from mcp.server import NotificationOptions, Server
 from mcp.server.models import InitializationOptions
 from pydantic import AnyUrl
 
-from transformers import AutoModel
 from videojungle import ApiClient
 
-from .search_local_videos import get_videos_by_keyword
+from .async_client import AsyncVideoJungleClient
+from .cache import TTLCache
+from .embedding_batcher import EmbeddingBatcher
+from .embedding_model import (
+    EMBEDDING_TRUNCATE_DIM,
+    EmbeddingModelLoader,
+    ModelLoadingError,
+)
+from .executor import BlockingExecutor
+from .http_client import PooledApiClient, get_session
+from .resilience import CircuitOpenError, call_deadline, resilience
+from .project_cache import ProjectCache
+from .ranking import FusedResults, fuse_results
+from .response_budget import (
+    ASSET_COLUMNS,
+    FUSED_COLUMNS,
+    compact_asset_row,
+    compact_fused_row,
+    budget_items,
+    omission_note,
+)
+from .search_cache import QueryResultCache, search_cache_key
+from .segments import SegmentIndex, to_seconds
+from .timings import StageTimings
+from .lazy_imports import LazyModule
 
-import numpy as np
+# Heavy dependencies are only imported the first time they're used, so the
+# server can answer `initialize` before they load (torch / transformers are
+# deferred the same way in embedding_model.py).
+np = LazyModule("numpy")
+osxphotos = LazyModule("osxphotos")
+
+if TYPE_CHECKING:
+    from .vector_index import SegmentVectorIndex
 
 
 if os.environ.get("VJ_API_KEY"):
@@ -55,12 +85,18 @@ if not VJ_API_KEY:
     if not VJ_API_KEY:
         raise Exception("VJ_API_KEY environment variable is required")
 
-vj = ApiClient(VJ_API_KEY)
+vj = PooledApiClient(VJ_API_KEY)
+# Point the client (and the embedding search) at another deployment or a
+# local fixture server, see search_benchmark.py
+VJ_API_URL = os.environ.get("VJ_API_URL", ApiClient.BASE_URL).rstrip("/")
+vj.BASE_URL = VJ_API_URL
+# asyncio-native client for handlers that have moved off the blocking executor
+avj = AsyncVideoJungleClient(VJ_API_KEY, base_url=VJ_API_URL, sync_client=vj)
 
 
 class PhotosDBLoader:
     def __init__(self):
-        self._db: Optional[osxphotos.PhotosDB] = None
+        self._db: Optional["osxphotos.PhotosDB"] = None
         self.start_loading()
 
     def start_loading(self):
@@ -73,130 +109,275 @@ class PhotosDBLoader:
         thread.start()
 
     @property
-    def db(self) -> osxphotos.PhotosDB:
+    def db(self) -> "osxphotos.PhotosDB":
         if self._db is None:
             raise Exception("PhotosDB still loading")
         return self._db
 
 
-class EmbeddingModelLoader:
-    def __init__(self, model_name: str = "jinaai/jina-clip-v1"):
-        self._model: Optional[AutoModel] = None
-        self.model_name = model_name
-        self.start_loading()
+class SegmentIndexSyncer:
+    """
+    Opens the local segment embedding index and keeps it synced in the background.
 
-    def start_loading(self):
-        def load():
-            self._model = AutoModel.from_pretrained(
-                self.model_name, trust_remote_code=True
-            )
-            logging.info(f"Model {self.model_name} loaded")
+    The sync endpoint is paged by cursor and returns
+    {"segments": [{"video_id", "timepoint", "embedding", "description",
+    "detected_items"}, ...], "next_cursor": ...}.
+    """
 
-        thread = threading.Thread(target=load)
+    def __init__(self, sync_url: Optional[str], interval: float = 300.0):
+        self._index: Optional["SegmentVectorIndex"] = None
+        self.sync_url = sync_url
+        self.interval = interval
+
+    def start(self):
+        def run():
+            from .vector_index import DEFAULT_INDEX_DIR, SegmentVectorIndex
+
+            try:
+                self._index = SegmentVectorIndex(
+                    os.environ.get("VJ_SEGMENT_INDEX_DIR", DEFAULT_INDEX_DIR)
+                )
+            except Exception as e:
+                logging.error(f"Error opening local segment index: {e}")
+                return
+            while True:
+                try:
+                    self._index.sync(self._fetch_page)
+                except Exception as e:
+                    logging.error(f"Error syncing local segment index: {e}")
+                time.sleep(self.interval)
+
+        thread = threading.Thread(target=run)
         thread.daemon = True
         thread.start()
 
+    def _fetch_page(self, cursor: Optional[str]):
+        params = {"limit": 1000}
+        if cursor:
+            params["cursor"] = cursor
+        response = resilience.call(
+            "GET",
+            self.sync_url,
+            lambda timeout: get_session().get(
+                self.sync_url,
+                params=params,
+                headers={"X-API-KEY": VJ_API_KEY},
+                timeout=timeout,
+            ),
+        )
+        response.raise_for_status()
+        data = response.json()
+        segments = data.get("segments", [])
+        for segment in segments:
+            # Match the embedding-search result shape format_single_video expects
+            segment.setdefault("description", "")
+            segment.setdefault("detected_items", [])
+        return segments, data.get("next_cursor")
+
     @property
-    def model(self) -> AutoModel:
-        if self._model is None:
-            raise Exception(f"Model {self.model_name} still loading")
-        return self._model
-
-    def encode_text(
-        self,
-        texts: Union[str, List[str]],
-        truncate_dim: Optional[int] = None,
-        task: Optional[str] = None,
-    ) -> dict:
-        """
-        Encode text and format the embeddings in the expected JSON structure
-        """
-        embeddings = self.model.encode_text(texts, truncate_dim=truncate_dim, task=task)
+    def index(self) -> Optional["SegmentVectorIndex"]:
+        return self._index
 
-        # Format the response in the expected structure
-        return {"embeddings": embeddings.tolist(), "embedding_type": "text_embeddings"}
 
-    def encode_image(
-        self, images: Union[str, List[str]], truncate_dim: Optional[int] = None
-    ) -> dict:
-        """
-        Encode images and format the embeddings in the expected JSON structure
-        """
-        embeddings = self.model.encode_image(images, truncate_dim=truncate_dim)
+class ProjectListCache:
+    """
+    Stale-while-revalidate cache of the user's projects.
 
-        return {"embeddings": embeddings.tolist(), "embedding_type": "image_embeddings"}
+    Reads always return the last fetched list immediately; refreshes run in a
+    background thread when the list is older than `ttl` or has been invalidated.
+    """
 
-    def post_embeddings(
-        self, embeddings: dict, endpoint_url: str, headers: Optional[dict] = None
-    ) -> requests.Response:
-        """
-        Post embeddings to the specified endpoint
-        """
-        if headers is None:
-            headers = {"Content-Type": "application/json"}
+    def __init__(self, client: ApiClient, ttl: float = 60.0):
+        self._client = client
+        self._projects: list = []
+        self._fetched_at: Optional[float] = None
+        self._refreshing = False
+        self._pending = False
+        # Projects created here, kept until a list fetched after them lands
+        self._added: dict = {}
+        self._lock = threading.Lock()
+        self.ttl = ttl
+
+    def refresh(self):
+        """Refresh the project list in the background, coalescing concurrent requests."""
+        with self._lock:
+            if self._refreshing:
+                # Re-run once the in-flight refresh finishes, so it can't miss
+                # a change made after it started
+                self._pending = True
+                return
+            self._refreshing = True
 
-        response = requests.post(endpoint_url, json=embeddings, headers=headers)
-        response.raise_for_status()
-        return response
+        def load():
+            while True:
+                try:
+                    with self._lock:
+                        added_before = set(self._added)
+                    projects = self._client.projects.list()
+                    with self._lock:
+                        # A list fetched before a create landed lacks it
+                        for project_id in added_before:
+                            self._added.pop(project_id, None)
+                        listed = {p.id for p in projects}
+                        projects = projects + [
+                            p for p in self._added.values() if p.id not in listed
+                        ]
+                        self._projects = projects
+                    self._fetched_at = time.time()
+                    logging.info(f"Project list refreshed ({len(projects)} projects)")
+                except Exception as e:
+                    logging.error(f"Error refreshing project list: {e}")
+                with self._lock:
+                    if not self._pending:
+                        self._refreshing = False
+                        return
+                    self._pending = False
+
+        thread = threading.Thread(target=load)
+        thread.daemon = True
+        thread.start()
+
+    def get(self) -> list:
+        """Return the cached projects, revalidating in the background if stale."""
+        stale = self._fetched_at is None or time.time() - self._fetched_at > self.ttl
+        # A refresh already in flight will do; only changes need a rerun
+        if stale and not self._refreshing:
+            self.refresh()
+        return self._projects
+
+    def add(self, project):
+        """Make a just-created project visible before the next refresh lands."""
+        with self._lock:
+            self._added[project.id] = project
+            if all(p.id != project.id for p in self._projects):
+                self._projects = self._projects + [project]
+        self.refresh()
+
+    def invalidate(self):
+        """Revalidate after a change that may affect the project list."""
+        self.refresh()
 
 
+# Default seconds a search waits for the embedding model to become ready
+# before falling back to keyword-only results
+EMBEDDING_READY_TIMEOUT = float(os.environ.get("VJ_EMBEDDING_READY_TIMEOUT", "5"))
+
 # Create global loader instance, (requires access to host computer!)
 if sys.platform == "darwin" and os.environ.get("LOAD_PHOTOS_DB"):
     photos_loader = PhotosDBLoader()
 
-model_loader = EmbeddingModelLoader()
+model_loader = EmbeddingModelLoader(
+    backend=os.environ.get("VJ_EMBEDDING_BACKEND", "torch"),
+    load_mode=os.environ.get("VJ_EMBEDDING_LOAD_MODE", "text"),
+)
 
-server = Server("video-jungle-mcp")
+# Concurrent searches share batched forward passes through the model
+embedding_batcher = EmbeddingBatcher(
+    model_loader.embed,
+    window_ms=float(os.environ.get("VJ_EMBEDDING_BATCH_WINDOW_MS", "5")),
+    max_batch_size=int(os.environ.get("VJ_EMBEDDING_MAX_BATCH", "16")),
+)
 
-try:
-    # videos_at_start = vj.video_files.list()
-    projects_at_start = vj.projects.list()
-except Exception as e:
-    logging.error(f"Error getting projects at start: {e}")
-    videos_at_start = []
+# Per-leg deadlines (seconds) for search-remote-videos; a leg that misses its
+# deadline is dropped and the other leg's results are returned on their own.
+# The embedding deadline starts once the model is ready.
+EMBEDDING_SEARCH_DEADLINE = float(os.environ.get("VJ_EMBEDDING_SEARCH_DEADLINE", "10"))
+KEYWORD_SEARCH_DEADLINE = float(os.environ.get("VJ_KEYWORD_SEARCH_DEADLINE", "15"))
+
+# Time budget (seconds) for all the outbound calls one tool call makes; calls
+# are retried and time out within what is left of it
+TOOL_DEADLINE = float(os.environ.get("VJ_TOOL_DEADLINE", "120"))
+TOOL_DEADLINES = {
+    "search-remote-videos": 30.0,
+    "search-remote-videos-batch": 60.0,
+    "find-similar-segments": 30.0,
+    "generate-edit-from-videos": 300.0,
+    "generate-edit-from-single-video": 300.0,
+}
+
+# How far (seconds) the timestamp given to find-similar-segments may be from an
+# indexed segment's timepoint for that segment's stored vector to be reused
+SIMILAR_SEGMENT_MAX_OFFSET = float(os.environ.get("VJ_SIMILAR_SEGMENT_MAX_OFFSET", "5"))
+
+# How keyword and embedding results are ranked together: "rrf" (reciprocal
+# rank fusion) or "weighted" (normalized scores), see ranking.py
+FUSION_METHOD = os.environ.get("VJ_FUSION_METHOD", "rrf")
+FUSION_RRF_K = float(os.environ.get("VJ_FUSION_RRF_K", "60"))
+FUSION_KEYWORD_WEIGHT = float(os.environ.get("VJ_FUSION_KEYWORD_WEIGHT", "1"))
+FUSION_EMBEDDING_WEIGHT = float(os.environ.get("VJ_FUSION_EMBEDDING_WEIGHT", "1"))
+
+# Default response_mode ("full" or "compact" one-line rows) and byte budget for
+# search and asset listings; both can be overridden per call
+RESPONSE_MODE = os.environ.get("VJ_RESPONSE_MODE", "full")
+MAX_RESPONSE_BYTES = (
+    int(os.environ["VJ_MAX_RESPONSE_BYTES"])
+    if os.environ.get("VJ_MAX_RESPONSE_BYTES")
+    else None
+)
 
-counter = 10
+# Seconds after startup before the embedding model is preloaded in the
+# background. Set VJ_MODEL_PRELOAD=0 to only load it on first search.
+MODEL_PRELOAD_DELAY = float(os.environ.get("VJ_MODEL_PRELOAD_DELAY", "2"))
 
-# Cache for pagination with timestamps for cleanup
-_search_result_cache: Dict[str, Dict] = {}
-_project_assets_cache: Dict[str, Dict] = {}
-_CACHE_TTL = 60 * 4  # 4 minute cache TTL
+# Every blocking SDK / HTTP / subprocess call made while handling a request
+# runs on this executor, off the event loop
+blocking = BlockingExecutor()
+
+# Local semantic search over synced segment embeddings, only when a sync
+# endpoint is configured; otherwise search uses the hosted embedding search
+segment_index_syncer = SegmentIndexSyncer(
+    os.environ.get("VJ_SEGMENT_SYNC_URL"),
+    interval=float(os.environ.get("VJ_SEGMENT_SYNC_INTERVAL", "300")),
+)
 
+server = Server("video-jungle-mcp")
+
+# Filled in the background once the server starts, see main()
+project_list_cache = ProjectListCache(
+    vj, ttl=float(os.environ.get("VJ_PROJECT_LIST_TTL", "60"))
+)
+# Coalesced, briefly cached project / edit fetches shared by the tool handlers
+project_cache = ProjectCache(avj.projects.get, avj.projects.get_edit)
+
+# Complete results of recent searches, so repeated queries skip the model and
+# the API; cleared when videos are added
+query_result_cache = QueryResultCache(
+    ttl=float(os.environ.get("VJ_QUERY_CACHE_TTL", "120")),
+    max_entries=int(os.environ.get("VJ_QUERY_CACHE_SIZE", "256")),
+)
 
-# Function to clean old cache entries
-def cleanup_cache():
-    """Remove cache entries older than TTL."""
-    current_time = time.time()
-    search_keys_to_remove = []
-    project_keys_to_remove = []
+# Per-stage latency of search-remote-videos (encode, network, fuse, format)
+search_timings = StageTimings()
 
-    # Clean search cache
-    for key, cache_entry in _search_result_cache.items():
-        if current_time - cache_entry["timestamp"] > _CACHE_TTL:
-            search_keys_to_remove.append(key)
+# Caches for pagination, bounded in bytes and expired through TTLCache
+_CACHE_TTL = 60 * 4  # 4 minute cache TTL
+_PAGINATION_CACHE_BYTES = int(
+    float(os.environ.get("VJ_PAGINATION_CACHE_MB", "64")) * 1024 * 1024
+)
+_search_result_cache = TTLCache(_CACHE_TTL, max_bytes=_PAGINATION_CACHE_BYTES)
+_project_assets_cache = TTLCache(_CACHE_TTL, max_bytes=_PAGINATION_CACHE_BYTES)
 
-    for key in search_keys_to_remove:
-        del _search_result_cache[key]
 
-    # Clean project assets cache
-    for key, cache_entry in _project_assets_cache.items():
-        if current_time - cache_entry["timestamp"] > _CACHE_TTL:
-            project_keys_to_remove.append(key)
+class SearchExpiredError(ValueError):
+    """A search_id past its TTL, evicted from the cache, or never issued"""
 
-    for key in project_keys_to_remove:
-        del _project_assets_cache[key]
 
-    total_removed = len(search_keys_to_remove) + len(project_keys_to_remove)
-    if total_removed > 0:
-        logging.info(
-            f"Cleaned up {len(search_keys_to_remove)} expired search caches and {len(project_keys_to_remove)} project asset caches"
+def _cached_search(search_id: str, kind: str) -> dict:
+    """The cached search `search_id` holding `kind` ("results" or "groups")"""
+    cache_entry = _search_result_cache.get(search_id)
+    if cache_entry is None or kind not in cache_entry:
+        raise SearchExpiredError(
+            f"search_id '{search_id}' expired or not found, please search again without it"
         )
+    return cache_entry
 
 
 tools = [
     "add-video",
     "search-local-videos",
     "search-remote-videos",
+    "search-remote-videos-batch",
+    "find-similar-segments",
     "generate-edit-from-videos",
     "get-project-assets",
     "create-videojungle-project",
@@ -249,16 +430,8 @@ async def handle_list_resources() -> list[types.Resource]:
     List available video files.
     Each video files is available at a specific url
     """
-    global counter, projects_at_start
-    counter += 1
-    # check to see if DaVinci Resolve is open
-
-    # We do this counter because otherwise Claude is very aggressive
-    # about requests
-    if counter % 100 == 0:
-        projects = vj.projects.list()
-        projects_at_start = projects
-        counter = 0
+    # Never blocks on the API: serves the cached list and revalidates in the
+    # background, since Claude is very aggressive about listing resources
     """
     videos = [
         types.Resource(
@@ -277,7 +450,7 @@ async def handle_list_resources() -> list[types.Resource]:
             description=f"Project description: {project.description}",
             mimeType="application/json",
         )
-        for project in projects_at_start
+        for project in project_list_cache.get()
     ]
 
     return projects  # videos  # + projects
@@ -295,7 +468,7 @@ async def handle_read_resource(uri: AnyUrl) -> str:
     id = uri.path
     if id is not None:
         id = id.lstrip("/projects/")
-        proj = vj.projects.get(id)
+        proj = await project_cache.get(id)
         logging.info(f"project is: {proj}")
         return proj.model_dump_json()
     raise ValueError(f"Project not found: {id}")
@@ -354,6 +527,70 @@ async def handle_get_prompt(
     )
 
 
+# In both tool lists of handle_list_tools, with or without LOAD_PHOTOS_DB
+FIND_SIMILAR_SEGMENTS_TOOL = types.Tool(
+    name="find-similar-segments",
+    description="Find segments that look or read like a segment from a previous search result ('more like this'). Takes the video_id and timestamp of that segment and does one vector lookup instead of several exploratory text searches. Paginate with search_id and page, as with search-remote-videos.",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "video_id": {
+                "type": "string",
+                "description": "ID of the video containing the reference segment",
+            },
+            "timestamp": {
+                "type": ["number", "string"],
+                "description": "Time of the reference segment, in seconds or as HH:MM:SS",
+            },
+            "limit": {
+                "type": "integer",
+                "default": 10,
+                "minimum": 1,
+                "description": "Maximum number of similar segments to return",
+            },
+            "include_same_video": {
+                "type": "boolean",
+                "default": True,
+                "description": "Whether to include other segments of the reference video",
+            },
+            "search_id": {
+                "type": "string",
+                "description": "ID of a previous search to continue pagination. If provided, returns the next chunk of results",
+            },
+            "page": {
+                "type": "integer",
+                "default": 1,
+                "minimum": 1,
+                "description": "Page number to retrieve when paginating through results",
+            },
+            "items_per_page": {
+                "type": "integer",
+                "default": 5,
+                "minimum": 1,
+                "maximum": 20,
+                "description": "Number of items to show per page when paginating",
+            },
+            "response_mode": {
+                "type": "string",
+                "enum": ["full", "compact"],
+                "default": "full",
+                "description": "'compact' returns one line per result with long fields clipped, to save tokens",
+            },
+            "max_response_bytes": {
+                "type": "integer",
+                "minimum": 1024,
+                "description": "Upper bound on the response size in bytes; items past it are omitted with a note on how to fetch them",
+            },
+            "embedding_wait_seconds": {
+                "type": "number",
+                "minimum": 0,
+                "description": "Seconds to wait for the embedding model if the reference segment has to be embedded while it is still loading (default: 5)",
+            },
+        },
+    },
+)
+
+
 @server.list_tools()
 async def handle_list_tools() -> list[types.Tool]:
     """
@@ -487,9 +724,120 @@ async def handle_list_tools() -> list[types.Tool]:
                             "type": "string",
                             "description": "Image search query",
                         },
+                        "response_mode": {
+                            "type": "string",
+                            "enum": ["full", "compact"],
+                            "default": "full",
+                            "description": "'compact' returns one line per result with long fields clipped, to save tokens",
+                        },
+                        "max_response_bytes": {
+                            "type": "integer",
+                            "minimum": 1024,
+                            "description": "Upper bound on the response size in bytes; items past it are omitted with a note on how to fetch them",
+                        },
+                        "embedding_wait_seconds": {
+                            "type": "number",
+                            "minimum": 0,
+                            "description": "Seconds to wait for the semantic search model if it is still loading before returning keyword-only results (default: 5)",
+                        },
+                    },
+                },
+            ),
+            types.Tool(
+                name="search-remote-videos-batch",
+                description="Search videos for several queries at once (e.g. every shot of an edit), sharing filters. Much faster than calling search-remote-videos once per query. Returns results grouped by query; paginate with search_id and page.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "queries": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "maxItems": 20,
+                            "description": "Text search queries, e.g. ['intro', 'b-roll city', 'crowd cheering']",
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "default": 10,
+                            "minimum": 1,
+                            "description": "Maximum number of results per query",
+                        },
+                        "project_id": {
+                            "type": "string",
+                            "format": "uuid",
+                            "description": "Project ID to scope the searches",
+                        },
+                        "duration_min": {
+                            "type": "number",
+                            "minimum": 0,
+                            "description": "Minimum video duration in seconds",
+                        },
+                        "duration_max": {
+                            "type": "number",
+                            "minimum": 0,
+                            "description": "Maximum video duration in seconds",
+                        },
+                        "created_after": {
+                            "type": "string",
+                            "format": "date-time",
+                            "description": "Filter videos created after this datetime",
+                        },
+                        "created_before": {
+                            "type": "string",
+                            "format": "date-time",
+                            "description": "Filter videos created before this datetime",
+                        },
+                        "tags": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Set of tags to filter by",
+                        },
+                        "include_segments": {
+                            "type": "boolean",
+                            "default": True,
+                            "description": "Whether to include video segments in results",
+                        },
+                        "include_related": {
+                            "type": "boolean",
+                            "default": False,
+                            "description": "Whether to include related videos",
+                        },
+                        "search_id": {
+                            "type": "string",
+                            "description": "ID of a previous batch search to continue pagination",
+                        },
+                        "page": {
+                            "type": "integer",
+                            "default": 1,
+                            "minimum": 1,
+                            "description": "Page number to retrieve when paginating through results",
+                        },
+                        "items_per_page": {
+                            "type": "integer",
+                            "default": 3,
+                            "minimum": 1,
+                            "maximum": 20,
+                            "description": "Number of items to show per query on each page",
+                        },
+                        "response_mode": {
+                            "type": "string",
+                            "enum": ["full", "compact"],
+                            "default": "full",
+                            "description": "'compact' returns one line per result with long fields clipped, to save tokens",
+                        },
+                        "max_response_bytes": {
+                            "type": "integer",
+                            "minimum": 1024,
+                            "description": "Upper bound on the response size in bytes; items past it are omitted with a note on how to fetch them",
+                        },
+                        "embedding_wait_seconds": {
+                            "type": "number",
+                            "minimum": 0,
+                            "description": "Seconds to wait for the semantic search model if it is still loading before returning keyword-only results (default: 5)",
+                        },
                     },
                 },
             ),
+            FIND_SIMILAR_SEGMENTS_TOOL,
             types.Tool(
                 name="search-local-videos",
                 description="Search user's local videos in Photos app by keyword",
@@ -528,6 +876,11 @@ async def handle_list_tools() -> list[types.Tool]:
                             "type": "string",
                             "description": "Video resolution. Examples include '1920x1080', '1280x720'",
                         },
+                        "merge_continuous_cuts": {
+                            "type": "boolean",
+                            "description": "Join consecutive cuts that continue the same footage (same video, settings and a matching end/start time) into one clip. Off by default, so every cut is kept as given",
+                            "default": False,
+                        },
                         "render_subtiles": {
                             "type": "boolean",
                             "description": "Whether to render subtitiles in the video edit",
@@ -645,6 +998,11 @@ async def handle_list_tools() -> list[types.Tool]:
                     "properties": {
                         "project_id": {"type": "string"},
                         "resolution": {"type": "string"},
+                        "merge_continuous_cuts": {
+                            "type": "boolean",
+                            "description": "Join consecutive cuts that continue the same footage (same video, settings and a matching end/start time) into one clip. Off by default, so every cut is kept as given",
+                            "default": False,
+                        },
                         "video_id": {"type": "string"},
                         "render_subtiles": {
                             "type": "boolean",
@@ -841,6 +1199,17 @@ async def handle_list_tools() -> list[types.Tool]:
                             "type": "string",
                             "description": "ID of a previous asset cache to continue pagination. If provided, returns the next chunk of results",
                         },
+                        "response_mode": {
+                            "type": "string",
+                            "enum": ["full", "compact"],
+                            "default": "full",
+                            "description": "'compact' returns one line per asset without analysis dumps, to save tokens",
+                        },
+                        "max_response_bytes": {
+                            "type": "integer",
+                            "minimum": 1024,
+                            "description": "Upper bound on the response size in bytes; assets past it are omitted with a note on how to fetch them",
+                        },
                     },
                     "required": ["project_id"],
                 },
@@ -970,9 +1339,120 @@ async def handle_list_tools() -> list[types.Tool]:
                         "type": "string",
                         "description": "Image search query",
                     },
+                    "response_mode": {
+                        "type": "string",
+                        "enum": ["full", "compact"],
+                        "default": "full",
+                        "description": "'compact' returns one line per result with long fields clipped, to save tokens",
+                    },
+                    "max_response_bytes": {
+                        "type": "integer",
+                        "minimum": 1024,
+                        "description": "Upper bound on the response size in bytes; items past it are omitted with a note on how to fetch them",
+                    },
+                    "embedding_wait_seconds": {
+                        "type": "number",
+                        "minimum": 0,
+                        "description": "Seconds to wait for the semantic search model if it is still loading before returning keyword-only results (default: 5)",
+                    },
+                },
+            },
+        ),
+        types.Tool(
+            name="search-remote-videos-batch",
+            description="Search videos for several queries at once (e.g. every shot of an edit), sharing filters. Much faster than calling search-remote-videos once per query. Returns results grouped by query; paginate with search_id and page.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "queries": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "maxItems": 20,
+                        "description": "Text search queries, e.g. ['intro', 'b-roll city', 'crowd cheering']",
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "default": 10,
+                        "minimum": 1,
+                        "description": "Maximum number of results per query",
+                    },
+                    "project_id": {
+                        "type": "string",
+                        "format": "uuid",
+                        "description": "Project ID to scope the searches",
+                    },
+                    "duration_min": {
+                        "type": "number",
+                        "minimum": 0,
+                        "description": "Minimum video duration in seconds",
+                    },
+                    "duration_max": {
+                        "type": "number",
+                        "minimum": 0,
+                        "description": "Maximum video duration in seconds",
+                    },
+                    "created_after": {
+                        "type": "string",
+                        "format": "date-time",
+                        "description": "Filter videos created after this datetime",
+                    },
+                    "created_before": {
+                        "type": "string",
+                        "format": "date-time",
+                        "description": "Filter videos created before this datetime",
+                    },
+                    "tags": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Set of tags to filter by",
+                    },
+                    "include_segments": {
+                        "type": "boolean",
+                        "default": True,
+                        "description": "Whether to include video segments in results",
+                    },
+                    "include_related": {
+                        "type": "boolean",
+                        "default": False,
+                        "description": "Whether to include related videos",
+                    },
+                    "search_id": {
+                        "type": "string",
+                        "description": "ID of a previous batch search to continue pagination",
+                    },
+                    "page": {
+                        "type": "integer",
+                        "default": 1,
+                        "minimum": 1,
+                        "description": "Page number to retrieve when paginating through results",
+                    },
+                    "items_per_page": {
+                        "type": "integer",
+                        "default": 3,
+                        "minimum": 1,
+                        "maximum": 20,
+                        "description": "Number of items to show per query on each page",
+                    },
+                    "response_mode": {
+                        "type": "string",
+                        "enum": ["full", "compact"],
+                        "default": "full",
+                        "description": "'compact' returns one line per result with long fields clipped, to save tokens",
+                    },
+                    "max_response_bytes": {
+                        "type": "integer",
+                        "minimum": 1024,
+                        "description": "Upper bound on the response size in bytes; items past it are omitted with a note on how to fetch them",
+                    },
+                    "embedding_wait_seconds": {
+                        "type": "number",
+                        "minimum": 0,
+                        "description": "Seconds to wait for the semantic search model if it is still loading before returning keyword-only results (default: 5)",
+                    },
                 },
             },
         ),
+        FIND_SIMILAR_SEGMENTS_TOOL,
         types.Tool(
             name="generate-edit-from-videos",
             description="Generate an edit from videos, from within a specific project. Creates a new project to work within no existing project ID (UUID) is passed ",
@@ -992,6 +1472,11 @@ async def handle_list_tools() -> list[types.Tool]:
                         "type": "string",
                         "description": "Video resolution. Examples include '1920x1080', '1280x720'",
                     },
+                    "merge_continuous_cuts": {
+                        "type": "boolean",
+                        "description": "Join consecutive cuts that continue the same footage (same video, settings and a matching end/start time) into one clip. Off by default, so every cut is kept as given",
+                        "default": False,
+                    },
                     "edit": {
                         "type": "array",
                         "items": {
@@ -1104,6 +1589,11 @@ async def handle_list_tools() -> list[types.Tool]:
                 "properties": {
                     "project_id": {"type": "string"},
                     "resolution": {"type": "string"},
+                    "merge_continuous_cuts": {
+                        "type": "boolean",
+                        "description": "Join consecutive cuts that continue the same footage (same video, settings and a matching end/start time) into one clip. Off by default, so every cut is kept as given",
+                        "default": False,
+                    },
                     "video_id": {"type": "string"},
                     "edit": {
                         "type": "array",
@@ -1305,6 +1795,17 @@ async def handle_list_tools() -> list[types.Tool]:
                         "type": "string",
                         "description": "ID of a previous asset cache to continue pagination. If provided, returns the next chunk of results",
                     },
+                    "response_mode": {
+                        "type": "string",
+                        "enum": ["full", "compact"],
+                        "default": "full",
+                        "description": "'compact' returns one line per asset without analysis dumps, to save tokens",
+                    },
+                    "max_response_bytes": {
+                        "type": "integer",
+                        "minimum": 1024,
+                        "description": "Upper bound on the response size in bytes; assets past it are omitted with a note on how to fetch them",
+                    },
                 },
                 "required": ["project_id"],
             },
@@ -1342,6 +1843,58 @@ def filter_unique_videos_keep_first(json_results):
     ]
 
 
+def _continues_cut(previous: dict, clip: dict) -> bool:
+    """Whether `clip` picks up exactly where `previous` ends, with the same settings"""
+    previous_end = to_seconds(previous["video_end_time"])
+    return (
+        previous_end is not None
+        and previous_end == to_seconds(clip["video_start_time"])
+        and previous["video_id"] == clip["video_id"]
+        and previous["type"] == clip["type"]
+        and previous.get("crop") == clip.get("crop")
+        and [level.get("audio_level") for level in previous["audio_levels"]]
+        == [level.get("audio_level") for level in clip["audio_levels"]]
+    )
+
+
+def compact_edit_cuts(clips: List[dict], merge: bool = False) -> List[dict]:
+    """
+    Log cuts that reuse footage an earlier cut already shows and, with `merge`,
+    join consecutive cuts that continue the same footage into one clip.
+    Returns new clip dicts; `clips` is left unchanged.
+    """
+    shown = SegmentIndex()
+    compacted: List[dict] = []
+    for number, clip in enumerate(clips, 1):
+        start = to_seconds(clip["video_start_time"])
+        end = to_seconds(clip["video_end_time"])
+        if start is not None and end is not None and end - start > 0.002:
+            # Shrink slightly so cuts that merely touch don't count as reuse
+            reused = shown.overlapping(clip["video_id"], start + 0.001, end - 0.001)
+            if reused:
+                logging.info(
+                    f"Cut {number} reuses footage of video {clip['video_id']} shown in cut(s) {reused}"
+                )
+            shown.add(clip["video_id"], start, end, number)
+
+        if merge and compacted and _continues_cut(compacted[-1], clip):
+            previous = compacted[-1]
+            previous["video_end_time"] = clip["video_end_time"]
+            for level in previous["audio_levels"]:
+                level["end_time"] = clip["video_end_time"]
+            continue
+        compacted.append(
+            {
+                **clip,
+                "audio_levels": [dict(level) for level in clip["audio_levels"]],
+            }
+        )
+
+    if len(compacted) < len(clips):
+        logging.info(f"Joined {len(clips)} cuts into {len(compacted)} continuous clips")
+    return compacted
+
+
 def format_video_info(video):
     try:
         if video.get("script") is not None:
@@ -1351,11 +1904,19 @@ def format_video_info(video):
                 script = video.get("script")
         else:
             script = "N/A"
-        segments = []
-        for segment in video.get("matching_segments", []):
-            segments.append(
+        matching_segments = video.get("matching_segments") or []
+        index = SegmentIndex.from_videos([video])
+        if len(index) == len(matching_segments):
+            # Overlapping and back-to-back scenes are shown as one
+            segments = [
+                f"- Time: {start:g} to {end:g}"
+                for start, end in index.coalesce(video.get("video_id"))
+            ]
+        else:
+            segments = [
                 f"- Time: {segment.get('start_seconds', 'N/A')} to {segment.get('end_seconds', 'N/A')}"
-            )
+                for segment in matching_segments
+            ]
         joined_segments = "\n".join(segments)
         return (
             f"- Video Id: {video.get('video_id', 'N/A')}\n"
@@ -1369,6 +1930,20 @@ def format_video_info(video):
         return f"Error formatting video: {str(e)}"
 
 
+def format_fused_result(result):
+    """Format a fused search result: the keyword hit and the semantic matches in it"""
+    formatted = []
+    if result["video"] is not None:
+        video = result["video"]
+        if result["segments"]:
+            # Only the scenes that fell into this result
+            video = {**video, "matching_segments": result["segments"]}
+        formatted.append(format_video_info(video))
+    formatted.extend(format_single_video(match) for match in result["matches"])
+    formatted.append(f"  Relevance score: {result['score']:.4f}")
+    return "\n".join(formatted)
+
+
 def format_video_info_long(video):
     try:
         if video.get("script") is not None:
@@ -1390,6 +1965,62 @@ def format_video_info_long(video):
         return f"Error formatting video: {str(e)}"
 
 
+# Asset fields shown by format_asset_info; everything else is dropped before
+# assets are held in the pagination cache
+_ASSET_DISPLAY_FIELDS = (
+    "id",
+    "type",
+    "asset_type",
+    "name",
+    "keyname",
+    "url",
+    "download_url",
+    "description",
+    "created_at",
+    "generated_description",
+    "status",
+    "asset_path",
+    "video_output_resolution",
+    "video_output_fps",
+    "video_output_format",
+    "filetype",
+    "duration",
+    "width",
+    "height",
+    "uploaded",
+)
+_CLIP_DISPLAY_FIELDS = ("video_id", "video_start_time", "video_end_time", "type")
+# Analysis dumps can run to megabytes; cached pages keep only a preview
+_ANALYSIS_SUMMARY_CHARS = 300
+
+
+def summarize_analysis(analysis) -> str:
+    """One-line preview of an asset's analysis, clipped to _ANALYSIS_SUMMARY_CHARS"""
+    text = " ".join(str(analysis).split())
+    if len(text) > _ANALYSIS_SUMMARY_CHARS:
+        return text[: _ANALYSIS_SUMMARY_CHARS - 3] + "..."
+    return text
+
+
+def compact_asset(asset: dict) -> dict:
+    """
+    Keep only what format_asset_info shows, with the analysis cut to a
+    preview, for cached asset pages
+    """
+    compact = {field: asset[field] for field in _ASSET_DISPLAY_FIELDS if field in asset}
+    create_params = asset.get("create_parameters")
+    if isinstance(create_params, dict) and create_params.get("analysis"):
+        compact["create_parameters"] = {
+            "analysis": summarize_analysis(create_params["analysis"])
+        }
+    clips = asset.get("video_series_sequential")
+    if clips:
+        compact["video_series_sequential"] = [
+            {field: clip.get(field) for field in _CLIP_DISPLAY_FIELDS} for clip in clips
+        ]
+    return compact
+
+
 def format_asset_info(asset):
     """Format asset information for display based on the example structure you showed"""
     try:
@@ -1445,7 +2076,7 @@ def format_asset_info(asset):
             create_params = asset.get("create_parameters", {})
             if create_params and isinstance(create_params, dict):
                 analysis = create_params.get("analysis", {})
-                if analysis and isinstance(analysis, dict):
+                if analysis and isinstance(analysis, (dict, str)):
                     formatted.append(f" analysis: {str(analysis)}")
 
             # Status field (if available)
@@ -1503,12 +2134,444 @@ def format_asset_info(asset):
         return f"Error formatting asset {asset.get('id', 'unknown')}: {str(e)}"
 
 
+async def _no_results() -> list:
+    return []
+
+
+async def _wait_for_model(embedding_wait: float):
+    if not await model_loader.wait_ready(timeout=embedding_wait):
+        raise model_loader.not_ready_error()
+
+
+async def _embedding_search(query: str, limit: int, embedding_wait: float) -> list:
+    """
+    Semantic leg of search-remote-videos: wait for the model, embed the query
+    and search the local index or the hosted embedding search endpoint
+    """
+    await _wait_for_model(embedding_wait)
+    # The deadline starts once the model is ready, embedding_wait covers loading
+    return await asyncio.wait_for(
+        _embedding_lookup(query, limit), EMBEDDING_SEARCH_DEADLINE
+    )
+
+
+async def _embedding_search_many(
+    queries: List[str], limit: int, embedding_wait: float
+) -> list:
+    """
+    Semantic leg for several queries: one batched forward pass, then
+    concurrent lookups. Returns a result list or exception per query.
+    """
+    await _wait_for_model(embedding_wait)
+    with search_timings.time("encode"):
+        query_embeddings = await embedding_batcher.submit_many(
+            "text", queries, truncate_dim=EMBEDDING_TRUNCATE_DIM
+        )
+    return await asyncio.gather(
+        *(
+            asyncio.wait_for(
+                _semantic_lookup(query_embedding, limit), EMBEDDING_SEARCH_DEADLINE
+            )
+            for query_embedding in query_embeddings
+        ),
+        return_exceptions=True,
+    )
+
+
+async def _embedding_lookup(query: str, limit: int) -> list:
+    with search_timings.time("encode"):
+        query_embedding = await embedding_batcher.submit(
+            "text", query, truncate_dim=EMBEDDING_TRUNCATE_DIM
+        )
+    logging.info(f"Embedding batcher stats: {embedding_batcher.stats()}")
+    return await _semantic_lookup(query_embedding, limit)
+
+
+async def _semantic_lookup(query_embedding: "np.ndarray", limit: int) -> list:
+    local_index = segment_index_syncer.index
+    if (
+        local_index is not None
+        and len(local_index)
+        and local_index.dim == len(query_embedding)
+    ):
+        # Serve semantic results from the local index, no round trip
+        with search_timings.time("local_index"):
+            return await blocking.run(
+                "local-index", local_index.search, query_embedding, k=limit
+            )
+
+    embeddings = model_loader.payload(query_embedding, "text_embeddings")
+    try:
+        with search_timings.time("embedding_network"):
+            with call_deadline(EMBEDDING_SEARCH_DEADLINE):
+                response = await blocking.run(
+                    "embedding-search",
+                    model_loader.post_embeddings,
+                    embeddings,
+                    f"{VJ_API_URL}/video-file/embedding-search",
+                    headers={
+                        "Content-Type": "application/json",
+                        "X-API-KEY": VJ_API_KEY,
+                    },
+                )
+    except requests.HTTPError as e:
+        # post_embeddings raises for any error status
+        raise RuntimeError(
+            f"Embedding search failed with HTTP {e.response.status_code}: {e.response.text[:200]}"
+        ) from e
+    except CircuitOpenError as e:
+        logging.warning(f"Skipping embedding search: {e}")
+        raise
+    results = response.json()
+    logging.info(f"Response is: {results}")
+    return results
+
+
+async def _keyword_search(search_params: dict) -> list:
+    """Keyword / filter leg of search-remote-videos, on the async client"""
+    logging.info(
+        f"Search params being passed to vj.video_files.search: {search_params}"
+    )
+    logging.info(f"VJ client: {vj}, API key present: {bool(VJ_API_KEY)}")
+    with search_timings.time("keyword_network"):
+        with call_deadline(KEYWORD_SEARCH_DEADLINE):
+            videos = await avj.video_files.search(**search_params)
+    logging.info(f"Search returned {len(videos)} videos")
+    if videos:
+        logging.info(f"First video: {videos[0]}")
+    return videos
+
+
+def _resolve_search_outcomes(embedding_outcome, videos_outcome):
+    """
+    Turn the two legs' gather() outcomes into (embedding_results, videos,
+    notes), where notes tell the user which part of the results is missing
+    """
+    notes = []
+
+    embedding_results = []
+    if isinstance(embedding_outcome, asyncio.TimeoutError):
+        logging.warning(
+            f"Embedding search exceeded its {EMBEDDING_SEARCH_DEADLINE}s deadline"
+        )
+        notes.append(
+            f"Note: Semantic search did not finish within {EMBEDDING_SEARCH_DEADLINE:g}s. Only text-based search results are shown."
+        )
+    elif isinstance(embedding_outcome, Exception):
+        if isinstance(embedding_outcome, ModelLoadingError):
+            logging.warning(
+                "Embedding model still loading, falling back to text-only search"
+            )
+            # Add note that will be displayed to the user
+            status = model_loader.status()
+            progress = f"{status['state']}"
+            if status["seconds_since_load_started"] is not None:
+                progress += f", {status['seconds_since_load_started']:.0f}s elapsed"
+            notes.append(
+                f"Note: Embedding-based semantic search is still initializing ({progress}). Only text-based search results are shown. Please try again later, or pass a larger embedding_wait_seconds, for more accurate semantic search results."
+            )
+        elif isinstance(embedding_outcome, CircuitOpenError):
+            notes.append(
+                f"Note: Semantic search is temporarily unavailable ({embedding_outcome}). Only text-based search results are shown."
+            )
+        else:
+            # For other errors, log and continue with regular search
+            logging.error(f"Error in embedding search: {embedding_outcome}")
+            notes.append(
+                f"Note: Semantic search failed ({type(embedding_outcome).__name__}). Only text-based search results are shown."
+            )
+    else:
+        embedding_results = embedding_outcome
+
+    videos = []
+    if isinstance(videos_outcome, asyncio.TimeoutError):
+        logging.error(
+            f"vj.video_files.search exceeded its {KEYWORD_SEARCH_DEADLINE}s deadline"
+        )
+        notes.append(
+            f"Note: Text-based search did not finish within {KEYWORD_SEARCH_DEADLINE:g}s. Only semantic search results are shown."
+        )
+    elif isinstance(videos_outcome, Exception):
+        logging.error(
+            f"Error in vj.video_files.search: {videos_outcome}, "
+            f"resilience: {resilience.stats()}"
+        )
+        notes.append(
+            f"Note: Text-based search failed ({type(videos_outcome).__name__}). Only semantic search results are shown."
+        )
+    else:
+        videos = videos_outcome
+    return embedding_results, videos, notes
+
+
+def _fuse(videos: list, embedding_results: list, limit: int) -> FusedResults:
+    with search_timings.time("fuse"):
+        return FusedResults(
+            fuse_results(
+                videos,
+                embedding_results,
+                method=FUSION_METHOD,
+                rrf_k=FUSION_RRF_K,
+                keyword_weight=FUSION_KEYWORD_WEIGHT,
+                embedding_weight=FUSION_EMBEDDING_WEIGHT,
+                top_k=limit,
+            )
+        )
+
+
+_TIME_KEYS = ("timepoint", "timestamp", "start_seconds", "start_time", "start")
+_TEXT_KEYS = ("description", "scene_description", "caption", "text")
+
+
+def _closest_description(analysis, time: float) -> Optional[str]:
+    """
+    Description of the analyzed scene closest to `time`, found by walking the
+    analysis for dicts that carry both a time and a description
+    """
+    best_text, best_distance = None, None
+    stack = [analysis]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(node)
+            continue
+        if not isinstance(node, dict):
+            continue
+        stack.extend(v for v in node.values() if isinstance(v, (dict, list)))
+        timepoint = next(
+            (to_seconds(node[k]) for k in _TIME_KEYS if node.get(k) is not None),
+            None,
+        )
+        text = next(
+            (node[k] for k in _TEXT_KEYS if isinstance(node.get(k), str) and node[k]),
+            None,
+        )
+        if timepoint is None or text is None:
+            continue
+        distance = abs(timepoint - time)
+        if best_distance is None or distance < best_distance:
+            best_text, best_distance = text, distance
+    return best_text
+
+
+async def _reference_embedding(
+    video_id: str, time: float, embedding_wait: float
+) -> Tuple["np.ndarray", str]:
+    """
+    Embedding of the segment of `video_id` at `time`, and where it came from:
+    the stored vector from the local segment index when one is indexed near
+    that time, otherwise the embedded description of the closest analyzed scene
+    """
+    local_index = segment_index_syncer.index
+    if local_index is not None:
+        found = await blocking.run(
+            "local-index",
+            local_index.nearest,
+            video_id,
+            time,
+            max_distance=SIMILAR_SEGMENT_MAX_OFFSET,
+        )
+        if found is not None:
+            segment, vector = found
+            return vector, f"indexed segment at {segment.get('timepoint')}"
+
+    analysis = await blocking.run(
+        "find-similar-segments", vj.video_files.get_analysis, video_id
+    )
+    description = _closest_description(analysis, time)
+    if not description:
+        raise ValueError(
+            f"No indexed segment or scene description found for video {video_id} near {time:g}s"
+        )
+    await _wait_for_model(embedding_wait)
+    with search_timings.time("encode"):
+        vector = await embedding_batcher.submit(
+            "text", description, truncate_dim=EMBEDDING_TRUNCATE_DIM
+        )
+    return vector, f"scene description: {description}"
+
+
+def _extend_page(
+    response_text: List[str],
+    items: list,
+    format_full,
+    format_compact,
+    columns: str,
+    arguments: dict,
+    page: int,
+):
+    """
+    Append a page's items to response_text in the requested response_mode,
+    stopping at max_response_bytes with a note on how to fetch the rest
+    """
+    compact = arguments.get("response_mode", RESPONSE_MODE) == "compact"
+    max_bytes = arguments.get("max_response_bytes", MAX_RESPONSE_BYTES)
+    if compact:
+        response_text.append(columns)
+    used = sum(len(line.encode("utf-8")) + 1 for line in response_text)
+    formatted, omitted = budget_items(
+        items, format_compact if compact else format_full, max_bytes, used
+    )
+    response_text.extend(formatted)
+    if omitted:
+        response_text.append(omission_note(omitted, len(items), max_bytes, page))
+
+
+def _format_search_page(
+    search_id: str, page: int, items_per_page: int, arguments: dict
+) -> str:
+    """
+    Page of a cached search-remote-videos or find-similar-segments result
+    (reading the entry also extends its TTL)
+    """
+    cache_entry = _cached_search(search_id, "results")
+    cached_results = cache_entry["results"]
+    total_items = len(cached_results)
+    total_pages = (total_items + items_per_page - 1) // items_per_page
+
+    start_idx = (page - 1) * items_per_page
+    end_idx = min(start_idx + items_per_page, total_items)
+
+    # Rebuild and format only the requested page
+    current_page_items = cached_results.page(start_idx, end_idx)
+
+    # Format the paginated results
+    query_info = cache_entry.get("query", "unknown")
+    response_text = []
+    response_text.append(
+        f"Search Results for '{query_info}' (Page {page}/{total_pages}, showing items {start_idx+1}-{end_idx} of {total_items})"
+    )
+
+    # Add embedding note if it exists in the cache
+    embedding_note = cache_entry.get("embedding_note")
+    if embedding_note:
+        response_text.append(embedding_note)
+
+    if len(current_page_items) > 0:
+        _extend_page(
+            response_text,
+            current_page_items,
+            format_fused_result,
+            compact_fused_row,
+            FUSED_COLUMNS,
+            arguments,
+            page,
+        )
+    else:
+        response_text.append("No items to display on this page.")
+
+    # Add pagination info with navigation options
+    pagination_info = []
+    if page > 1:
+        pagination_info.append(
+            f"Previous page: call search-remote-videos with search_id='{search_id}' and page={page-1}"
+        )
+
+    has_more = page < total_pages
+    if has_more:
+        pagination_info.append(
+            f"Next page: call search-remote-videos with search_id='{search_id}' and page={page+1}"
+        )
+
+    if pagination_info:
+        response_text.append("\nNavigation options:")
+        response_text.extend(pagination_info)
+
+    if not has_more:
+        response_text.append("\nEnd of results.")
+
+    return "\n".join(response_text)
+
+
+def _format_batch_page(
+    search_id: str,
+    groups: List[dict],
+    page: int,
+    items_per_page: int,
+    arguments: dict,
+) -> str:
+    """One page of a batch search: the same slice of every query's results"""
+    total_pages = max(
+        1,
+        *((len(g["results"]) + items_per_page - 1) // items_per_page for g in groups),
+    )
+    start_idx = (page - 1) * items_per_page
+    response_text = [
+        f"Batch search results for {len(groups)} queries (Page {page}/{total_pages}, up to {items_per_page} items per query)"
+    ]
+    for group in groups:
+        results = group["results"]
+        page_items = results.page(start_idx, start_idx + items_per_page)
+        response_text.append(
+            f"\n=== Query: '{group['query']}' ({len(results)} results) ==="
+        )
+        response_text.extend(group["notes"])
+        if page_items:
+            with search_timings.time("format"):
+                _extend_page(
+                    response_text,
+                    page_items,
+                    format_fused_result,
+                    compact_fused_row,
+                    FUSED_COLUMNS,
+                    arguments,
+                    page,
+                )
+        else:
+            response_text.append("No more results for this query.")
+
+    navigation = []
+    if page > 1:
+        navigation.append(
+            f"Previous page: call search-remote-videos-batch with search_id='{search_id}' and page={page - 1}"
+        )
+    has_more = page < total_pages
+    if has_more:
+        navigation.append(
+            f"Next page: call search-remote-videos-batch with search_id='{search_id}' and page={page + 1}"
+        )
+    if navigation:
+        response_text.append("\nNavigation options:")
+        response_text.extend(navigation)
+    if not has_more:
+        response_text.append("\nEnd of results.")
+    return "\n".join(response_text)
+
+
+def opentimeline_command(
+    json_file: str, otio_file: str, python: Tuple[str, ...] = ("uv", "run", "python")
+) -> List[str]:
+    """
+    Command edit-locally converts a downloaded edit with. It runs as a module,
+    so generate_opentimeline's package-relative imports resolve.
+    """
+    return [
+        *python,
+        "-m",
+        "video_editor_mcp.generate_opentimeline",
+        "--file",
+        json_file,
+        "--output",
+        otio_file,
+    ]
+
+
 @server.call_tool()
 async def handle_call_tool(
     name: str, arguments: dict | None
 ) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
     """
-    Handle tool execution requests.
+    Handle tool execution requests, with every outbound call they make
+    bounded by the tool's time budget.
+    """
+    with call_deadline(TOOL_DEADLINES.get(name, TOOL_DEADLINE)):
+        return await _call_tool(name, arguments)
+
+
+async def _call_tool(
+    name: str, arguments: dict | None
+) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+    """
     Tools can modify server state and notify clients of changes.
     """
     if name not in tools:
@@ -1518,7 +2581,6 @@ async def handle_call_tool(
         raise ValueError("Missing arguments")
 
     # Store some tool results in server state for pagination
-    global _search_result_cache
 
     if name == "create-videojungle-project" and arguments:
         namez = arguments.get("name")
@@ -1528,7 +2590,13 @@ async def handle_call_tool(
             raise ValueError("Missing project name")
 
         # Create a new project
-        project = vj.projects.create(name=namez, description=description)
+        project = await blocking.run(
+            "create-videojungle-project",
+            vj.projects.create,
+            name=namez,
+            description=description,
+        )
+        project_list_cache.add(project)
 
         # Notify clients that resources have changed
         await server.request_context.session.send_resource_list_changed()
@@ -1547,23 +2615,14 @@ async def handle_call_tool(
         if not project_id or not edit_id:
             raise ValueError("Missing edit and / or  project id")
         env_vars = {"VJ_API_KEY": VJ_API_KEY, "PATH": os.environ["PATH"]}
-        edit_data = vj.projects.get_edit(project_id, edit_id)
+        edit_data = await project_cache.get_edit(project_id, edit_id)
         formatted_name = edit_data["name"].replace(" ", "-")
         with open(f"{formatted_name}.json", "w") as f:
             json.dump(edit_data, f, indent=4)
         logging.info(f"edit data is: {edit_data}")
         logging.info(f"current directory is: {os.getcwd()}")
         subprocess.Popen(
-            [
-                "uv",
-                "run",
-                "python",
-                "./src/video_editor_mcp/generate_opentimeline.py",
-                "--file",
-                f"{formatted_name}.json",
-                "--output",
-                f"{formatted_name}.otio",
-            ],
+            opentimeline_command(f"{formatted_name}.json", f"{formatted_name}.otio"),
             env=env_vars,
         )
 
@@ -1582,7 +2641,9 @@ async def handle_call_tool(
             raise ValueError("Missing name or content")
 
         # Update server state
-        vj.video_files.create(name=name, filename=str(url), upload_method="url")
+        await avj.video_files.create(name=name, filename=str(url), upload_method="url")
+        project_list_cache.invalidate()
+        query_result_cache.invalidate()
 
         # Notify clients that resources have changed
         await server.request_context.session.send_resource_list_changed()
@@ -1592,81 +2653,212 @@ async def handle_call_tool(
                 text=f"Added video '{name}' with url: {url}",
             )
         ]
-    if name == "search-remote-videos" and arguments:
-        # Check if this is a pagination request
-        search_id = arguments.get("search_id")
-        page = arguments.get("page", 1)
-        items_per_page = arguments.get("items_per_page", 5)
-
-        # Run cache cleanup
-        cleanup_cache()
+    if name == "find-similar-segments" and arguments:
+        if arguments.get("search_id"):
+            # Same pagination contract (and cache) as search-remote-videos
+            return [
+                types.TextContent(
+                    type="text",
+                    text=_format_search_page(
+                        arguments["search_id"],
+                        arguments.get("page", 1),
+                        arguments.get("items_per_page", 5),
+                        arguments,
+                    ),
+                )
+            ]
 
-        # If we have a search_id, we're doing pagination
-        if search_id and search_id in _search_result_cache:
-            cache_entry = _search_result_cache[search_id]
-            cached_results = cache_entry["results"]
-            total_items = len(cached_results)
-            total_pages = (total_items + items_per_page - 1) // items_per_page
+        video_id = arguments.get("video_id")
+        time_seconds = to_seconds(arguments.get("timestamp"))
+        if not video_id or time_seconds is None:
+            raise ValueError(
+                "video_id and a timestamp (seconds or HH:MM:SS) are required"
+            )
+        limit = arguments.get("limit", 10)
+        items_per_page = arguments.get("items_per_page", 5)
+        include_same_video = arguments.get("include_same_video", True)
 
-            # Update timestamp on access
-            _search_result_cache[search_id]["timestamp"] = time.time()
+        reference, source = await _reference_embedding(
+            video_id,
+            time_seconds,
+            arguments.get("embedding_wait_seconds", EMBEDDING_READY_TIMEOUT),
+        )
+        # Over-fetch so dropping the reference segment itself still fills the limit
+        neighbours = await asyncio.wait_for(
+            _semantic_lookup(reference, 2 * limit + 1), EMBEDDING_SEARCH_DEADLINE
+        )
+        similar = [
+            segment
+            for segment in neighbours
+            if str(segment.get("video_id")) != str(video_id)
+            or (
+                include_same_video
+                and abs((to_seconds(segment.get("timepoint")) or 0.0) - time_seconds)
+                > SIMILAR_SEGMENT_MAX_OFFSET
+            )
+        ]
+        all_results = _fuse([], similar, limit)
 
-            start_idx = (page - 1) * items_per_page
-            end_idx = min(start_idx + items_per_page, total_items)
+        query_display = f"similar to {video_id} at {time_seconds:g}s"
+        note = f"Reference: {source}"
+        new_search_id = str(uuid.uuid4())
+        _search_result_cache[new_search_id] = {
+            "results": all_results,
+            "query": query_display,
+            "embedding_note": note,
+        }
 
-            # Get current page items
-            current_page_items = cached_results[start_idx:end_idx]
+        total_items = len(all_results)
+        total_pages = max((total_items + items_per_page - 1) // items_per_page, 1)
+        response_text = [
+            f"Search Results for '{query_display}' (Page 1/{total_pages}, showing items 1-{min(items_per_page, total_items)} of {total_items})",
+            note,
+        ]
+        first_page_items = all_results.page(0, items_per_page)
+        if first_page_items:
+            _extend_page(
+                response_text,
+                first_page_items,
+                format_fused_result,
+                compact_fused_row,
+                FUSED_COLUMNS,
+                arguments,
+                1,
+            )
+        else:
+            response_text.append("No similar segments found.")
 
-            # Format the paginated results
-            query_info = cache_entry.get("query", "unknown")
-            response_text = []
+        if total_pages > 1:
+            response_text.append("\nNavigation options:")
             response_text.append(
-                f"Search Results for '{query_info}' (Page {page}/{total_pages}, showing items {start_idx+1}-{end_idx} of {total_items})"
+                f"Next page: call search-remote-videos with search_id='{new_search_id}' and page=2"
             )
+        else:
+            response_text.append("\nEnd of results.")
 
-            # Add embedding note if it exists in the cache
-            embedding_note = cache_entry.get("embedding_note")
-            if embedding_note:
-                response_text.append(embedding_note)
+        return [types.TextContent(type="text", text="\n".join(response_text))]
 
-            # Format each item based on whether it's a regular result or an embedding result
-            if len(current_page_items) > 0:
-                if (
-                    isinstance(current_page_items[0], dict)
-                    and "video_id" in current_page_items[0]
-                ):
-                    response_text.extend(
-                        format_video_info(video) for video in current_page_items
-                    )
-                else:
-                    response_text.extend(current_page_items)
-            else:
-                response_text.append("No items to display on this page.")
+    if name == "search-remote-videos-batch" and arguments:
+        search_id = arguments.get("search_id")
+        page = arguments.get("page", 1)
+        items_per_page = arguments.get("items_per_page", 3)
 
-            # Add pagination info with navigation options
-            pagination_info = []
-            if page > 1:
-                pagination_info.append(
-                    f"Previous page: call search-remote-videos with search_id='{search_id}' and page={page-1}"
+        # Pagination over a previous batch (reading extends its TTL)
+        if search_id:
+            cache_entry = _cached_search(search_id, "groups")
+            return [
+                types.TextContent(
+                    type="text",
+                    text=_format_batch_page(
+                        search_id,
+                        cache_entry["groups"],
+                        page,
+                        items_per_page,
+                        arguments,
+                    ),
                 )
+            ]
 
-            has_more = page < total_pages
-            if has_more:
-                pagination_info.append(
-                    f"Next page: call search-remote-videos with search_id='{search_id}' and page={page+1}"
-                )
+        logging.info(f"search-remote-videos-batch received arguments: {arguments}")
+        queries = list(
+            dict.fromkeys(
+                q.strip() for q in arguments.get("queries") or [] if q.strip()
+            )
+        )
+        if not queries:
+            raise ValueError("At least one query must be provided")
 
-            if pagination_info:
-                response_text.append("\nNavigation options:")
-                response_text.extend(pagination_info)
+        limit = arguments.get("limit", 10)
+        tags = arguments.get("tags", None)
+        shared_params = {
+            "limit": limit,
+            "include_segments": arguments.get("include_segments", True),
+            "include_related": arguments.get("include_related", False),
+            "duration_min": arguments.get("duration_min", None),
+            "duration_max": arguments.get("duration_max", None),
+            "created_after": arguments.get("created_after", None),
+            "created_before": arguments.get("created_before", None),
+        }
+        if tags:
+            shared_params["tags"] = json.loads(tags) if isinstance(tags, str) else tags
+        if arguments.get("project_id"):
+            shared_params["project_id"] = str(arguments["project_id"])
+        query_params = [{**shared_params, "query": query} for query in queries]
+
+        model_id = f"{model_loader.text_model_id}:{EMBEDDING_TRUNCATE_DIM}"
+        cache_keys = [search_cache_key(params, model_id) for params in query_params]
+        outcomes = [query_result_cache.get(key) for key in cache_keys]
+        missing = [i for i, outcome in enumerate(outcomes) if outcome is None]
+        if missing:
+            # All uncached queries share one embedding forward pass, and their
+            # keyword searches run concurrently alongside it
+            embedding_outcomes, *keyword_outcomes = await asyncio.gather(
+                _embedding_search_many(
+                    [queries[i] for i in missing],
+                    limit,
+                    arguments.get("embedding_wait_seconds", EMBEDDING_READY_TIMEOUT),
+                ),
+                *(
+                    asyncio.wait_for(
+                        _keyword_search(query_params[i]), KEYWORD_SEARCH_DEADLINE
+                    )
+                    for i in missing
+                ),
+                return_exceptions=True,
+            )
+            if isinstance(embedding_outcomes, Exception):
+                embedding_outcomes = [embedding_outcomes] * len(missing)
+            for i, embedding_outcome, videos_outcome in zip(
+                missing, embedding_outcomes, keyword_outcomes
+            ):
+                outcomes[i] = (embedding_outcome, videos_outcome)
+                if not isinstance(embedding_outcome, Exception) and not isinstance(
+                    videos_outcome, Exception
+                ):
+                    query_result_cache.put(
+                        cache_keys[i],
+                        outcomes[i],
+                        project_id=shared_params.get("project_id"),
+                    )
 
-            if not has_more:
-                response_text.append("\nEnd of results.")
+        groups = []
+        for query, (embedding_outcome, videos_outcome) in zip(queries, outcomes):
+            embedding_results, videos, notes = _resolve_search_outcomes(
+                embedding_outcome, videos_outcome
+            )
+            groups.append(
+                {
+                    "query": query,
+                    "results": _fuse(videos, embedding_results, limit),
+                    "notes": notes,
+                }
+            )
+
+        new_search_id = str(uuid.uuid4())
+        _search_result_cache[new_search_id] = {"groups": groups}
+        return [
+            types.TextContent(
+                type="text",
+                text=_format_batch_page(
+                    new_search_id, groups, 1, items_per_page, arguments
+                ),
+            )
+        ]
+
+    if name == "search-remote-videos" and arguments:
+        # Check if this is a pagination request
+        search_id = arguments.get("search_id")
+        page = arguments.get("page", 1)
+        items_per_page = arguments.get("items_per_page", 5)
 
+        # If we have a search_id, we're doing pagination
+        if search_id:
             return [
                 types.TextContent(
                     type="text",
-                    text="\n".join(response_text),
+                    text=_format_search_page(
+                        search_id, page, items_per_page, arguments
+                    ),
                 )
             ]
 
@@ -1717,59 +2909,42 @@ async def handle_call_tool(
             # Convert UUID to string if it's not already a string
             search_params["project_id"] = str(project_id)
 
-        embedding_results = []
-        embedding_search_formatted = []
-        embedding_note = None
-
-        # If we have a text query, try embedding search but fallback to regular search if model is still loading
-        if query:
-            try:
-                embeddings = model_loader.encode_text(query)
-                response = model_loader.post_embeddings(
-                    embeddings,
-                    "https://api.video-jungle.com/video-file/embedding-search",
-                    headers={
-                        "Content-Type": "application/json",
-                        "X-API-KEY": VJ_API_KEY,
-                    },
+        cache_key = search_cache_key(
+            search_params, f"{model_loader.text_model_id}:{EMBEDDING_TRUNCATE_DIM}"
+        )
+        cached = query_result_cache.get(cache_key)
+        logging.info(f"Query result cache stats: {query_result_cache.stats()}")
+        if cached is not None:
+            embedding_outcome, videos_outcome = cached
+        else:
+            # Run the semantic and keyword legs concurrently, each with its own
+            # deadline, so latency is the slower leg rather than their sum
+            embedding_wait = arguments.get(
+                "embedding_wait_seconds", EMBEDDING_READY_TIMEOUT
+            )
+            embedding_outcome, videos_outcome = await asyncio.gather(
+                _embedding_search(query, limit, embedding_wait)
+                if query
+                else _no_results(),
+                asyncio.wait_for(
+                    _keyword_search(search_params), KEYWORD_SEARCH_DEADLINE
+                ),
+                return_exceptions=True,
+            )
+            # Only complete results are reused, never a fallback or partial one
+            if not isinstance(embedding_outcome, Exception) and not isinstance(
+                videos_outcome, Exception
+            ):
+                query_result_cache.put(
+                    cache_key,
+                    (embedding_outcome, videos_outcome),
+                    project_id=search_params.get("project_id"),
                 )
 
-                logging.info(f"Response is: {response.json()}")
-                if response.status_code != 200:
-                    raise RuntimeError(f"Error searching for videos: {response.text}")
-
-                embedding_results = response.json()
-                embedding_search_formatted = [
-                    format_single_video(video) for video in embedding_results
-                ]
-            except Exception as e:
-                if "still loading" in str(e):
-                    logging.warning(
-                        "Embedding model still loading, falling back to text-only search"
-                    )
-                    embedding_results = []
-                    embedding_search_formatted = []
-                    # Add note that will be displayed to the user
-                    embedding_note = "Note: Embedding-based semantic search is still initializing. Only text-based search results are shown. Please try again later for more accurate semantic search results."
-                else:
-                    # For other errors, log and continue with regular search
-                    logging.error(f"Error in embedding search: {e}")
-                    embedding_results = []
-                    embedding_search_formatted = []
-
-        # Get regular search results
-        logging.info(
-            f"Search params being passed to vj.video_files.search: {search_params}"
+        embedding_results, videos, search_notes = _resolve_search_outcomes(
+            embedding_outcome, videos_outcome
         )
-        logging.info(f"VJ client: {vj}, API key present: {bool(VJ_API_KEY)}")
-        try:
-            videos = vj.video_files.search(**search_params)
-            logging.info(f"Search returned {len(videos)} videos")
-            if videos:
-                logging.info(f"First video: {videos[0]}")
-        except Exception as e:
-            logging.error(f"Error in vj.video_files.search: {e}")
-            videos = []
+        embedding_note = "\n".join(search_notes) or None
         logging.info(f"num videos are: {len(videos)}")
 
         # If no results found, return a helpful message
@@ -1782,7 +2957,14 @@ async def handle_call_tool(
             ]
 
         # If only a few results, return them directly without pagination
-        if len(videos) <= 3 and len(videos) >= 1 and not embedding_results:
+        # (unless the caller asked for a compact or size-bounded response)
+        if (
+            len(videos) <= 3
+            and len(videos) >= 1
+            and not embedding_results
+            and arguments.get("response_mode", RESPONSE_MODE) == "full"
+            and arguments.get("max_response_bytes", MAX_RESPONSE_BYTES) is None
+        ):
             return [
                 types.TextContent(
                     type="text",
@@ -1791,23 +2973,15 @@ async def handle_call_tool(
                 for video in videos
             ]
 
-        # For larger result sets, set up pagination
-        formatted_videos = [format_video_info(video) for video in videos]
+        # For larger result sets, rank both legs jointly and set up pagination
+        all_results = _fuse(videos, embedding_results, limit)
 
         # Store the results in the cache for pagination
         new_search_id = str(uuid.uuid4())
 
-        all_results = []
-        if query and embedding_results:
-            # Store both types of results
-            all_results = formatted_videos + embedding_search_formatted
-        else:
-            all_results = formatted_videos
-
-        # Store results with timestamp and embedding note if present
+        # Store results with the embedding note if present
         _search_result_cache[new_search_id] = {
             "results": all_results,
-            "timestamp": time.time(),
             "query": query or "tag-search",
             "embedding_note": embedding_note,
         }
@@ -1828,9 +3002,18 @@ async def handle_call_tool(
             response_text.append(embedding_note)
 
         # Show first page items
-        first_page_items = all_results[:items_per_page]
+        first_page_items = all_results.page(0, items_per_page)
         if first_page_items:
-            response_text.extend(first_page_items)
+            with search_timings.time("format"):
+                _extend_page(
+                    response_text,
+                    first_page_items,
+                    format_fused_result,
+                    compact_fused_row,
+                    FUSED_COLUMNS,
+                    arguments,
+                    1,
+                )
         else:
             response_text.append("No results found matching your query.")
 
@@ -1870,9 +3053,18 @@ async def handle_call_tool(
             start_date = arguments.get("start_date")
             end_date = arguments.get("end_date")
 
+        from .search_local_videos import get_videos_by_keyword
+
         try:
             db = photos_loader.db
-            videos = get_videos_by_keyword(db, keyword, start_date, end_date)
+            videos = await blocking.run(
+                "search-local-videos",
+                get_videos_by_keyword,
+                db,
+                keyword,
+                start_date,
+                end_date,
+            )
             return [
                 types.TextContent(
                     type="text",
@@ -1887,11 +3079,12 @@ async def handle_call_tool(
     if name == "generate-edit-from-videos" and arguments:
         edit = arguments.get("edit")
         project = arguments.get("project_id")
-        name = arguments.get("name")  # type: ignore
+        edit_name = arguments.get("name")
         open_editor = arguments.get("open_editor")
         resolution = arguments.get("resolution")
         audio_asset = arguments.get("audio_asset")
         subtitles = arguments.get("subtitles", True)
+        merge_cuts = arguments.get("merge_continuous_cuts", False)
         created = False
 
         logging.info(f"edit is: {edit} and the type is: {type(edit)}")
@@ -1904,7 +3097,7 @@ async def handle_call_tool(
             raise ValueError("Missing project")
         if not resolution:
             resolution = "1080x1920"
-        if not name:
+        if not edit_name:
             raise ValueError("Missing name for edit")
         if resolution == "1080p":
             resolution = "1920x1080"
@@ -1946,6 +3139,7 @@ async def handle_call_tool(
 
             updated_edit.append(clip_data)
 
+        updated_edit = compact_edit_cuts(updated_edit, merge=merge_cuts)
         logging.info(f"updated edit is: {updated_edit}")
 
         # Process audio asset if provided
@@ -1969,7 +3163,7 @@ async def handle_call_tool(
             "video_output_format": "mp4",
             "video_output_resolution": resolution,
             "video_output_fps": 60.0,
-            "name": name,
+            "name": edit_name,
             "video_output_filename": "output_video.mp4",
             "audio_overlay": audio_overlay,
             "video_series_sequential": updated_edit,
@@ -1978,21 +3172,28 @@ async def handle_call_tool(
         }
 
         try:
-            proj = vj.projects.get(project)
+            proj = await project_cache.get(project)
         except Exception as e:
             logging.info(f"project not found, creating new project because {e}")
-            proj = vj.projects.create(
-                name=project, description="Claude generated project"
+            proj = await blocking.run(
+                name,
+                vj.projects.create,
+                name=project,
+                description="Claude generated project",
             )
+            project_list_cache.add(proj)
             project = proj.id
             created = True
 
         logging.info(f"video edit is: {json_edit}")
 
-        edit = vj.projects.render_edit(project, json_edit)
+        edit = await blocking.run(name, vj.projects.render_edit, project, json_edit)
+        project_cache.invalidate(project)
 
-        webbrowser.open(
-            f"https://app.video-jungle.com/projects/{proj.id}/edits/{edit['edit_id']}"
+        await blocking.run(
+            name,
+            webbrowser.open,
+            f"https://app.video-jungle.com/projects/{proj.id}/edits/{edit['edit_id']}",
         )
         global BROWSER_OPEN
         BROWSER_OPEN = True
@@ -2018,6 +3219,7 @@ async def handle_call_tool(
         video_id = arguments.get("video_id")
 
         resolution = arguments.get("resolution")
+        merge_cuts = arguments.get("merge_continuous_cuts", False)
         created = False
 
         logging.info(f"edit is: {edit} and the type is: {type(edit)}")
@@ -2053,6 +3255,7 @@ async def handle_call_tool(
         except Exception as e:
             raise ValueError(f"Error updating edit: {e}")
 
+        updated_edit = compact_edit_cuts(updated_edit, merge=merge_cuts)
         logging.info(f"updated edit is: {updated_edit}")
 
         json_edit = {
@@ -2066,17 +3269,22 @@ async def handle_call_tool(
         }
 
         try:
-            proj = vj.projects.get(project)
+            proj = await project_cache.get(project)
         except Exception:
-            proj = vj.projects.create(
-                name=project, description="Claude generated project"
+            proj = await blocking.run(
+                name,
+                vj.projects.create,
+                name=project,
+                description="Claude generated project",
             )
+            project_list_cache.add(proj)
             project = proj.id
             created = True
 
         logging.info(f"video edit is: {json_edit}")
         try:
-            edit = vj.projects.render_edit(project, json_edit)
+            edit = await blocking.run(name, vj.projects.render_edit, project, json_edit)
+            project_cache.invalidate(project)
         except Exception as e:
             logging.error(f"Error rendering edit: {e}")
         logging.info(f"edit is: {edit}")
@@ -2131,18 +3339,17 @@ async def handle_call_tool(
                     f"Resolution must be in the format 'widthxheight' where width and height are integers: {e}"
                 )
 
-        # Try to get the existing project
-        try:
-            proj = vj.projects.get(project_id)
-        except Exception as e:
-            raise ValueError(f"Project with ID {project_id} not found: {e}")
-
-        # Try to get the existing edit
-        try:
-            existing_edit = vj.projects.get_edit(project_id, edit_id)
-        except Exception as e:
+        # Fetch the project (to validate it) and the existing edit concurrently
+        proj, existing_edit = await asyncio.gather(
+            project_cache.get(project_id),
+            project_cache.get_edit(project_id, edit_id),
+            return_exceptions=True,
+        )
+        if isinstance(proj, Exception):
+            raise ValueError(f"Project with ID {project_id} not found: {proj}")
+        if isinstance(existing_edit, Exception):
             raise ValueError(
-                f"Edit with ID {edit_id} not found in project {project_id}: {e}"
+                f"Edit with ID {edit_id} not found in project {project_id}: {existing_edit}"
             )
 
         # Process video clips if provided
@@ -2210,12 +3417,17 @@ async def handle_call_tool(
         logging.info(f"Updating edit {edit_id} with: {update_json}")
 
         # Call the API to update the edit
-        updated_edit = vj.projects.update_edit(project_id, edit_id, update_json)
+        updated_edit = await blocking.run(
+            name, vj.projects.update_edit, project_id, edit_id, update_json
+        )
+        project_cache.invalidate(project_id)
 
         # Optionally open the browser to the updated edit
         if not BROWSER_OPEN:
-            webbrowser.open(
-                f"https://app.video-jungle.com/projects/{project_id}/edits/{edit_id}"
+            await blocking.run(
+                name,
+                webbrowser.open,
+                f"https://app.video-jungle.com/projects/{project_id}/edits/{edit_id}",
             )
 
         return [
@@ -2237,18 +3449,14 @@ async def handle_call_tool(
         if not project_id:
             raise ValueError("Missing project_id parameter")
 
-        # Run cache cleanup
-        cleanup_cache()
-
         # Check if this is a pagination request using an existing cache
-        if asset_cache_id and asset_cache_id in _project_assets_cache:
-            cache_entry = _project_assets_cache[asset_cache_id]
+        cache_entry = (
+            _project_assets_cache.get(asset_cache_id) if asset_cache_id else None
+        )
+        if cache_entry is not None:
             cached_assets = cache_entry["assets"]
             project_info = cache_entry.get("project_info", {})
 
-            # Update timestamp on access
-            _project_assets_cache[asset_cache_id]["timestamp"] = time.time()
-
             # Calculate pagination
             total_items = len(cached_assets)
             total_pages = (total_items + items_per_page - 1) // items_per_page
@@ -2275,10 +3483,15 @@ async def handle_call_tool(
 
             # Format each asset
             if current_page_items:
-                formatted_assets = [
-                    format_asset_info(asset) for asset in current_page_items
-                ]
-                response_text.extend(formatted_assets)
+                _extend_page(
+                    response_text,
+                    current_page_items,
+                    format_asset_info,
+                    compact_asset_row,
+                    ASSET_COLUMNS,
+                    arguments,
+                    page,
+                )
             else:
                 response_text.append("No assets to display on this page.")
 
@@ -2307,7 +3520,7 @@ async def handle_call_tool(
         # This is a new request - get the project and its assets
         try:
             # Fetch project data
-            project = vj.projects.get(project_id)
+            project = await project_cache.get(project_id)
             logging.info(f"Retrieved project: {project.name} (ID: {project_id})")
 
             # Get project data as a dictionary so we can extract assets
@@ -2336,7 +3549,9 @@ async def handle_call_tool(
                     )
                 ]
 
-            # Store results in cache for pagination
+            # Store results in cache for pagination; every page, the first
+            # included, is formatted from the compacted assets
+            project_assets = [compact_asset(asset) for asset in project_assets]
             new_cache_id = str(uuid.uuid4())
             _project_assets_cache[new_cache_id] = {
                 "assets": project_assets,
@@ -2345,7 +3560,6 @@ async def handle_call_tool(
                     "name": project.name,
                     "description": project.description,
                 },
-                "timestamp": time.time(),
             }
 
             # Calculate pagination
@@ -2369,10 +3583,15 @@ async def handle_call_tool(
 
             # Format assets
             if first_page_items:
-                formatted_assets = [
-                    format_asset_info(asset) for asset in first_page_items
-                ]
-                response_text.extend(formatted_assets)
+                _extend_page(
+                    response_text,
+                    first_page_items,
+                    format_asset_info,
+                    compact_asset_row,
+                    ASSET_COLUMNS,
+                    arguments,
+                    1,
+                )
             else:
                 response_text.append("No assets to display.")
 
@@ -2460,7 +3679,9 @@ async def handle_call_tool(
             env["PYTHONPATH"] = os.getcwd()
 
             # Use subprocess.run with proper error handling instead of Popen
-            result = subprocess.run(
+            result = await blocking.run(
+                name,
+                subprocess.run,
                 ["uv", "run", "python", script_path, chart_data_path, chart_type],
                 capture_output=True,
                 text=True,
@@ -2496,6 +3717,16 @@ async def handle_call_tool(
 
 
 async def main():
+    project_list_cache.refresh()
+    if segment_index_syncer.sync_url:
+        segment_index_syncer.start()
+
+    # Preload the embedding model once the server is up, rather than at import
+    if os.environ.get("VJ_MODEL_PRELOAD", "1") != "0":
+        asyncio.get_running_loop().call_later(
+            MODEL_PRELOAD_DELAY, model_loader.start_loading
+        )
+
     # Run the server using stdin/stdout streams
     async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
         await server.run(
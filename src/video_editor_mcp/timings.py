@@ -0,0 +1,82 @@
+import os
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from typing import Dict, Iterable, Optional
+
+from .lazy_imports import LazyModule
+
+np = LazyModule("numpy")
+
+
+class StageTimings:
+    """
+    Rolling latency samples per named stage (encode, network, fuse, ...),
+    kept in bounded deques so long-running servers don't grow them forever.
+    """
+
+    def __init__(self, max_samples: int = 10000):
+        self.max_samples = max_samples
+        self._samples: Dict[str, deque] = defaultdict(
+            lambda: deque(maxlen=self.max_samples)
+        )
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float):
+        with self._lock:
+            self._samples[stage].append(seconds)
+
+    @contextmanager
+    def time(self, stage: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - started)
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+
+    def summary(self, percentiles: Iterable[float] = (50, 95, 99)) -> Dict[str, dict]:
+        """Per stage: sample count, mean and the given percentiles, in ms"""
+        percentiles = list(percentiles)
+        with self._lock:
+            samples = {stage: list(values) for stage, values in self._samples.items()}
+        summary = {}
+        for stage, values in samples.items():
+            if not values:
+                continue
+            ms = 1000 * np.asarray(values)
+            summary[stage] = {
+                "count": len(values),
+                "mean_ms": float(ms.mean()),
+                **{
+                    f"p{p:g}_ms": float(v)
+                    for p, v in zip(percentiles, np.percentile(ms, percentiles))
+                },
+            }
+        return summary
+
+
+def max_rss_mb() -> Optional[float]:
+    """Peak resident memory of this process in MB, None where unsupported"""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes on Linux
+    return max_rss / (1024 * 1024) if sys.platform == "darwin" else max_rss / 1024
+
+
+def current_rss_mb() -> Optional[float]:
+    """Resident memory of this process right now in MB, None where unsupported"""
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):  # Not Linux
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
@@ -0,0 +1,395 @@
+import json
+import logging
+import os
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .segments import to_seconds
+
+DEFAULT_INDEX_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "video-editor-mcp", "segment-index"
+)
+
+# A page of segment records and the cursor to resume from, see SegmentVectorIndex.sync
+FetchPage = Callable[[Optional[str]], Tuple[List[dict], Optional[str]]]
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+def _kmeans(
+    data: np.ndarray, n_clusters: int, iterations: int = 10, seed: int = 0
+) -> np.ndarray:
+    """Spherical k-means over normalized vectors, returns unit-length centroids"""
+    rng = np.random.default_rng(seed)
+    centroids = data[rng.choice(len(data), n_clusters, replace=False)].copy()
+    for _ in range(iterations):
+        assignments = np.argmax(data @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignments, data)
+        counts = np.bincount(assignments, minlength=n_clusters)
+        # Keep the previous centroid for clusters that lost all their members
+        empty = counts == 0
+        sums[empty] = centroids[empty]
+        centroids = _normalize(sums)
+    return centroids
+
+
+class SegmentVectorIndex:
+    """
+    Local approximate nearest neighbour index over video segment embeddings.
+
+    Vectors live in a memory-mapped, append-only matrix on disk with one JSON
+    metadata line per row, so the index survives restarts and only new
+    segments are written on sync. Once it holds `min_train_size` segments an
+    IVF layer (k-means centroids with per-centroid row lists) is trained and
+    queries only scan the `nprobe` closest lists; smaller indexes are searched
+    exhaustively. Rows added after training are assigned to lists as they
+    come in, with their assignments appended to disk, so an add costs time in
+    proportion to its own size rather than the index's.
+
+    Records are keyed by (video_id, timepoint); re-adding a key supersedes
+    the earlier row.
+    """
+
+    def __init__(
+        self,
+        index_dir: str = DEFAULT_INDEX_DIR,
+        dtype: str = "float16",
+        min_train_size: int = 4096,
+        nprobe: int = 8,
+    ):
+        self.index_dir = index_dir
+        self.dtype = np.dtype(dtype)
+        self.min_train_size = min_train_size
+        self.nprobe = nprobe
+        self.dim: Optional[int] = None
+        self.cursor: Optional[str] = None
+
+        self._meta: List[dict] = []
+        self._rows: Dict[Tuple[str, str], int] = {}
+        self._video_rows: Dict[str, List[int]] = {}
+        self._live = np.zeros(0, dtype=bool)
+        self._vectors: Optional[np.ndarray] = None
+        self._centroids: Optional[np.ndarray] = None
+        self._assignments = np.zeros(0, dtype=np.int32)
+        self._list_order = np.zeros(0, dtype=np.int64)
+        self._list_bounds = np.zeros(0, dtype=np.int64)
+        # Rows covered by _list_order; later ones are scanned as a small tail
+        self._listed = 0
+        self._trained_size = 0
+        self._ivf_generation = 0
+        self._lock = threading.RLock()
+
+        os.makedirs(self.index_dir, exist_ok=True)
+        self._load()
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.index_dir, name)
+
+    @staticmethod
+    def _key(record: dict) -> Tuple[str, str]:
+        return (str(record["video_id"]), str(record.get("timepoint")))
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _load(self):
+        count = 0
+        state_path = self._path("state.json")
+        if os.path.exists(state_path):
+            with open(state_path) as f:
+                state = json.load(f)
+            self.dim = state.get("dim")
+            self.cursor = state.get("cursor")
+            count = state.get("count", 0)
+        # Rows past `count` belong to an interrupted write; cut them off so
+        # the next add appends right after the last committed row
+        self._truncate(count)
+        if not count:
+            return
+
+        with open(self._path("meta.jsonl")) as f:
+            self._meta = [json.loads(line) for _, line in zip(range(count), f)]
+        self._live = np.zeros(len(self._meta), dtype=bool)
+        for row, record in enumerate(self._meta):
+            self._supersede(self._key(record), row)
+        self._map_vectors()
+
+        ivf_path = self._path("ivf.npz")
+        if os.path.exists(ivf_path):
+            self._load_ivf(np.load(ivf_path))
+        logging.info(
+            f"Loaded segment index with {len(self)} segments from {self.index_dir}"
+        )
+
+    def _truncate(self, count: int):
+        truncated = False
+        vectors_path = self._path("vectors.bin")
+        if os.path.exists(vectors_path):
+            size = count * (self.dim or 0) * self.dtype.itemsize
+            if os.path.getsize(vectors_path) > size:
+                os.truncate(vectors_path, size)
+                truncated = True
+        meta_path = self._path("meta.jsonl")
+        if os.path.exists(meta_path):
+            with open(meta_path, "rb+") as f:
+                for _ in range(count):
+                    if not f.readline():
+                        break
+                if f.read(1):
+                    f.seek(-1, os.SEEK_CUR)
+                    f.truncate()
+                    truncated = True
+        if truncated:
+            logging.warning(
+                f"Dropped rows of an interrupted write from the segment index in {self.index_dir}"
+            )
+
+    def _assignments_path(self, generation: int) -> str:
+        return self._path(f"ivf-assignments.{generation}.bin")
+
+    def _load_ivf(self, ivf):
+        self._centroids = ivf["centroids"]
+        self._trained_size = int(ivf["trained_size"])
+        count = len(self._meta)
+        if "generation" not in ivf:
+            # Older indexes kept assignments in ivf.npz, rewritten on every add
+            self._assignments = ivf["assignments"][:count]
+            self._assignments = np.concatenate(
+                [self._assignments, self._assign(len(self._assignments))]
+            )
+            self._save_ivf()
+            return
+        self._ivf_generation = int(ivf["generation"])
+        path = self._assignments_path(self._ivf_generation)
+        if os.path.exists(path):
+            if os.path.getsize(path) > count * 4:
+                os.truncate(path, count * 4)
+            self._assignments = np.fromfile(path, dtype="<i4").astype(np.int32)
+        self._append_assignments(self._assign(len(self._assignments)))
+        self._rebuild_lists()
+
+    def _save_ivf(self):
+        """Write a new generation of centroids and assignments, then switch to it"""
+        previous = self._assignments_path(self._ivf_generation)
+        self._ivf_generation += 1
+        self._assignments.astype("<i4").tofile(
+            self._assignments_path(self._ivf_generation)
+        )
+        tmp_path = self._path("ivf.tmp.npz")
+        np.savez(
+            tmp_path,
+            centroids=self._centroids,
+            trained_size=self._trained_size,
+            generation=self._ivf_generation,
+        )
+        os.replace(tmp_path, self._path("ivf.npz"))
+        if os.path.exists(previous):
+            os.remove(previous)
+        self._rebuild_lists()
+
+    def _save_state(self):
+        tmp_path = self._path("state.json.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(
+                {"dim": self.dim, "cursor": self.cursor, "count": len(self._meta)}, f
+            )
+        os.replace(tmp_path, self._path("state.json"))
+
+    def _map_vectors(self):
+        if self._meta:
+            self._vectors = np.memmap(
+                self._path("vectors.bin"),
+                dtype=self.dtype,
+                mode="r",
+                shape=(len(self._meta), self.dim),
+            )
+
+    def _supersede(self, key: Tuple[str, str], row: int):
+        previous = self._rows.get(key)
+        if previous is not None:
+            self._live[previous] = False
+        self._rows[key] = row
+        self._live[row] = True
+        if previous is None:
+            self._video_rows.setdefault(key[0], []).append(row)
+
+    def add(self, records: Iterable[dict]) -> int:
+        """
+        Append segment records: dicts with video_id, timepoint and embedding,
+        plus any display metadata (description, detected_items, ...).
+        """
+        vectors = []
+        metas = []
+        for record in records:
+            vector = np.asarray(record["embedding"], dtype=np.float32).reshape(-1)
+            if self.dim is None:
+                self.dim = vector.shape[0]
+            if vector.shape[0] != self.dim:
+                logging.warning(
+                    f"Skipping segment {self._key(record)} with dim {vector.shape[0]} != {self.dim}"
+                )
+                continue
+            vectors.append(vector)
+            metas.append({k: v for k, v in record.items() if k != "embedding"})
+        if not vectors:
+            return 0
+
+        matrix = _normalize(np.stack(vectors)).astype(self.dtype)
+        with self._lock:
+            start = len(self._meta)
+            with open(self._path("vectors.bin"), "ab") as f:
+                f.write(matrix.tobytes())
+            with open(self._path("meta.jsonl"), "a") as f:
+                f.writelines(json.dumps(meta) + "\n" for meta in metas)
+
+            self._meta.extend(metas)
+            self._live = np.concatenate([self._live, np.zeros(len(metas), dtype=bool)])
+            for row, meta in enumerate(metas, start):
+                self._supersede(self._key(meta), row)
+            self._map_vectors()
+
+            if self._centroids is not None and len(self) < 2 * self._trained_size:
+                self._append_assignments(self._assign(start))
+            elif len(self) >= self.min_train_size:
+                self.train()
+            self._save_state()
+        return len(metas)
+
+    def train(self, sample_size: int = 65536):
+        """(Re)build the IVF layer, using about sqrt(n) centroids"""
+        with self._lock:
+            live_rows = np.flatnonzero(self._live)
+            if len(live_rows) < self.min_train_size:
+                return
+            rng = np.random.default_rng(0)
+            sample = rng.choice(
+                live_rows, min(sample_size, len(live_rows)), replace=False
+            )
+            data = np.asarray(self._vectors[np.sort(sample)], dtype=np.float32)
+            n_clusters = int(np.sqrt(len(live_rows)))
+            self._centroids = _kmeans(data, n_clusters)
+            self._assignments = self._assign(0)
+            self._trained_size = len(live_rows)
+            self._save_ivf()
+            logging.info(
+                f"Trained segment index IVF with {n_clusters} lists over {len(live_rows)} segments"
+            )
+
+    def _assign(self, start: int, chunk_size: int = 16384) -> np.ndarray:
+        """Closest centroid of each row from `start` on"""
+        assigned = [np.zeros(0, dtype=np.int32)]
+        for chunk_start in range(start, len(self._meta), chunk_size):
+            chunk = np.asarray(
+                self._vectors[chunk_start : chunk_start + chunk_size], dtype=np.float32
+            )
+            assigned.append(
+                np.argmax(chunk @ self._centroids.T, axis=1).astype(np.int32)
+            )
+        return np.concatenate(assigned)
+
+    def _append_assignments(self, assignments: np.ndarray):
+        if not len(assignments):
+            return
+        with open(self._assignments_path(self._ivf_generation), "ab") as f:
+            f.write(assignments.astype("<i4").tobytes())
+        self._assignments = np.concatenate([self._assignments, assignments])
+        # Re-sort the lists once the unsorted tail is a sizeable share of them
+        if len(self._assignments) - self._listed > max(1024, self._listed // 8):
+            self._rebuild_lists()
+
+    def _rebuild_lists(self):
+        self._list_order = np.argsort(self._assignments, kind="stable")
+        self._list_bounds = np.searchsorted(
+            self._assignments[self._list_order], np.arange(len(self._centroids) + 1)
+        )
+        self._listed = len(self._assignments)
+
+    def _candidates(self, query: np.ndarray) -> np.ndarray:
+        if self._centroids is None:
+            return np.flatnonzero(self._live)
+        nprobe = min(self.nprobe, len(self._centroids))
+        closest = np.argpartition(-(self._centroids @ query), nprobe - 1)[:nprobe]
+        tail = np.arange(self._listed, len(self._assignments))
+        rows = np.concatenate(
+            [
+                self._list_order[self._list_bounds[c] : self._list_bounds[c + 1]]
+                for c in closest
+            ]
+            + [tail[np.isin(self._assignments[tail], closest)]]
+        )
+        return rows[self._live[rows]]
+
+    def search(self, query, k: int = 10, exact: bool = False) -> List[dict]:
+        """Return the metadata of the k closest segments, with a cosine `score`"""
+        with self._lock:
+            if not len(self):
+                return []
+            query = _normalize(np.asarray(query, dtype=np.float32).reshape(-1))
+            if query.shape[0] != self.dim:
+                raise ValueError(f"Query dim {query.shape[0]} != index dim {self.dim}")
+
+            rows = np.flatnonzero(self._live) if exact else self._candidates(query)
+            if not len(rows):
+                return []
+            scores = np.asarray(self._vectors[rows], dtype=np.float32) @ query
+            k = min(k, len(rows))
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+            return [{**self._meta[rows[i]], "score": float(scores[i])} for i in top]
+
+    def nearest(
+        self, video_id, time, max_distance: Optional[float] = None
+    ) -> Optional[Tuple[dict, np.ndarray]]:
+        """
+        Metadata and stored unit vector of the segment of `video_id` whose
+        timepoint is closest to `time`, or None if there is none within
+        `max_distance` seconds
+        """
+        time = to_seconds(time)
+        if time is None:
+            return None
+        with self._lock:
+            best_row, best_distance = None, None
+            for row in self._video_rows.get(str(video_id), []):
+                if not self._live[row]:
+                    row = self._rows[self._key(self._meta[row])]
+                timepoint = to_seconds(self._meta[row].get("timepoint"))
+                if timepoint is None:
+                    continue
+                distance = abs(timepoint - time)
+                if best_distance is None or distance < best_distance:
+                    best_row, best_distance = row, distance
+            if best_row is None or (
+                max_distance is not None and best_distance > max_distance
+            ):
+                return None
+            vector = np.asarray(self._vectors[best_row], dtype=np.float32)
+            return self._meta[best_row], vector
+
+    def sync(self, fetch_page: FetchPage) -> int:
+        """
+        Pull new segments page by page from `fetch_page(cursor)`, which returns
+        (records, next_cursor); stops when a page comes back empty.
+        """
+        added = 0
+        while True:
+            records, next_cursor = fetch_page(self.cursor)
+            if not records:
+                break
+            added += self.add(records)
+            with self._lock:
+                self.cursor = next_cursor
+                self._save_state()
+            if next_cursor is None:
+                break
+        if added:
+            logging.info(
+                f"Synced {added} segments into the local index ({len(self)} total)"
+            )
+        return added
@@ -0,0 +1,141 @@
+"""
+Request size and latency of the embedding search wire formats.
+
+Encodes random unit query embeddings in each format (JSON float lists, and
+base64 float32 / float16 / int8), posts them to a local stand-in for the
+embedding search endpoint that decodes them, and reports the body size,
+client-side encode time, round-trip POST latency and the cosine between the
+sent and the decoded vectors:
+
+    python -m video_editor_mcp.wire_benchmark --dim 768 --requests 200
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+import numpy as np
+import requests
+
+from .embedding_wire import WIRE_DTYPES, embedding_payload, payload_embeddings
+
+WIRE_FORMATS = ("json",) + tuple(WIRE_DTYPES)
+
+
+class EmbeddingEchoServer(ThreadingHTTPServer):
+    """Stand-in embedding search endpoint that decodes and echoes the embeddings"""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _EchoHandler)
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/video-file/embedding-search"
+
+
+class _EchoHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        try:
+            embeddings = payload_embeddings(json.loads(body))
+        except (KeyError, TypeError, ValueError) as e:
+            self.send_error(422, str(e))
+            return
+        data = json.dumps({"embeddings": embeddings.tolist()}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _unit_vectors(n: int, dim: int, seed: int = 0) -> np.ndarray:
+    vectors = np.random.default_rng(seed).standard_normal((n, dim))
+    return (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(np.float32)
+
+
+def run_benchmark(
+    dim: int = 768, n_requests: int = 200, truncate_dim: Optional[int] = None
+) -> dict:
+    queries = _unit_vectors(n_requests, dim)
+    server = EmbeddingEchoServer()
+    session = requests.Session()
+    report = {}
+    try:
+        for wire_format in WIRE_FORMATS:
+            sizes, encode_times, post_times, cosines = [], [], [], []
+            for query in queries:
+                started = time.perf_counter()
+                body = json.dumps(
+                    embedding_payload(
+                        query[None, :],
+                        "text_embeddings",
+                        wire_format=wire_format,
+                        truncate_dim=truncate_dim,
+                    )
+                )
+                encode_times.append(time.perf_counter() - started)
+                sizes.append(len(body))
+
+                started = time.perf_counter()
+                response = session.post(
+                    server.url,
+                    data=body,
+                    headers={"Content-Type": "application/json"},
+                )
+                response.raise_for_status()
+                post_times.append(time.perf_counter() - started)
+
+                echoed = np.asarray(response.json()["embeddings"][0])
+                sent = query[: len(echoed)]
+                cosines.append(
+                    float(
+                        echoed @ sent / (np.linalg.norm(echoed) * np.linalg.norm(sent))
+                    )
+                )
+            report[wire_format] = {
+                "bytes": float(np.mean(sizes)),
+                "encode_us": 1e6 * float(np.median(encode_times)),
+                "post_p50_ms": 1000 * float(np.percentile(post_times, 50)),
+                "post_p95_ms": 1000 * float(np.percentile(post_times, 95)),
+                "min_cosine": min(cosines),
+            }
+    finally:
+        session.close()
+        server.shutdown()
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument(
+        "--truncate-dim",
+        type=int,
+        default=None,
+        help="Matryoshka truncation applied by the base64 formats",
+    )
+    args = parser.parse_args()
+    report = run_benchmark(args.dim, args.requests, args.truncate_dim)
+    print(
+        f"{'format':<10}{'bytes':>10}{'encode us':>12}{'p50 ms':>10}{'p95 ms':>10}"
+        f"{'min cos':>10}"
+    )
+    for wire_format, stats in report.items():
+        print(
+            f"{wire_format:<10}{stats['bytes']:>10.0f}{stats['encode_us']:>12.1f}"
+            f"{stats['post_p50_ms']:>10.2f}{stats['post_p95_ms']:>10.2f}"
+            f"{stats['min_cosine']:>10.5f}"
+        )
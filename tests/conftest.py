@@ -0,0 +1,10 @@
+import logging
+import os
+
+# Importing the package imports the server, which needs an API key (falling
+# back to argv[1], which under pytest is whatever option came first)
+os.environ.setdefault("VJ_API_KEY", "test")
+
+# The server logs to app.log in the working directory unless logging is
+# already configured; keep test runs from writing it into the checkout
+logging.getLogger().addHandler(logging.NullHandler())
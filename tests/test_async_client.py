@@ -0,0 +1,271 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from video_editor_mcp import async_client
+from video_editor_mcp.async_client import AsyncVideoJungleClient
+from video_editor_mcp.resilience import CircuitOpenError, Resilience
+
+BASE_URL = "https://vj.test/api"
+
+ASSET = {
+    "id": "asset-1",
+    "keyname": "clip.mp4",
+    "url": None,
+    "download_url": None,
+    "asset_path": None,
+    "asset_type": "user",
+    "created_at": "2024-01-01T00:00:00",
+    "description": None,
+    "generated_description": None,
+    "create_parameters": None,
+    "status": "ready",
+    "uploaded": True,
+}
+PROJECT = {
+    "id": "project-1",
+    "name": "Trip",
+    "description": "Holiday footage",
+    "data": "prompt-to-video",
+    "created_at": "2024-01-01T00:00:00",
+    "owner_id": "owner",
+    "asset_count": 1,
+    "assets": [ASSET],
+    "prompts": [],
+    "scripts": [],
+}
+VIDEO_FILE = {
+    "id": "video-1",
+    "filename": "https://example.test/source.mp4",
+    "name": "Source",
+    "description": None,
+    "thumbnail": None,
+    "duration": 12.5,
+    "fps": 30.0,
+    "owner_id": "owner",
+    "size": 4,
+    "hash": None,
+    "created_at": "2024-01-01T00:00:00",
+    "recorded_at": None,
+    "key": "video-1",
+    "analysis": [],
+    "download_url": "https://files.test/video-1.mp4",
+}
+EDIT = {"id": "edit-1", "video_edit_version": "1.0", "video_series_sequential": []}
+
+# (method, path) -> JSON body served for it
+ROUTES = {
+    ("GET", "/api/projects"): [PROJECT],
+    ("GET", "/api/projects/project-1"): PROJECT,
+    ("POST", "/api/projects"): {"id": "project-1"},
+    ("GET", "/api/projects/project-1/edits/edit-1"): EDIT,
+    ("POST", "/api/projects/project-1/create-edit"): {"id": "edit-1"},
+    ("PUT", "/api/projects/project-1/edits/edit-1"): EDIT,
+    ("GET", "/api/video-file/video-1"): VIDEO_FILE,
+    ("POST", "/api/video-file"): {"id": "video-1"},
+    ("POST", "/api/video-file/search"): [{"video_id": "video-1"}],
+    ("GET", "/api/assets/asset-1"): ASSET,
+}
+
+
+class Api:
+    """MockTransport handler serving ROUTES, recording every request"""
+
+    def __init__(self, statuses=()):
+        # Status codes to answer with before serving the route normally
+        self.statuses = list(statuses)
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.statuses:
+            return httpx.Response(self.statuses.pop(0), json={"detail": "error"})
+        if request.url.host == "files.test":
+            return httpx.Response(200, content=b"data")
+        return httpx.Response(200, json=ROUTES[(request.method, request.url.path)])
+
+
+@pytest.fixture(autouse=True)
+def fresh_resilience(monkeypatch):
+    # No backoff sleeps, and breakers that don't carry over between tests
+    monkeypatch.setattr(
+        async_client,
+        "resilience",
+        Resilience(attempts=3, base_delay=0, max_delay=0, breaker_threshold=3),
+    )
+
+
+def call(api, method, *args, **kwargs):
+    async def run():
+        async with AsyncVideoJungleClient(
+            "key", base_url=BASE_URL, transport=httpx.MockTransport(api)
+        ) as avj:
+            group, name = method.split(".")
+            return await getattr(getattr(avj, group), name)(*args, **kwargs)
+
+    return asyncio.run(run())
+
+
+def test_projects():
+    api = Api()
+    assert [p.id for p in call(api, "projects.list")] == ["project-1"]
+    assert call(api, "projects.get", "project-1").assets[0].id == "asset-1"
+    assert call(api, "projects.get_edit", "project-1", "edit-1") == EDIT
+    assert call(api, "projects.update_edit", "project-1", "edit-1", EDIT) == EDIT
+    assert call(api, "projects.render_edit", "project-1", EDIT) == {"id": "edit-1"}
+    assert all(r.headers["X-API-Key"] == "key" for r in api.requests)
+    assert json.loads(api.requests[-1].content) == EDIT
+
+
+def test_project_create_fetches_the_new_project():
+    api = Api()
+    project = call(api, "projects.create", "Trip", "Holiday footage")
+    assert project.name == "Trip"
+    assert [(r.method, r.url.path) for r in api.requests] == [
+        ("POST", "/api/projects"),
+        ("GET", "/api/projects/project-1"),
+    ]
+    assert json.loads(api.requests[0].content)["template_key"] == "prompt-to-video"
+
+
+def test_video_files(tmp_path):
+    api = Api()
+    assert call(api, "video_files.get", "video-1").duration == 12.5
+    assert call(api, "video_files.create", "Source", "https://example.test/a.mp4") == {
+        "id": "video-1"
+    }
+    results = call(api, "video_files.search", query="dog", limit=5, tags=["beach"])
+    assert results == [{"video_id": "video-1"}]
+    body = json.loads(api.requests[-1].content)
+    assert (body["query"], body["limit"]) == ("dog", 5)
+    assert body["filters"]["tags"] == ["beach"]
+
+    path = tmp_path / "video.mp4"
+    assert call(api, "video_files.download", "video-1", str(path))
+    assert path.read_bytes() == b"data"
+
+
+def test_assets():
+    assert call(Api(), "assets.get", "asset-1").keyname == "clip.mp4"
+
+
+@pytest.mark.parametrize("status", [400, 401, 404, 422])
+def test_client_errors_raise_without_retrying(status):
+    api = Api(statuses=[status])
+    with pytest.raises(httpx.HTTPStatusError) as raised:
+        call(api, "projects.get", "project-1")
+    assert raised.value.response.status_code == status
+    assert len(api.requests) == 1
+
+
+def test_server_errors_are_retried_for_idempotent_requests():
+    api = Api(statuses=[503, 502])
+    assert call(api, "video_files.search", query="dog") == [{"video_id": "video-1"}]
+    assert len(api.requests) == 3
+
+
+def test_server_errors_are_not_retried_for_other_posts():
+    api = Api(statuses=[500])
+    with pytest.raises(httpx.HTTPStatusError):
+        call(api, "projects.render_edit", "project-1", EDIT)
+    assert len(api.requests) == 1
+
+
+def test_persistent_server_errors_open_the_breaker():
+    api = Api(statuses=[500] * 3)
+    with pytest.raises(httpx.HTTPStatusError):
+        call(api, "assets.get", "asset-1")
+    with pytest.raises(CircuitOpenError):
+        call(api, "assets.get", "asset-1")
+    assert len(api.requests) == 3
+
+
+def test_download_without_url():
+    def handler(request):
+        return httpx.Response(200, json={**VIDEO_FILE, "download_url": None})
+
+    with pytest.raises(Exception, match="no download URL"):
+        call(handler, "video_files.download", "video-1", "unused.mp4")
+
+
+def test_download_error_status(tmp_path):
+    def handler(request):
+        if request.url.host == "files.test":
+            return httpx.Response(403)
+        return httpx.Response(200, json=VIDEO_FILE)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        call(handler, "video_files.download", "video-1", str(tmp_path / "v.mp4"))
+
+
+def test_download_retries_through_resilience(tmp_path):
+    file_statuses = [503]
+
+    def handler(request):
+        if request.url.host == "files.test":
+            if file_statuses:
+                return httpx.Response(file_statuses.pop(0))
+            return httpx.Response(200, content=b"data")
+        return httpx.Response(200, json=VIDEO_FILE)
+
+    path = tmp_path / "video.mp4"
+    assert call(handler, "video_files.download", "video-1", str(path))
+    assert path.read_bytes() == b"data"
+    assert file_statuses == []
+
+
+def test_download_failures_open_the_breaker(tmp_path):
+    api = Api()
+    files = []
+
+    def handler(request):
+        if request.url.host == "files.test":
+            files.append(request)
+            return httpx.Response(500)
+        return api(request)
+
+    path = str(tmp_path / "video.mp4")
+    with pytest.raises(httpx.HTTPStatusError):
+        call(handler, "video_files.download", "video-1", path)
+    with pytest.raises(CircuitOpenError):
+        call(handler, "video_files.download", "video-1", path)
+    assert len(files) == 3
+
+
+def test_client_is_replaced_when_the_loop_changes():
+    api = Api()
+    avj = AsyncVideoJungleClient(
+        "key", base_url=BASE_URL, transport=httpx.MockTransport(api)
+    )
+
+    async def fetch():
+        await avj.projects.get("project-1")
+        return avj._client
+
+    first_loop = asyncio.new_event_loop()
+    try:
+        first = first_loop.run_until_complete(fetch())
+        second = asyncio.run(fetch())
+        assert second is not first
+        # The old client is closed on its own loop, once that loop runs again
+        first_loop.run_until_complete(asyncio.sleep(0))
+        assert first.is_closed
+        assert not second.is_closed
+    finally:
+        first_loop.close()
+
+    # A client whose loop has closed is dropped in favour of a new one
+    third = asyncio.run(fetch())
+    assert third is not second
+    # Closing from another loop doesn't touch the dead loop's connections
+    asyncio.run(avj.aclose())
+    assert avj._client is None
+
+    async def fetch_and_close():
+        client = await fetch()
+        await avj.aclose()
+        return client
+
+    assert asyncio.run(fetch_and_close()).is_closed
@@ -0,0 +1,132 @@
+import types
+
+import numpy as np
+import pytest
+
+from video_editor_mcp import cache as cache_module
+from video_editor_mcp.cache import TTLCache, estimate_size
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache_module, "time", types.SimpleNamespace(monotonic=clock))
+    return clock
+
+
+def test_entries_expire_in_deadline_order(clock):
+    cache = TTLCache(ttl=10)
+    for key in "abc":
+        cache[key] = key
+        clock.now += 1
+    # Rewriting "a" gives it a new deadline; its old heap item is stale
+    cache["a"] = "a2"
+
+    clock.now = 1011.5
+    assert [key for key, _ in cache.items()] == ["c", "a"]
+    assert cache.stats()["expirations"] == 1
+    clock.now = 1012.5
+    assert [key for key, _ in cache.items()] == ["a"]
+    clock.now = 1013.5
+    assert list(cache.items()) == []
+    assert cache.stats()["expirations"] == 3
+
+
+def test_stale_heap_items_are_rebuilt_away(clock):
+    cache = TTLCache(ttl=10)
+    cache["a"] = 1
+    cache["b"] = 2
+    bound = 2 * len(cache) + 64
+    for _ in range(200):
+        clock.now += 0.01
+        assert cache["a"] == 1
+        assert len(cache._expiry_heap) <= bound + 1
+    # The rebuilt heap still holds each live entry
+    assert {item[2] for item in cache._expiry_heap} == {"a", "b"}
+
+    clock.now = 1010.5
+    assert "b" not in cache
+    assert cache["a"] == 1
+    clock.now += 10
+    assert list(cache.items()) == []
+
+
+def test_reads_do_not_grow_the_heap_without_touch_on_read(clock):
+    cache = TTLCache(ttl=10, touch_on_read=False)
+    cache["a"] = 1
+    for _ in range(100):
+        cache.get("a")
+    assert len(cache._expiry_heap) == 1
+
+
+def test_byte_budget_evicts_least_recently_used(clock):
+    cache = TTLCache(ttl=10, max_bytes=10, sizeof=len)
+    cache["a"] = "aaaa"
+    cache["b"] = "bbbb"
+    cache.get("a")
+    cache["c"] = "cccc"
+    assert [key for key, _ in cache.items()] == ["a", "c"]
+    assert cache.stats()["bytes"] == 8
+    assert cache.stats()["evictions"] == 1
+
+
+def test_oversized_values_are_not_stored(clock):
+    cache = TTLCache(ttl=10, max_bytes=10, sizeof=len)
+    cache["a"] = "aaaa"
+    cache["b"] = "bbbb"
+    cache["big"] = "x" * 11
+    assert "big" not in cache
+    # Nothing else was evicted to make room for it
+    assert [key for key, _ in cache.items()] == ["a", "b"]
+
+    # Overwriting with an oversized value drops the old one
+    cache["a"] = "x" * 11
+    assert "a" not in cache
+    assert cache.stats()["bytes"] == 4
+    assert cache.stats()["evictions"] == 2
+
+
+def test_value_of_exactly_the_budget_fits(clock):
+    cache = TTLCache(ttl=10, max_bytes=10, sizeof=len)
+    cache["a"] = "aaaa"
+    cache["b"] = "x" * 10
+    assert [key for key, _ in cache.items()] == ["b"]
+
+
+@pytest.mark.parametrize("touch_on_read", [True, False])
+def test_lru_order_and_ttl_extension(clock, touch_on_read):
+    cache = TTLCache(ttl=10, max_entries=2, touch_on_read=touch_on_read)
+    cache["a"] = 1
+    cache["b"] = 2
+    clock.now += 5
+    # A read always refreshes recency, so "b" is the one evicted
+    assert cache["a"] == 1
+    cache["c"] = 3
+    assert [key for key, _ in cache.items()] == ["a", "c"]
+
+    # Only touch_on_read also pushes back the read entry's deadline
+    clock.now += 6
+    assert ("a" in cache) is touch_on_read
+    assert "c" in cache
+
+
+def test_estimate_size_walks_nested_values():
+    leaf = "x" * 1000
+    assert estimate_size([leaf]) > 1000
+    assert estimate_size({"k": [leaf, (leaf,)]}) < 2000
+    # Shared objects count once
+    assert estimate_size([leaf, leaf]) < 2 * len(leaf)
+
+    obj = types.SimpleNamespace(payload={"nested": [leaf]})
+    assert estimate_size(obj) > 1000
+
+    array = np.zeros(10_000, dtype=np.float32)
+    assert estimate_size({"vectors": array}) > array.nbytes
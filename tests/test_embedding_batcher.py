@@ -0,0 +1,51 @@
+import asyncio
+import gc
+
+from video_editor_mcp.embedding_batcher import EmbeddingBatcher
+
+
+def _encode(kind, items, truncate_dim, task):
+    return [f"{kind}:{item}" for item in items]
+
+
+def test_concurrent_requests_share_a_batch():
+    async def main():
+        batcher = EmbeddingBatcher(_encode, window_ms=20)
+        vectors = await batcher.submit_many("text", ["a", "b", "c"])
+        return vectors, batcher.stats()
+
+    vectors, stats = asyncio.run(main())
+    assert vectors == ["text:a", "text:b", "text:c"]
+    assert stats["batches"] == 1
+
+
+def test_running_batches_survive_garbage_collection():
+    async def main():
+        batcher = EmbeddingBatcher(_encode, max_batch_size=2)
+        pending = asyncio.gather(
+            batcher.submit("text", "a"), batcher.submit("text", "b")
+        )
+        await asyncio.sleep(0)
+        # The batch is running, and only the batcher holds its task
+        assert len(batcher._running) == 1
+        gc.collect()
+        result = await asyncio.wait_for(pending, timeout=5)
+        assert not batcher._running
+        return result
+
+    assert asyncio.run(main()) == ["text:a", "text:b"]
+
+
+def test_encoder_errors_reach_every_caller():
+    def fail(kind, items, truncate_dim, task):
+        raise RuntimeError("model unavailable")
+
+    async def main():
+        batcher = EmbeddingBatcher(fail)
+        return await asyncio.gather(
+            batcher.submit("text", "a"),
+            batcher.submit("text", "b"),
+            return_exceptions=True,
+        )
+
+    assert all(isinstance(r, RuntimeError) for r in asyncio.run(main()))
@@ -0,0 +1,59 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pytest
+
+from video_editor_mcp.embedding_cache import EmbeddingCache
+
+
+@pytest.fixture
+def image_server():
+    """Serves HEAD requests with whatever headers the test sets"""
+    headers = {}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_HEAD(self):
+            self.send_response(200)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}/frame.jpg", headers
+    server.shutdown()
+
+
+def test_local_images_keyed_by_content(tmp_path):
+    image = tmp_path / "frame.jpg"
+    image.write_bytes(b"one")
+    first = EmbeddingCache.make_key("m", "image", str(image))
+    image.write_bytes(b"two")
+    assert EmbeddingCache.make_key("m", "image", str(image)) != first
+
+
+def test_remote_images_keyed_by_validator(image_server):
+    url, headers = image_server
+    headers["ETag"] = '"v1"'
+    first = EmbeddingCache.make_key("m", "image", url)
+    assert first == EmbeddingCache.make_key("m", "image", url)
+    headers["ETag"] = '"v2"'
+    assert EmbeddingCache.make_key("m", "image", url) != first
+
+
+def test_remote_images_without_validator_not_cached(image_server):
+    url, _ = image_server
+    assert EmbeddingCache.make_key("m", "image", url) is None
+
+
+def test_round_trip_through_disk(tmp_path):
+    key = EmbeddingCache.make_key("m", "text", "a  red   car")
+    assert key == EmbeddingCache.make_key("m", "text", "a red car")
+    EmbeddingCache(cache_dir=str(tmp_path)).put(key, np.arange(4, dtype=np.float32))
+    reopened = EmbeddingCache(cache_dir=str(tmp_path))
+    assert np.array_equal(reopened.get(key), np.arange(4, dtype=np.float32))
+    assert reopened.stats()["disk_hits"] == 1
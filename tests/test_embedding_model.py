@@ -0,0 +1,222 @@
+import asyncio
+import threading
+import types
+
+import pytest
+
+from video_editor_mcp import server
+from video_editor_mcp.embedding_model import (
+    EmbeddingModelLoader,
+    ModelLoadFailedError,
+    ModelLoadingError,
+)
+
+
+class GatedLoader(EmbeddingModelLoader):
+    """Loader whose load and warmup each block until the test releases them"""
+
+    def __init__(self, fail: bool = False):
+        super().__init__()
+        self.fail = fail
+        self.states = []
+        self.loading = threading.Event()
+        self.warming = threading.Event()
+        self.release_load = threading.Event()
+        self.release_warmup = threading.Event()
+        self.settled = threading.Event()
+
+    def _set_state(self, state: str):
+        super()._set_state(state)
+        # Whoever sees a state published must also see the readiness behind it
+        self.states.append((state, self.is_ready))
+        if state in ("ready", "failed"):
+            self.settled.set()
+
+    def _load(self):
+        self.loading.set()
+        self.release_load.wait(5)
+        if self.fail:
+            raise OSError("no weights")
+
+    def _warmup(self):
+        self.warming.set()
+        self.release_warmup.wait(5)
+        self.warmup_seconds = 0.0
+
+
+def test_states_run_idle_loading_warming_ready():
+    async def run():
+        loader = GatedLoader()
+        assert loader.state == "idle"
+        waiter = asyncio.ensure_future(loader.wait_ready(timeout=5))
+        await asyncio.sleep(0)
+        assert loader.loading.wait(5)
+        assert loader.state == "loading"
+        assert isinstance(loader.not_ready_error(), ModelLoadingError)
+
+        loader.release_load.set()
+        assert loader.warming.wait(5)
+        assert loader.state == "warming"
+        assert not loader.is_ready
+
+        loader.release_warmup.set()
+        assert await waiter
+        assert loader.state == "ready"
+        assert loader.settled.wait(5)
+        assert loader.states == [("warming", False), ("ready", True)]
+        assert loader.status()["error"] is None
+
+    asyncio.run(run())
+
+
+def test_failed_load_wakes_waiters_and_can_be_retried():
+    async def run():
+        loader = GatedLoader(fail=True)
+        waiter = asyncio.ensure_future(loader.wait_ready(timeout=5))
+        await asyncio.sleep(0)
+        assert loader.loading.wait(5)
+        loader.release_load.set()
+        assert not await waiter
+        assert loader.state == "failed"
+        assert loader.error == "no weights"
+        error = loader.not_ready_error()
+        assert isinstance(error, ModelLoadFailedError)
+        assert "no weights" in str(error)
+
+        # The next request starts a fresh load
+        loader.fail = False
+        loader.release_warmup.set()
+        assert await loader.wait_ready(timeout=5)
+        assert loader.state == "ready"
+        assert loader.error is None
+
+    asyncio.run(run())
+
+
+def test_wait_ready_times_out_while_loading():
+    async def run():
+        loader = GatedLoader()
+        assert not await loader.wait_ready(timeout=0.05)
+        assert loader.state == "loading"
+        # Timed-out waiters don't pile up
+        assert loader._waiters == []
+
+        loader.release_load.set()
+        loader.release_warmup.set()
+        assert await loader.wait_ready(timeout=5)
+        # Ready is answered without waiting at all
+        assert await loader.wait_ready(timeout=0)
+
+    asyncio.run(run())
+
+
+def test_wait_for_model_raises_typed_errors(monkeypatch):
+    loader = GatedLoader()
+    monkeypatch.setattr(server, "model_loader", loader)
+    with pytest.raises(ModelLoadingError, match="still loading"):
+        asyncio.run(server._wait_for_model(0.01))
+    loader.fail = True
+    loader.release_load.set()
+    assert not asyncio.run(loader.wait_ready(timeout=5))
+    with pytest.raises(ModelLoadFailedError, match="no weights"):
+        asyncio.run(server._wait_for_model(0.01))
+
+
+def test_search_outcomes_note_a_loading_model(monkeypatch):
+    monkeypatch.setattr(server, "model_loader", GatedLoader())
+    _, _, notes = server._resolve_search_outcomes(
+        ModelLoadingError("Model m still loading"), []
+    )
+    assert "still initializing" in notes[0]
+
+    # Any other error mentioning loading is reported as a failure
+    _, _, notes = server._resolve_search_outcomes(
+        RuntimeError("index still loading"), []
+    )
+    assert "Semantic search failed (RuntimeError)" in notes[0]
+
+
+def tiny_clip_class(torch):
+    class TinyClip(torch.nn.Module):
+        """Just enough of jina-clip's layout: a text tower and a vision tower"""
+
+        def __init__(self):
+            super().__init__()
+            self.text_model = torch.nn.Linear(4, 3)
+            self.vision_model = torch.nn.Sequential(
+                torch.nn.Linear(6, 5), torch.nn.LayerNorm(5)
+            )
+            # Not in the checkpoint, so it has to survive the offload itself
+            self.vision_model.register_buffer(
+                "position_ids", torch.arange(5) * 7, persistent=False
+            )
+            self.visual_projection = torch.nn.Linear(5, 3, bias=False)
+
+    return TinyClip
+
+
+def tiny_loader(monkeypatch, tmp_path, checkpoint_keys=None):
+    """Loader over a tiny model saved as a local safetensors checkpoint"""
+    torch = pytest.importorskip("torch")
+    pytest.importorskip("transformers")
+    safetensors_torch = pytest.importorskip("safetensors.torch")
+    from video_editor_mcp import embedding_model
+
+    TinyClip = tiny_clip_class(torch)
+    torch.manual_seed(0)
+    weights = TinyClip().state_dict()
+    saved = {
+        key: tensor.contiguous()
+        for key, tensor in weights.items()
+        if checkpoint_keys is None or key.startswith(checkpoint_keys)
+    }
+    safetensors_torch.save_file(saved, str(tmp_path / "model.safetensors"))
+
+    full_loads = []
+
+    def from_pretrained(name, **kwargs):
+        full_loads.append(name)
+        model = TinyClip()
+        model.load_state_dict(weights)
+        return model
+
+    monkeypatch.setattr(
+        embedding_model,
+        "transformers",
+        types.SimpleNamespace(
+            AutoModel=types.SimpleNamespace(from_pretrained=from_pretrained)
+        ),
+    )
+    loader = EmbeddingModelLoader(model_name=str(tmp_path), load_mode="text")
+    loader._model = loader._load_torch_model(text_only=True)
+    loader._set_state("ready")
+    return torch, loader, weights, full_loads
+
+
+def test_vision_tower_is_offloaded_and_read_back_alone(monkeypatch, tmp_path):
+    torch, loader, weights, full_loads = tiny_loader(monkeypatch, tmp_path)
+    model = loader._model
+    assert all(p.is_meta for p in model.vision_model.parameters())
+    assert all(p.is_meta for p in model.visual_projection.parameters())
+    assert not any(p.is_meta for p in model.text_model.parameters())
+    assert set(loader._vision_buffers) == {"vision_model.position_ids"}
+
+    assert loader.image_model is model
+    # Only the vision weights were read from the checkpoint, no second model
+    assert full_loads == [str(tmp_path)]
+    for key, tensor in model.state_dict().items():
+        assert torch.equal(tensor, weights[key]), key
+    assert torch.equal(model.vision_model.position_ids, torch.arange(5) * 7)
+    assert loader.status()["vision_loaded"]
+
+
+def test_vision_tower_falls_back_to_a_full_load(monkeypatch, tmp_path):
+    # A checkpoint without the vision weights can't fill the tower in
+    torch, loader, weights, full_loads = tiny_loader(
+        monkeypatch, tmp_path, checkpoint_keys=("text_model.",)
+    )
+    model = loader.image_model
+    assert len(full_loads) == 2
+    assert not any(p.is_meta for p in model.parameters())
+    for key, tensor in model.state_dict().items():
+        assert torch.equal(tensor, weights[key]), key
@@ -0,0 +1,59 @@
+import json
+
+import numpy as np
+import pytest
+import requests
+
+from video_editor_mcp.embedding_wire import (
+    WIRE_DTYPES,
+    decode_embeddings,
+    embedding_payload,
+    encode_embeddings,
+)
+from video_editor_mcp.wire_benchmark import EmbeddingEchoServer
+
+# Largest absolute error per component for a unit vector in each dtype
+TOLERANCE = {"float32": 0.0, "float16": 1e-3, "int8": 1e-2}
+
+
+@pytest.fixture
+def queries():
+    vectors = np.random.default_rng(0).standard_normal((3, 768))
+    return (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(np.float32)
+
+
+@pytest.fixture
+def endpoint():
+    server = EmbeddingEchoServer()
+    yield server.url
+    server.shutdown()
+
+
+@pytest.mark.parametrize("dtype", WIRE_DTYPES)
+def test_round_trip(queries, dtype):
+    decoded = decode_embeddings(encode_embeddings(queries, dtype=dtype))
+    assert decoded.shape == queries.shape
+    assert np.abs(decoded - queries).max() <= TOLERANCE[dtype]
+
+
+def test_truncation_renormalizes(queries):
+    decoded = decode_embeddings(encode_embeddings(queries, "float32", truncate_dim=256))
+    assert decoded.shape == (3, 256)
+    assert np.allclose(np.linalg.norm(decoded, axis=1), 1.0, atol=1e-6)
+
+
+def test_unknown_dtype_rejected(queries):
+    with pytest.raises(ValueError):
+        encode_embeddings(queries, dtype="bfloat16")
+
+
+@pytest.mark.parametrize("wire_format", ("json",) + tuple(WIRE_DTYPES))
+def test_round_trip_through_endpoint(queries, endpoint, wire_format):
+    payload = embedding_payload(queries, "text_embeddings", wire_format=wire_format)
+    if wire_format == "json":
+        # The default format stays plain float lists for endpoints without base64
+        assert isinstance(payload["embeddings"], list)
+    response = requests.post(endpoint, data=json.dumps(payload), timeout=10)
+    response.raise_for_status()
+    echoed = np.asarray(response.json()["embeddings"], dtype=np.float32)
+    assert np.abs(echoed - queries).max() <= TOLERANCE.get(wire_format, 0.0)
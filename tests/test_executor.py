@@ -0,0 +1,79 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+from video_editor_mcp import server
+from video_editor_mcp.executor import BlockingExecutor
+
+
+class Tracker:
+    """Blocking call that records how many copies of itself run at once"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+
+    def __call__(self):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(0.05)
+        with self.lock:
+            self.running -= 1
+
+
+def test_concurrency_is_capped_per_key():
+    executor = BlockingExecutor(max_workers=16, default_limit=3, limits={"edit": 2})
+    edit, search = Tracker(), Tracker()
+
+    async def run():
+        await asyncio.gather(
+            *(executor.run("edit", edit) for _ in range(6)),
+            *(executor.run("search", search) for _ in range(6)),
+        )
+
+    asyncio.run(run())
+    assert (edit.peak, search.peak) == (2, 3)
+    assert set(executor.stats()) == {"edit", "search"}
+    executor.shutdown()
+
+
+class RecordingExecutor:
+    def __init__(self):
+        self.keys = []
+
+    async def run(self, key, fn, *args, **kwargs):
+        self.keys.append(key)
+        return {"edit_id": "edit-1"}
+
+
+def test_edit_tool_calls_use_the_tool_key(monkeypatch):
+    recorder = RecordingExecutor()
+    project = SimpleNamespace(id="project-1", name="Trip")
+
+    async def get_project(project_id):
+        return project
+
+    monkeypatch.setattr(server, "blocking", recorder)
+    monkeypatch.setattr(server.project_cache, "get", get_project)
+    asyncio.run(
+        server.handle_call_tool(
+            "generate-edit-from-videos",
+            {
+                "name": "My holiday edit",
+                "project_id": "project-1",
+                "resolution": "1920x1080",
+                "edit": [
+                    {
+                        "video_id": "video-1",
+                        "video_start_time": "00:00:01.000",
+                        "video_end_time": "00:00:02.000",
+                        "type": "video-file",
+                    }
+                ],
+            },
+        )
+    )
+    assert recorder.keys == ["generate-edit-from-videos"] * 2
@@ -0,0 +1,38 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from video_editor_mcp import server
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+
+
+def test_edit_locally_runs_the_converter_as_a_module():
+    command = server.opentimeline_command("edit.json", "edit.otio")
+    assert command[:5] == [
+        "uv",
+        "run",
+        "python",
+        "-m",
+        "video_editor_mcp.generate_opentimeline",
+    ]
+    assert command[5:] == ["--file", "edit.json", "--output", "edit.otio"]
+
+
+def test_converter_starts_the_way_edit_locally_runs_it(tmp_path):
+    pytest.importorskip("opentimelineio")
+    command = server.opentimeline_command(
+        "edit.json", "edit.otio", python=(sys.executable,)
+    )
+    # Same interpreter invocation, asking only for usage so no API is needed
+    result = subprocess.run(
+        [*command[: command.index("--file")], "--help"],
+        env={"PATH": os.environ["PATH"], "VJ_API_KEY": "test", "PYTHONPATH": SRC_DIR},
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    assert "--output" in result.stdout
@@ -0,0 +1,161 @@
+import gzip
+import io
+import json
+import threading
+
+import httpx
+import pytest
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+from video_editor_mcp import http_client
+from video_editor_mcp.http_client import Http2Adapter, PooledApiClient, download_file
+from video_editor_mcp.resilience import Resilience
+
+BASE_URL = "https://vj.test"
+
+
+class RecordingAdapter(BaseAdapter):
+    """Answers every request from `handler(request) -> (status, body)`"""
+
+    def __init__(self, handler):
+        super().__init__()
+        self.handler = handler
+        self.requests = []
+
+    def send(self, request, stream=False, timeout=None, **kwargs):
+        self.requests.append((request, timeout))
+        status, body = self.handler(request)
+        response = requests.Response()
+        response.status_code = status
+        response.url = request.url
+        response.request = request
+        response.raw = io.BytesIO(body)
+        return response
+
+    def close(self):
+        pass
+
+
+def mocked_session(monkeypatch, handler) -> RecordingAdapter:
+    adapter = RecordingAdapter(handler)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    monkeypatch.setattr(http_client, "_session", session)
+    return adapter
+
+
+@pytest.fixture(autouse=True)
+def fresh_resilience(monkeypatch):
+    monkeypatch.setattr(
+        http_client,
+        "resilience",
+        Resilience(attempts=3, base_delay=0, max_delay=0, breaker_threshold=5),
+    )
+
+
+def client() -> PooledApiClient:
+    api = PooledApiClient("key")
+    api.BASE_URL = BASE_URL
+    return api
+
+
+def test_session_is_shared(monkeypatch):
+    monkeypatch.setattr(http_client, "_session", None)
+    sessions = []
+    threads = [
+        threading.Thread(target=lambda: sessions.append(http_client.get_session()))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len({id(session) for session in sessions}) == 1
+    assert http_client.get_session() is sessions[0]
+
+
+def test_api_calls_reuse_the_session(monkeypatch):
+    adapter = mocked_session(
+        monkeypatch, lambda request: (200, json.dumps({"ok": True}).encode())
+    )
+    api = client()
+    assert api._make_request("GET", "/projects/p1") == {"ok": True}
+    assert api._make_request("POST", "projects", json={"name": "Trip"}) == {"ok": True}
+    (first, timeout), (second, _) = adapter.requests
+    assert first.url == f"{BASE_URL}/projects/p1"
+    assert first.headers["X-API-Key"] == "key"
+    assert timeout == http_client.resilience.request_timeout
+    assert json.loads(second.body) == {"name": "Trip"}
+
+
+def test_api_calls_retry_server_errors_but_not_client_errors(monkeypatch):
+    statuses = [503, 200]
+    adapter = mocked_session(monkeypatch, lambda request: (statuses.pop(0), b"[]"))
+    assert client()._make_request("GET", "projects") == []
+    assert len(adapter.requests) == 2
+
+    adapter = mocked_session(monkeypatch, lambda request: (422, b'{"detail": "bad"}'))
+    with pytest.raises(requests.HTTPError):
+        client()._make_request("GET", "projects")
+    assert len(adapter.requests) == 1
+
+
+def test_download_file_streams_to_disk(monkeypatch, tmp_path):
+    body = bytes(range(256)) * 1000
+    adapter = mocked_session(monkeypatch, lambda request: (200, body))
+    path = tmp_path / "video.mp4"
+    assert download_file(f"{BASE_URL}/files/v1.mp4", str(path), chunk_size=4096)
+    assert path.read_bytes() == body
+    assert adapter.requests[0][0].method == "GET"
+
+
+def test_download_file_raises_on_error_status(monkeypatch, tmp_path):
+    mocked_session(monkeypatch, lambda request: (404, b""))
+    with pytest.raises(requests.HTTPError):
+        download_file(f"{BASE_URL}/files/missing.mp4", str(tmp_path / "v.mp4"))
+
+
+def test_http2_falls_back_to_http1_without_h2(monkeypatch, caplog):
+    def client_without_h2(**kwargs):
+        if kwargs.get("http2"):
+            raise ImportError("Using http2=True, but the 'h2' package is not installed")
+        return httpx.Client(**kwargs)
+
+    monkeypatch.setattr(httpx, "Client", client_without_h2)
+    session = http_client._new_session(4, 30, http2=True)
+    assert type(session.get_adapter("https://vj.test")) is HTTPAdapter
+    assert "needs the h2 package" in caplog.text
+
+
+def test_http2_adapter_sends_through_httpx(monkeypatch):
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        body = gzip.compress(b'{"ok": true}')
+        return httpx.Response(
+            200, content=body, headers={"Content-Encoding": "gzip", "X-Test": "1"}
+        )
+
+    real_client = httpx.Client
+
+    def mocked_client(http2=False, **kwargs):
+        return real_client(transport=httpx.MockTransport(handler), **kwargs)
+
+    monkeypatch.setattr(httpx, "Client", mocked_client)
+    session = requests.Session()
+    session.mount("https://", Http2Adapter(pool_size=2, keepalive=5))
+
+    response = session.post(f"{BASE_URL}/search", json={"query": "dog"}, timeout=(3, 7))
+    assert response.json() == {"ok": True}
+    assert response.headers["X-Test"] == "1"
+    # The body arrives decoded, so requests mustn't decode it again
+    assert "Content-Encoding" not in response.headers
+    assert json.loads(seen[0].content) == {"query": "dog"}
+    assert seen[0].extensions["timeout"]["connect"] == 3
+    assert seen[0].extensions["timeout"]["read"] == 7
+
+    streamed = session.get(f"{BASE_URL}/file", stream=True)
+    assert b"".join(streamed.iter_content(chunk_size=4)) == b'{"ok": true}'
+    assert len(seen) == 2
@@ -0,0 +1,52 @@
+import os
+import subprocess
+import sys
+
+# Modules that must only be imported on first use, not when the server starts
+DEFERRED = ("numpy", "torch", "transformers", "osxphotos", "onnxruntime")
+
+# Generous enough for a cold CI runner; mcp itself accounts for most of it
+IMPORT_BUDGET_MS = float(os.environ.get("VJ_IMPORT_BUDGET_MS", "3000"))
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+
+
+def _importtime(tmp_path) -> dict:
+    """Cumulative import time in microseconds per module, from -X importtime"""
+    env = {
+        **os.environ,
+        "VJ_API_KEY": "test",
+        "PYTHONPATH": os.pathsep.join(
+            filter(None, [SRC_DIR, os.environ.get("PYTHONPATH")])
+        ),
+    }
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import video_editor_mcp.server"],
+        capture_output=True,
+        text=True,
+        env=env,
+        # The server logs to app.log in the working directory
+        cwd=tmp_path,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_heavy_modules_are_deferred(tmp_path):
+    times = _importtime(tmp_path)
+    loaded = [m for m in DEFERRED if m in times]
+    assert not loaded, f"imported at server startup: {loaded}"
+
+
+def test_server_import_within_budget(tmp_path):
+    times = _importtime(tmp_path)
+    elapsed_ms = times["video_editor_mcp.server"] / 1000
+    assert elapsed_ms < IMPORT_BUDGET_MS, (
+        f"importing the server took {elapsed_ms:.0f}ms, budget {IMPORT_BUDGET_MS:.0f}ms"
+    )
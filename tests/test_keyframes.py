@@ -0,0 +1,43 @@
+import os
+import subprocess
+import sys
+
+from video_editor_mcp.keyframes import find_videos
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+
+
+def test_same_named_videos_kept_apart(tmp_path):
+    for folder in ("day1", "day2"):
+        (tmp_path / folder).mkdir()
+        (tmp_path / folder / "clip.mp4").touch()
+    (tmp_path / "notes.txt").touch()
+
+    videos = find_videos([str(tmp_path)])
+    assert videos == {
+        "day1/clip.mp4": str(tmp_path / "day1" / "clip.mp4"),
+        "day2/clip.mp4": str(tmp_path / "day2" / "clip.mp4"),
+    }
+
+
+def test_same_relative_path_under_two_roots(tmp_path):
+    for root in ("a", "b"):
+        (tmp_path / root).mkdir()
+        (tmp_path / root / "clip.mov").touch()
+
+    videos = find_videos([str(tmp_path / "a"), str(tmp_path / "b")])
+    assert sorted(videos.values()) == [
+        str(tmp_path / "a" / "clip.mov"),
+        str(tmp_path / "b" / "clip.mov"),
+    ]
+
+
+def test_cli_imports_without_api_key(tmp_path):
+    env = {k: v for k, v in os.environ.items() if k != "VJ_API_KEY"}
+    subprocess.run(
+        [sys.executable, "-m", "video_editor_mcp.keyframes", "--help"],
+        env={**env, "PYTHONPATH": SRC_DIR},
+        cwd=tmp_path,
+        check=True,
+        capture_output=True,
+    )
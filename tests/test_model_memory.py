@@ -0,0 +1,62 @@
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+
+# Loads the real model in subprocesses, so only runs when asked for
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("VJ_MODEL_TESTS"), reason="set VJ_MODEL_TESTS=1 to run"
+)
+
+# Room for allocator noise between separate processes
+MARGIN = 1.1
+
+_SCRIPT = textwrap.dedent(
+    """
+    import asyncio, json, sys
+    from PIL import Image
+    from video_editor_mcp.embedding_model import EmbeddingModelLoader
+    from video_editor_mcp.timings import current_rss_mb, max_rss_mb
+
+    loader = EmbeddingModelLoader(load_mode=sys.argv[1])
+    assert asyncio.run(loader.wait_ready(timeout=1800)), loader.status()
+    report = {"loaded_rss": current_rss_mb(), "loaded_peak": max_rss_mb()}
+    Image.new("RGB", (224, 224), "red").save("frame.png")
+    loader.embed("image", ["frame.png"], use_cache=False)
+    loader.embed("text", ["a red square"], use_cache=False)
+    report.update(image_rss=current_rss_mb(), image_peak=max_rss_mb())
+    print(json.dumps(report))
+    """
+)
+
+
+def _measure(load_mode: str, tmp_path) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", _SCRIPT, load_mode],
+        capture_output=True,
+        text=True,
+        cwd=tmp_path,
+        env={**os.environ, "PYTHONPATH": SRC_DIR},
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_text_mode_memory(tmp_path):
+    pytest.importorskip("torch")
+    text = _measure("text", tmp_path)
+    full = _measure("full", tmp_path)
+    if text["loaded_rss"] is None:
+        pytest.skip("current RSS is only measured on Linux")
+
+    # Only the text tower stays resident until an image arrives
+    assert text["loaded_rss"] < full["loaded_rss"]
+    # The first image adds just the vision tower: no second copy of the text
+    # tower resident afterwards, and no full reload on top of it meanwhile
+    assert text["image_rss"] <= full["image_rss"] * MARGIN
+    assert text["image_peak"] <= full["image_peak"] * MARGIN
@@ -0,0 +1,44 @@
+import os
+
+import numpy as np
+import pytest
+
+from video_editor_mcp.onnx_benchmark import BENCHMARK_PROMPTS
+from video_editor_mcp.onnx_text_encoder import OnnxTextEncoder, cosine_parity
+
+MODEL_NAME = "jinaai/jina-clip-v1"
+
+# Downloads and exports the model, so only runs when asked for
+model_test = pytest.mark.skipif(
+    not os.environ.get("VJ_MODEL_TESTS"), reason="set VJ_MODEL_TESTS=1 to run"
+)
+
+
+def test_cosine_parity_ignores_scale():
+    reference = np.array([[1.0, 0.0], [0.0, 2.0]])
+    candidate = np.array([[3.0, 0.0], [1.0, 0.0]])
+    assert np.allclose(cosine_parity(reference, candidate), [1.0, 0.0])
+
+
+def test_encode_before_load_fails(tmp_path):
+    encoder = OnnxTextEncoder(MODEL_NAME, cache_dir=str(tmp_path))
+    with pytest.raises(RuntimeError):
+        encoder.encode_text("a dog running on the beach")
+
+
+@model_test
+def test_int8_export_matches_torch():
+    pytest.importorskip("onnxruntime")
+    transformers = pytest.importorskip("transformers")
+
+    torch_model = transformers.AutoModel.from_pretrained(
+        MODEL_NAME, trust_remote_code=True
+    )
+    reference = np.asarray(torch_model.encode_text(BENCHMARK_PROMPTS))
+
+    encoder = OnnxTextEncoder(MODEL_NAME)
+    encoder.load(torch_model_factory=lambda: torch_model)
+    quantized = encoder.encode_text(BENCHMARK_PROMPTS)
+
+    parity = cosine_parity(reference, quantized)
+    assert parity.min() >= encoder.min_parity, dict(zip(BENCHMARK_PROMPTS, parity))
@@ -0,0 +1,119 @@
+import asyncio
+
+import pytest
+
+from video_editor_mcp.project_cache import ProjectCache, SingleFlight
+
+
+class CountingApi:
+    """Async stand-in for the project endpoints, held open until released"""
+
+    def __init__(self):
+        self.calls = []
+        self.release = asyncio.Event()
+        self.revision = 0
+
+    async def fetch_project(self, project_id: str):
+        self.calls.append(("project", project_id))
+        revision = self.revision
+        await self.release.wait()
+        return {"id": project_id, "revision": revision}
+
+    async def fetch_edit(self, project_id: str, edit_id: str):
+        self.calls.append(("edit", project_id, edit_id))
+        await self.release.wait()
+        return {"id": edit_id, "project_id": project_id}
+
+
+async def settle():
+    """Let every task started so far run up to its first blocking await"""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_concurrent_gets_make_one_upstream_call():
+    async def run():
+        api = CountingApi()
+        cache = ProjectCache(api.fetch_project, api.fetch_edit)
+        gets = [asyncio.ensure_future(cache.get("p1")) for _ in range(20)]
+        edits = [asyncio.ensure_future(cache.get_edit("p1", "e1")) for _ in range(5)]
+        await settle()
+        api.release.set()
+        projects = await asyncio.gather(*gets)
+        assert await asyncio.gather(*edits) == [{"id": "e1", "project_id": "p1"}] * 5
+
+        assert projects == [{"id": "p1", "revision": 0}] * 20
+        assert api.calls == [("project", "p1"), ("edit", "p1", "e1")]
+        # Served from the cache afterwards
+        assert await cache.get("p1") == projects[0]
+        assert len(api.calls) == 2
+        assert cache.stats()["coalesced"] == 23
+
+    asyncio.run(run())
+
+
+def test_invalidate_during_fetch_is_not_cached():
+    async def run():
+        api = CountingApi()
+        cache = ProjectCache(api.fetch_project, api.fetch_edit)
+        stale = asyncio.ensure_future(cache.get("p1"))
+        await settle()
+
+        # The project changes while the first fetch is in flight
+        api.revision = 1
+        cache.invalidate("p1")
+        fresh = asyncio.ensure_future(cache.get("p1"))
+        await settle()
+        api.release.set()
+
+        # The first caller gets what it asked for, but it isn't cached, and
+        # callers after the invalidate don't join the stale fetch
+        assert (await stale)["revision"] == 0
+        assert (await fresh)["revision"] == 1
+        assert await cache.get("p1") == {"id": "p1", "revision": 1}
+        assert api.calls == [("project", "p1")] * 2
+
+    asyncio.run(run())
+
+
+def test_invalidate_drops_cached_edits():
+    async def run():
+        api = CountingApi()
+        api.release.set()
+        cache = ProjectCache(api.fetch_project, api.fetch_edit)
+        await cache.get_edit("p1", "e1")
+        await cache.get_edit("p2", "e1")
+        cache.invalidate("p1")
+        await cache.get_edit("p1", "e1")
+        await cache.get_edit("p2", "e1")
+        assert api.calls == [
+            ("edit", "p1", "e1"),
+            ("edit", "p2", "e1"),
+            ("edit", "p1", "e1"),
+        ]
+
+    asyncio.run(run())
+
+
+def test_single_flight_shares_errors_and_survives_cancellation():
+    async def run():
+        flight = SingleFlight()
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def failing():
+            started.set()
+            await release.wait()
+            raise ValueError("upstream failed")
+
+        first = asyncio.ensure_future(flight.do("k", failing))
+        second = asyncio.ensure_future(flight.do("k", failing))
+        await started.wait()
+        # One caller giving up doesn't cancel the call for the other
+        first.cancel()
+        release.set()
+        with pytest.raises(ValueError, match="upstream failed"):
+            await second
+        assert (flight.calls, flight.coalesced) == (1, 1)
+
+    asyncio.run(run())
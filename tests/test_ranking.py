@@ -0,0 +1,88 @@
+from video_editor_mcp.ranking import FusedResults, fuse_results
+
+
+def keyword_video(video_id, *starts):
+    return {
+        "video_id": video_id,
+        "matching_segments": [
+            {"start_seconds": start, "end_seconds": start + 5} for start in starts
+        ],
+    }
+
+
+def test_video_with_many_segments_counts_once():
+    videos = [keyword_video("A", *range(0, 300, 30))] + [
+        keyword_video(video_id, 0) for video_id in "BCDEFGHIJ"
+    ]
+
+    fused = fuse_results(videos, [], top_k=10)
+    assert [result["video_id"] for result in fused] == list("ABCDEFGHIJ")
+    assert len(fused[0]["segments"]) == 10
+    assert (fused[0]["start"], fused[0]["end"]) == (0, 275)
+
+
+def test_embedding_matches_fold_into_keyword_video():
+    videos = [keyword_video("A", 10, 60), keyword_video("B", 0)]
+    matches = [
+        {"video_id": "B", "timepoint": 2, "score": 0.9},
+        {"video_id": "A", "timepoint": 30, "score": 0.8},
+        {"video_id": "A", "timepoint": 500, "score": 0.7},
+    ]
+
+    fused = fuse_results(videos, matches)
+    groups = [(r["video_id"], r["start"], len(r["matches"])) for r in fused]
+    # Both legs agree on A's and B's keyword spans; A's far match stays apart
+    assert groups == [("A", 10, 1), ("B", 0, 1), ("A", 500, 1)]
+
+
+def test_video_without_segments_covers_whole_video():
+    fused = fuse_results(
+        [{"video_id": "A"}], [{"video_id": "A", "timepoint": 42, "score": 0.5}]
+    )
+    assert len(fused) == 1
+    assert fused[0]["start"] is None and len(fused[0]["matches"]) == 1
+
+
+def test_fused_results_page_matches_fuse_results():
+    videos = [keyword_video("A", 0, 30), keyword_video("B", 0)]
+    fused = fuse_results(videos, [{"video_id": "C", "timepoint": 1, "score": 0.4}])
+
+    page = FusedResults(fused).page(0, 10)
+    assert [r["video_id"] for r in page] == [r["video_id"] for r in fused]
+    assert page[0]["video"] == videos[0]
+
+
+def test_fused_results_keep_only_displayed_fields():
+    video = {
+        **keyword_video("A", 0),
+        "script": "x" * 5000,
+        "analysis": {"scenes": ["..."] * 1000},
+        "video": {"name": "A", "url": "u", "generated_description": "d", "raw": {}},
+    }
+    match = {
+        "video_id": "A",
+        "timepoint": 2,
+        "description": "scene",
+        "detected_items": ["dog"],
+        "score": 0.9,
+        "embedding": [0.1] * 768,
+    }
+
+    result = FusedResults(fuse_results([video], [match]))[0]
+    assert set(result["video"]) == {"video_id", "script", "matching_segments", "video"}
+    assert len(result["video"]["script"]) == 201
+    assert result["video"]["video"] == {
+        "name": "A",
+        "url": "u",
+        "generated_description": "d",
+    }
+    assert result["matches"] == [
+        {
+            "video_id": "A",
+            "timepoint": 2,
+            "description": "scene",
+            "detected_items": ["dog"],
+        }
+    ]
+    # The caller's dicts are left alone
+    assert "embedding" in match and "analysis" in video
@@ -0,0 +1,23 @@
+from video_editor_mcp.response_budget import RESERVED_BYTES, budget_items
+
+
+def test_unbudgeted_formats_everything():
+    assert budget_items(["a", "b"], str.upper, None) == (["A", "B"], 0)
+
+
+def test_items_past_budget_are_not_formatted():
+    formatted_calls = []
+
+    def format_item(item):
+        formatted_calls.append(item)
+        return "x" * 99
+
+    formatted, omitted = budget_items(range(10), format_item, RESERVED_BYTES + 350)
+    assert (len(formatted), omitted) == (3, 7)
+    assert formatted_calls == [0, 1, 2, 3]
+
+
+def test_first_item_is_clipped_rather_than_dropped():
+    formatted, omitted = budget_items(["é" * 500], str, RESERVED_BYTES + 100)
+    assert omitted == 0
+    assert len(formatted[0].encode("utf-8")) <= 100 and formatted[0].endswith("…")
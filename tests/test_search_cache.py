@@ -0,0 +1,90 @@
+import asyncio
+
+from video_editor_mcp import server
+from video_editor_mcp.search_cache import QueryResultCache, search_cache_key
+
+MODEL = "jina-clip-v1:None"
+PARAMS = {
+    "query": "dog on a beach",
+    "limit": 10,
+    "include_segments": True,
+    "include_related": False,
+    "tags": ["beach", "dog"],
+    "duration_min": None,
+}
+
+
+def key(**changes) -> str:
+    return search_cache_key({**PARAMS, **changes}, MODEL)
+
+
+def test_key_ignores_argument_order():
+    reordered = dict(reversed(list(PARAMS.items())))
+    assert search_cache_key(reordered, MODEL) == key()
+    assert key(tags=["dog", "beach"]) == key()
+
+
+def test_key_treats_unset_and_none_alike():
+    without_unset = {k: v for k, v in PARAMS.items() if v is not None}
+    assert search_cache_key(without_unset, MODEL) == key()
+    assert key(created_after=None) == key()
+    assert key(duration_min=5) != key()
+    # Falsy values that aren't None are real filters
+    assert key(include_segments=False) != key()
+
+
+def test_key_normalizes_whitespace_but_not_case():
+    assert key(query="  dog   on a\tbeach ") == key()
+    # Semantic results depend on the exact text, so case is kept
+    assert key(query="Dog on a beach") != key()
+    assert key(tags=["Beach", "dog"]) != key()
+
+
+def test_key_depends_on_model_and_scope():
+    assert search_cache_key(PARAMS, "other-model:256") != key()
+    assert key(project_id="p1") != key()
+    assert key(project_id="p1") != key(project_id="p2")
+
+
+def test_invalidate_is_scoped_to_the_project():
+    cache = QueryResultCache()
+    cache.put("p1-search", "r1", project_id="p1")
+    cache.put("p2-search", "r2", project_id="p2")
+    cache.put("unscoped", "r3")
+
+    # Unscoped searches may include the project's content, so they go too
+    cache.invalidate("p1")
+    assert cache.get("p1-search") is None
+    assert cache.get("unscoped") is None
+    assert cache.get("p2-search") == "r2"
+
+    cache.put("p1-search", "r1", project_id="p1")
+    cache.invalidate()
+    assert (cache.get("p1-search"), cache.get("p2-search")) == (None, None)
+
+
+def test_equivalent_tool_calls_share_a_cached_search(monkeypatch):
+    keyword_calls = []
+
+    async def keyword_search(search_params):
+        keyword_calls.append(search_params)
+        return []
+
+    async def embedding_search(query, limit, embedding_wait):
+        return []
+
+    monkeypatch.setattr(server, "query_result_cache", QueryResultCache())
+    monkeypatch.setattr(server, "_keyword_search", keyword_search)
+    monkeypatch.setattr(server, "_embedding_search", embedding_search)
+
+    def search(arguments):
+        return asyncio.run(server.handle_call_tool("search-remote-videos", arguments))
+
+    search({"query": "dog on a beach"})
+    # Same search with explicit defaults, other argument order and spacing
+    search({"include_related": False, "limit": 10, "query": " dog  on a beach"})
+    assert len(keyword_calls) == 1
+    assert server.query_result_cache.stats()["hits"] == 1
+
+    search({"query": "dog on a beach", "limit": 20})
+    assert len(keyword_calls) == 2
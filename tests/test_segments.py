@@ -0,0 +1,121 @@
+import random
+
+import pytest
+
+from video_editor_mcp.segments import SegmentIndex, to_seconds
+
+
+def brute_overlapping(segments, start, end):
+    return sorted(name for s, e, name in segments if s <= end and e >= start)
+
+
+def test_overlapping_counts_touching_intervals():
+    index = SegmentIndex()
+    index.add("v1", 0, 5, "a")
+    index.add("v1", 5, 10, "b")
+    index.add("v1", 12, 15, "c")
+    assert index.overlapping("v1", 5, 5) == ["a", "b"]
+    assert index.overlapping("v1", 10, 12) == ["b", "c"]
+    assert index.overlapping("v1", 10.5, 11.5) == []
+    assert index.overlapping("v1", -3, 0) == ["a"]
+    assert index.overlapping("v2", 0, 100) == []
+
+
+def test_stabbing_finds_containing_segments():
+    index = SegmentIndex()
+    # A long segment ahead of short ones must still be found by the running max
+    index.add("v1", 0, 100, "long")
+    index.add("v1", 10, 20, "short")
+    index.add("v1", 30, 40, "later")
+    assert index.stabbing("v1", 35) == ["long", "later"]
+    assert index.stabbing("v1", "00:00:20") == ["long", "short"]
+    assert index.stabbing("v1", 100) == ["long"]
+    assert index.stabbing("v1", 100.5) == []
+
+
+def test_unsorted_inserts_and_adds_between_queries():
+    index = SegmentIndex()
+    for start, name in [(30, "d"), (0, "a"), (20, "c"), (10, "b")]:
+        index.add("v1", start, start + 5, name)
+    assert index.overlapping("v1", 0, 100) == ["a", "b", "c", "d"]
+    # Added after the arrays were built, and with start and end swapped
+    index.add("v1", 18, 12, "between")
+    assert len(index) == 5
+    assert index.overlapping("v1", 11, 13) == ["b", "between"]
+    assert index.coalesce("v1") == [
+        (0.0, 5.0),
+        (10.0, 18.0),
+        (20.0, 25.0),
+        (30.0, 35.0),
+    ]
+
+
+def test_unparseable_times_are_rejected():
+    index = SegmentIndex()
+    assert not index.add("v1", "soon", 5)
+    assert not index.add("v1", 0, None)
+    assert "v1" not in index
+    index.add("v1", "00:01:00", "00:01:30.5", "m")
+    assert index.overlapping("v1", 75, 80) == ["m"]
+    assert index.overlapping("v1", None, 80) == []
+
+
+def test_coalesce_with_gap():
+    index = SegmentIndex()
+    for start, end in [(10, 12), (0, 4), (3, 6), (6, 7), (16, 20), (16, 17)]:
+        index.add("v1", start, end)
+    # Overlapping and touching segments always merge
+    assert index.coalesce("v1") == [(0.0, 7.0), (10.0, 12.0), (16.0, 20.0)]
+    # A gap of exactly `gap` seconds is bridged, a larger one isn't
+    assert index.coalesce("v1", gap=3) == [(0.0, 12.0), (16.0, 20.0)]
+    assert index.coalesce("v1", gap=2.9) == [(0.0, 7.0), (10.0, 12.0), (16.0, 20.0)]
+    assert all(type(t) is float for span in index.coalesce("v1") for t in span)
+    assert index.coalesce("v2") == []
+
+
+def test_from_videos_indexes_matching_segments():
+    videos = [
+        {
+            "video_id": "v1",
+            "matching_segments": [
+                {"start_seconds": 5, "end_seconds": 8},
+                {"start_seconds": 1, "end_seconds": 2},
+            ],
+        },
+        {"video_id": "v2", "matching_segments": None},
+    ]
+    index = SegmentIndex.from_videos(videos)
+    assert index.stabbing("v1", 6) == [videos[0]["matching_segments"][0]]
+    assert len(index) == 2
+    assert "v2" not in index
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_overlapping_matches_brute_force(seed):
+    rng = random.Random(seed)
+    segments = []
+    index = SegmentIndex()
+    for n in range(200):
+        start = rng.randint(0, 500)
+        end = start + rng.choice([0, 1, 5, 30, 200])
+        segments.append((start, end, n))
+        index.add("v", start, end, n)
+        if n % 50 == 0:
+            # Interleave queries with inserts
+            assert sorted(index.overlapping("v", start, start)) == brute_overlapping(
+                segments, start, start
+            )
+    for _ in range(200):
+        start = rng.uniform(-10, 750)
+        end = start + rng.choice([0, 0.5, 10, 100])
+        assert sorted(index.overlapping("v", start, end)) == brute_overlapping(
+            segments, start, end
+        )
+
+
+def test_to_seconds():
+    assert to_seconds("01:02:03.5") == 3723.5
+    assert to_seconds("90") == 90.0
+    assert to_seconds(4) == 4.0
+    assert to_seconds("1:xx") is None
+    assert to_seconds(None) is None
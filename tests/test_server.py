@@ -0,0 +1,399 @@
+import asyncio
+import copy
+import re
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from video_editor_mcp import server
+from video_editor_mcp.resilience import CircuitOpenError
+from video_editor_mcp.search_benchmark import synthetic_fixtures
+from video_editor_mcp.search_cache import QueryResultCache
+
+
+def test_compact_asset_keeps_analysis_preview():
+    analysis = {"scenes": [{"timestamp": t, "description": "x"} for t in range(1000)]}
+    asset = {
+        "id": "a1",
+        "type": "video",
+        "name": "clip",
+        "create_parameters": {"analysis": analysis, "prompt": "unused"},
+        "internal": {"blob": "y" * 10000},
+    }
+
+    compact = server.compact_asset(asset)
+    preview = compact["create_parameters"]["analysis"]
+    assert "internal" not in compact
+    assert len(preview) == server._ANALYSIS_SUMMARY_CHARS and preview.endswith("...")
+    assert f" analysis: {preview}" in server.format_asset_info(compact)
+    # The API response is left as it was
+    assert asset["create_parameters"]["analysis"] is analysis
+
+
+@pytest.mark.parametrize(
+    "tool, arguments",
+    [
+        ("search-remote-videos", {"search_id": "gone", "query": "dog", "page": 2}),
+        ("find-similar-segments", {"search_id": "gone", "page": 2}),
+        ("search-remote-videos-batch", {"search_id": "gone", "queries": ["dog"]}),
+    ],
+)
+def test_unknown_search_id_is_reported(tool, arguments):
+    with pytest.raises(server.SearchExpiredError, match="expired or not found"):
+        asyncio.run(server.handle_call_tool(tool, arguments))
+
+
+def test_search_id_of_other_tool_is_not_found():
+    server._search_result_cache["batch-id"] = {"groups": []}
+    with pytest.raises(server.SearchExpiredError):
+        asyncio.run(
+            server.handle_call_tool("search-remote-videos", {"search_id": "batch-id"})
+        )
+
+
+def cut(video_id, start, end, level="0.5"):
+    return {
+        "video_id": video_id,
+        "video_start_time": start,
+        "video_end_time": end,
+        "type": "video-file",
+        "audio_levels": [{"audio_level": level, "start_time": start, "end_time": end}],
+    }
+
+
+def test_compact_edit_cuts_keeps_touching_cuts_by_default():
+    clips = [
+        cut("v", "00:00:01.000", "00:00:02.000"),
+        cut("v", "00:00:02.000", "00:00:03.000"),
+    ]
+    original = copy.deepcopy(clips)
+
+    compacted = server.compact_edit_cuts(clips)
+    assert compacted == original
+    assert all(new is not old for new, old in zip(compacted, clips))
+
+
+def test_compact_edit_cuts_merges_on_request_without_mutating():
+    clips = [
+        cut("v", "00:00:01.000", "00:00:02.000"),
+        cut("v", "00:00:02.000", "00:00:03.000"),
+        cut("v", "00:00:03.000", "00:00:04.000", level="1.0"),
+    ]
+    original = copy.deepcopy(clips)
+
+    compacted = server.compact_edit_cuts(clips, merge=True)
+    assert [(c["video_start_time"], c["video_end_time"]) for c in compacted] == [
+        ("00:00:01.000", "00:00:03.000"),
+        ("00:00:03.000", "00:00:04.000"),
+    ]
+    assert compacted[0]["audio_levels"][0]["end_time"] == "00:00:03.000"
+    assert clips == original
+
+
+def http_error(status: int, text: str) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status
+    response._content = text.encode()
+    return requests.HTTPError(response=response)
+
+
+def semantic_lookup(monkeypatch, post_embeddings):
+    monkeypatch.setattr(server.model_loader, "payload", lambda embedding, kind: {})
+    monkeypatch.setattr(server.model_loader, "post_embeddings", post_embeddings)
+    return asyncio.run(server._semantic_lookup([0.1, 0.2], 5))
+
+
+def test_semantic_lookup_reports_error_status(monkeypatch):
+    def post_embeddings(*args, **kwargs):
+        raise http_error(500, "upstream broke")
+
+    with pytest.raises(RuntimeError, match="HTTP 500: upstream broke"):
+        semantic_lookup(monkeypatch, post_embeddings)
+
+
+def test_semantic_lookup_open_breaker_is_noted(monkeypatch):
+    def post_embeddings(*args, **kwargs):
+        raise CircuitOpenError("vj.test is failing")
+
+    with pytest.raises(CircuitOpenError) as raised:
+        semantic_lookup(monkeypatch, post_embeddings)
+    results, videos, notes = server._resolve_search_outcomes(raised.value, [])
+    assert results == [] and "temporarily unavailable" in notes[0]
+
+
+def test_semantic_lookup_returns_results(monkeypatch):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b'[{"video_id": "v1"}]'
+
+    assert semantic_lookup(monkeypatch, lambda *a, **k: response) == [
+        {"video_id": "v1"}
+    ]
+
+
+def test_asset_pages_are_formatted_alike(monkeypatch):
+    analysis = {"scenes": [{"timestamp": t, "description": "x"} for t in range(500)]}
+    assets = [
+        {
+            "id": f"asset-{i}",
+            "asset_type": "video",
+            "type": "video",
+            "keyname": f"clip-{i}.mp4",
+            "status": "ready",
+            "create_parameters": {"analysis": analysis},
+        }
+        for i in range(4)
+    ]
+    project = SimpleNamespace(
+        name="Trip", description="", model_dump=lambda: {"assets": assets}
+    )
+
+    async def get_project(project_id):
+        return project
+
+    monkeypatch.setattr(server.project_cache, "get", get_project)
+
+    def page(**arguments):
+        result = asyncio.run(
+            server.handle_call_tool(
+                "get-project-assets",
+                {"project_id": "p1", "items_per_page": 2, **arguments},
+            )
+        )
+        return result[0].text
+
+    first = page()
+    cache_id = re.search(r"asset_cache_id='([^']+)'", first).group(1)
+    second = page(asset_cache_id=cache_id, page=2)
+
+    def asset_lines(text):
+        body = text.split("):\n", 1)[1].split("\nNavigation", 1)[0]
+        return [re.sub(r"\d", "N", line) for line in body.splitlines() if line]
+
+    assert asset_lines(first) == asset_lines(second)
+    assert abs(len(first.encode()) - len(second.encode())) < 300
+    assert len(first.encode()) < 2000
+
+
+def match(video_id, timepoint, score):
+    return {
+        "video_id": video_id,
+        "timepoint": timepoint,
+        "score": score,
+        "description": f"scene at {timepoint}",
+        "detected_items": [],
+    }
+
+
+def test_find_similar_segments_pages_without_redispatching(monkeypatch):
+    async def reference_embedding(video_id, time, embedding_wait):
+        return [0.1, 0.2], "indexed segment at 10"
+
+    neighbours = [
+        # The reference segment itself, which is left out
+        match("v1", 10.5, 0.99),
+        match("v2", 3.0, 0.9),
+        match("v1", 60.0, 0.8),
+        match("v3", 7.0, 0.7),
+    ]
+
+    async def semantic_lookup(embedding, limit):
+        return neighbours
+
+    monkeypatch.setattr(server, "_reference_embedding", reference_embedding)
+    monkeypatch.setattr(server, "_semantic_lookup", semantic_lookup)
+
+    def find(arguments):
+        result = asyncio.run(
+            server.handle_call_tool("find-similar-segments", arguments)
+        )
+        return result[0].text
+
+    first = find({"video_id": "v1", "timestamp": "00:00:10", "items_per_page": 2})
+    assert "similar to v1 at 10s" in first
+    assert "Reference: indexed segment at 10" in first
+    assert "showing items 1-2 of 3" in first
+    search_id = re.search(r"search_id='([^']+)'", first).group(1)
+
+    # Pagination is served from the cached results, not by calling the
+    # search-remote-videos tool again
+    dispatched = []
+    handle_call_tool = server.handle_call_tool
+
+    async def recording_call_tool(name, arguments):
+        dispatched.append(name)
+        return await handle_call_tool(name, arguments)
+
+    monkeypatch.setattr(server, "handle_call_tool", recording_call_tool)
+    second = asyncio.run(
+        server.handle_call_tool(
+            "find-similar-segments",
+            {"search_id": search_id, "page": 2, "items_per_page": 2},
+        )
+    )[0].text
+    assert dispatched == ["find-similar-segments"]
+    assert "Page 2/2, showing items 3-3 of 3" in second
+    assert "Reference: indexed segment at 10" in second
+    assert "End of results." in second
+
+    other_videos = find(
+        {"video_id": "v1", "timestamp": 10, "include_same_video": False}
+    )
+    assert "of 2)" in other_videos
+
+
+@pytest.mark.parametrize("photos", ["", "1"])
+def test_find_similar_segments_is_listed_once(monkeypatch, photos):
+    monkeypatch.setenv("LOAD_PHOTOS_DB", photos)
+    names = [tool.name for tool in asyncio.run(server.handle_list_tools())]
+    assert names.count("find-similar-segments") == 1
+
+
+class ProjectsApi:
+    """Stand-in for vj.projects; each list() call waits for its own release"""
+
+    def __init__(self, *names):
+        self.names = list(names)
+        self.calls = 0
+        self.started = threading.Semaphore(0)
+        self.released = threading.Semaphore(0)
+
+    def list(self):
+        self.calls += 1
+        names = list(self.names)
+        self.started.release()
+        assert self.released.acquire(timeout=5)
+        return [SimpleNamespace(id=name) for name in names]
+
+    def serve(self, cache: "server.ProjectListCache"):
+        """Let the in-flight list() return, and wait for the cache to take it"""
+        fetched_at = cache._fetched_at
+        self.released.release()
+        deadline = time.monotonic() + 5
+        while cache._fetched_at == fetched_at:
+            assert time.monotonic() < deadline, "refresh never landed"
+            time.sleep(0.001)
+
+
+def project_list(api: ProjectsApi, ttl: float = 60.0) -> server.ProjectListCache:
+    return server.ProjectListCache(SimpleNamespace(projects=api), ttl=ttl)
+
+
+def ids(projects) -> list:
+    return [p.id for p in projects]
+
+
+def test_project_list_serves_stale_while_refreshing():
+    api = ProjectsApi("p1")
+    cache = project_list(api)
+    # Nothing fetched yet: answered at once, with the fetch in the background
+    assert cache.get() == []
+    assert api.started.acquire(timeout=5)
+    api.serve(cache)
+    assert ids(cache.get()) == ["p1"]
+
+    # Past the TTL the old list is still served while the new one loads, and
+    # reads meanwhile don't queue more fetches
+    cache._fetched_at -= 2 * cache.ttl
+    api.names.append("p2")
+    assert ids(cache.get()) == ["p1"]
+    assert api.started.acquire(timeout=5)
+    assert ids(cache.get()) == ["p1"]
+    api.serve(cache)
+    assert ids(cache.get()) == ["p1", "p2"]
+    assert not api.started.acquire(timeout=0.05)
+    assert api.calls == 2
+
+
+def test_project_list_runs_one_refresh_at_a_time():
+    api = ProjectsApi("p1")
+    cache = project_list(api)
+    cache.refresh()
+    assert api.started.acquire(timeout=5)
+    threads = [threading.Thread(target=cache.refresh) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert api.calls == 1
+    api.serve(cache)
+    # The refreshes requested meanwhile collapse into one rerun
+    assert api.started.acquire(timeout=5)
+    api.serve(cache)
+    assert not api.started.acquire(timeout=0.05)
+    assert api.calls == 2
+    # Fresh within the TTL, so reads don't refetch
+    assert ids(cache.get()) == ["p1"]
+    assert api.calls == 2
+
+
+def test_project_list_keeps_a_created_project_visible():
+    api = ProjectsApi("p1")
+    cache = project_list(api)
+    cache.refresh()
+    assert api.started.acquire(timeout=5)
+    # A list fetched before the create doesn't have the new project yet
+    api.names.append("new")
+    cache.add(SimpleNamespace(id="new"))
+    assert ids(cache.get()) == ["new"]
+    api.serve(cache)
+    assert ids(cache.get()) == ["p1", "new"]
+
+    # The rerun queued by add() sees it, and is trusted from then on
+    assert api.started.acquire(timeout=5)
+    api.serve(cache)
+    assert ids(cache.get()) == ["p1", "new"]
+    assert cache._added == {}
+
+    # Adding a project that is already listed doesn't duplicate it
+    cache.add(SimpleNamespace(id="p1"))
+    assert ids(cache.get()) == ["p1", "new"]
+    assert api.started.acquire(timeout=5)
+    api.serve(cache)
+    assert ids(cache.get()) == ["p1", "new"]
+
+
+@pytest.mark.parametrize("slow_leg", ["embedding", "keyword"])
+def test_slow_search_leg_times_out_alone(monkeypatch, slow_leg):
+    fixture = synthetic_fixtures(1, limit=5)[0]
+
+    async def legs(leg, results):
+        if leg == slow_leg:
+            await asyncio.sleep(30)
+        return results
+
+    async def embedding_lookup(query, limit):
+        return await legs("embedding", fixture["embedding_results"])
+
+    async def keyword_search(search_params):
+        return await legs("keyword", fixture["keyword_results"])
+
+    async def model_ready(embedding_wait):
+        pass
+
+    monkeypatch.setattr(server, "EMBEDDING_SEARCH_DEADLINE", 0.05)
+    monkeypatch.setattr(server, "KEYWORD_SEARCH_DEADLINE", 0.05)
+    monkeypatch.setattr(server, "_wait_for_model", model_ready)
+    monkeypatch.setattr(server, "_embedding_lookup", embedding_lookup)
+    monkeypatch.setattr(server, "_keyword_search", keyword_search)
+    monkeypatch.setattr(server, "query_result_cache", QueryResultCache())
+
+    started = time.monotonic()
+    text = asyncio.run(
+        server.handle_call_tool("search-remote-videos", {"query": fixture["query"]})
+    )[0].text
+    assert time.monotonic() - started < 5
+
+    if slow_leg == "embedding":
+        assert "Semantic search did not finish within 0.05s" in text
+        assert fixture["keyword_results"][0]["video"]["name"] in text
+        assert "Scene matching" not in text
+    else:
+        assert "Text-based search did not finish within 0.05s" in text
+        assert "Scene matching" in text
+    assert "showing items 1-5 of" in text
+    # A partial result isn't reused for the next identical search
+    assert server.query_result_cache.stats()["entries"] == 0
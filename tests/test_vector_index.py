@@ -0,0 +1,108 @@
+import os
+
+import numpy as np
+import pytest
+
+from video_editor_mcp.vector_index import SegmentVectorIndex
+
+DIM = 16
+
+
+def _records(video_id, vectors, start=0):
+    return [
+        {"video_id": video_id, "timepoint": str(start + i), "embedding": vector}
+        for i, vector in enumerate(vectors)
+    ]
+
+
+def _clustered(n, n_clusters=8, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((n_clusters, DIM))
+    points = centers[rng.integers(n_clusters, size=n)] + 0.3 * rng.standard_normal(
+        (n, DIM)
+    )
+    return points.astype(np.float32)
+
+
+def test_interrupted_write_is_dropped_on_reopen(tmp_path):
+    index = SegmentVectorIndex(str(tmp_path))
+    a = np.ones(DIM, dtype=np.float32)
+    index.add(_records("a", [a, a, a]))
+
+    # A write that got as far as the data files but not state.json
+    with open(tmp_path / "vectors.bin", "ab") as f:
+        f.write(np.zeros((2, DIM), dtype=index.dtype).tobytes())
+    with open(tmp_path / "meta.jsonl", "a") as f:
+        f.write('{"video_id": "orphan"}\n{"video_id": "orphan"}\n')
+
+    b = np.zeros(DIM, dtype=np.float32)
+    b[0] = 1
+    SegmentVectorIndex(str(tmp_path)).add(_records("b", [b]))
+
+    reopened = SegmentVectorIndex(str(tmp_path))
+    assert [r["video_id"] for r in reopened._meta] == ["a", "a", "a", "b"]
+    assert reopened.search(b, k=1)[0]["video_id"] == "b"
+    assert os.path.getsize(tmp_path / "vectors.bin") == 4 * DIM * index.dtype.itemsize
+
+
+def test_orphans_without_state_are_dropped(tmp_path):
+    (tmp_path / "vectors.bin").write_bytes(b"\0" * 64)
+    (tmp_path / "meta.jsonl").write_text('{"video_id": "orphan"}\n')
+    index = SegmentVectorIndex(str(tmp_path))
+    index.add(_records("a", [np.ones(DIM)]))
+    assert [r["video_id"] for r in SegmentVectorIndex(str(tmp_path))._meta] == ["a"]
+
+
+def test_adds_after_training_append_assignments(tmp_path):
+    vectors = _clustered(600)
+    index = SegmentVectorIndex(str(tmp_path), min_train_size=256, nprobe=3)
+    index.add(_records("v", vectors[:300]))
+    generation = index._ivf_generation
+    assert generation == 1
+
+    for start in range(300, 500, 20):
+        index.add(_records("v", vectors[start : start + 20], start))
+    # No retrain, and ivf.npz wasn't rewritten for the small adds
+    assert index._ivf_generation == generation
+    assert len(index._assignments) == 500
+
+    queries = _clustered(20, seed=1)
+    before = [[r["timepoint"] for r in index.search(q, k=5)] for q in queries]
+    reopened = SegmentVectorIndex(str(tmp_path), min_train_size=256, nprobe=3)
+    assert np.array_equal(reopened._assignments, index._assignments)
+    after = [[r["timepoint"] for r in reopened.search(q, k=5)] for q in queries]
+    assert before == after
+
+
+def test_ivf_recall_against_exact(tmp_path):
+    vectors = _clustered(2000)
+    index = SegmentVectorIndex(str(tmp_path), min_train_size=1000, nprobe=8)
+    index.add(_records("v", vectors[:1200]))
+    index.add(_records("v", vectors[1200:1500], 1200))
+
+    hits = total = 0
+    for query in _clustered(50, seed=2):
+        exact = {r["timepoint"] for r in index.search(query, k=10, exact=True)}
+        approx = {r["timepoint"] for r in index.search(query, k=10)}
+        hits += len(exact & approx)
+        total += len(exact)
+    assert hits / total >= 0.9
+
+
+def test_readd_supersedes_and_nearest(tmp_path):
+    index = SegmentVectorIndex(str(tmp_path))
+    first, second = np.eye(DIM, dtype=np.float32)[:2]
+    index.add(_records("v", [first]))
+    index.add(_records("v", [second]))
+    assert len(index) == 1
+    meta, vector = index.nearest("v", "00:00:01")
+    assert meta["timepoint"] == "0"
+    assert np.allclose(vector, second, atol=1e-3)
+    assert index.nearest("v", 30, max_distance=5) is None
+
+
+def test_dim_mismatch_rejected(tmp_path):
+    index = SegmentVectorIndex(str(tmp_path))
+    index.add(_records("v", [np.ones(DIM)]))
+    with pytest.raises(ValueError):
+        index.search(np.ones(DIM + 1))